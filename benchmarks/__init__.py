@@ -0,0 +1,8 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+"""
+    Benchmarks of the methods and the Intuitionistic Fuzzy Sets functions.
+    Run with `python -m benchmarks`, see `python -m benchmarks --help` for the options.
+"""
+
+from .suite import cases, measure, run
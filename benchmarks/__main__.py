@@ -0,0 +1,46 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import argparse
+import json
+import platform
+import sys
+import numpy as np
+from pyifdm.backend import get_backend
+from pyifdm.precision import get_dtype
+from .suite import run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmarks of the pyifdm methods and functions')
+    parser.add_argument('-m', '--sizes', type=int, nargs='+', default=[10, 100, 1000], help='numbers of alternatives')
+    parser.add_argument('-n', '--criteria', type=int, nargs='+', default=[5, 20], help='numbers of criteria')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='number of timed calls')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='seed of the random generator')
+    parser.add_argument('-k', '--select', default=None, help='run only cases with group or name containing given text')
+    parser.add_argument('-o', '--output', default=None, help='path of the JSON file with results')
+    parser.add_argument('-q', '--quiet', action='store_true', help='do not print the results')
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.criteria, args.repeat, args.seed, args.select, verbose=not args.quiet)
+
+    report = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'backend': get_backend(),
+        'dtype': np.dtype(get_dtype()).name,
+        'repeat': args.repeat,
+        'seed': args.seed,
+        'results': results
+    }
+
+    if args.output is None:
+        if args.quiet:
+            json.dump(report, sys.stdout, indent=2)
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
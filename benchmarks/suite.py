@@ -0,0 +1,138 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import time
+import tracemalloc
+from pyifdm import methods
+from pyifdm.bench.problems import METHODS, random_problem
+from pyifdm.methods.ifs import distance, normalization, score, similarity
+
+__all__ = [
+    'cases',
+    'measure',
+    'run'
+]
+
+
+def cases(m, n, seed=0):
+    """
+        Creates benchmark cases for the problem of given size
+
+        Parameters
+        ----------
+            m : int
+                Number of alternatives
+
+            n : int
+                Number of criteria
+
+            seed : int, default=0
+                Seed of the random generator
+
+        Returns
+        -------
+            list
+                Tuples with group, name, function and its arguments
+    """
+    matrix, weights, types = random_problem(m, n, seed)
+    other, _, _ = random_problem(m, n, seed + 1)
+
+    result = []
+    for name in METHODS:
+        result.append(('methods', name, getattr(methods, name)(), (matrix, weights, types)))
+    for name in score.__all__:
+        result.append(('score', name, getattr(score, name), (matrix, )))
+    result.append(('score', 'score_all', score.score_all, (matrix, )))
+    for name in distance.__all__:
+        result.append(('distance', name, getattr(distance, name), (matrix, other)))
+    for name in normalization.__all__:
+        result.append(('normalization', name, getattr(normalization, name), (matrix, types)))
+    for name in similarity.__all__:
+        result.append(('similarity', name, getattr(similarity, name), (matrix, other)))
+    return result
+
+
+def measure(func, args, repeat=5):
+    """
+        Measures time and peak memory allocated by the function call
+
+        Parameters
+        ----------
+            func : callable
+                Benchmarked function
+
+            args : tuple
+                Arguments of the function
+
+            repeat : int, default=5
+                Number of timed calls
+
+        Returns
+        -------
+            dict
+                Best and mean time of the call in seconds and peak allocated memory in bytes
+    """
+    # warm up call, e.g. to fill the method workspace
+    func(*args)
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+
+    # memory is traced in the separate call, tracing slows down the calculations
+    tracemalloc.start()
+    try:
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'time': min(times),
+        'mean_time': sum(times) / len(times),
+        'peak_memory': peak
+    }
+
+
+def run(sizes=(10, 100, 1000), criteria=(5, 20), repeat=5, seed=0, select=None, verbose=False):
+    """
+        Runs benchmarks for each combination of the problem sizes
+
+        Parameters
+        ----------
+            sizes : iterable, default=(10, 100, 1000)
+                Numbers of alternatives
+
+            criteria : iterable, default=(5, 20)
+                Numbers of criteria
+
+            repeat : int, default=5
+                Number of timed calls of each function
+
+            seed : int, default=0
+                Seed of the random generator
+
+            select : str, default=None
+                Only cases with group or name containing given text are run
+
+            verbose : bool, default=False
+                Print each result when it is measured
+
+        Returns
+        -------
+            list
+                Results with group, name, size of the problem, times and peak memory
+    """
+    results = []
+    for n in criteria:
+        for m in sizes:
+            for group, name, func, args in cases(m, n, seed):
+                if select is not None and select not in group and select not in name:
+                    continue
+                result = {'group': group, 'name': name, 'm': m, 'n': n}
+                result.update(measure(func, args, repeat))
+                results.append(result)
+                if verbose:
+                    print(f"{group:14} {name:32} m={m:<7} n={n:<4} {result['time'] * 1e3:10.3f} ms {result['peak_memory'] / 1024:12.1f} KiB")
+    return results
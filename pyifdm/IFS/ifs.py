@@ -1,5 +1,6 @@
 # Copyright (c) 2023 Jakub Więckowski
 
+import warnings
 import numpy as np
 
 class IFS:
@@ -16,7 +17,7 @@ class IFS:
     - __and__(self, other): Intersection operator for IFS.
     - __or__(self, other): Union operator for IFS.
     - __invert__(self): Complement operator for IFS.
-    - owa_aggregation(self, weights): Ordered Weighted Averaging (OWA) aggregation operator for IFS.
+    - owa_aggregation(self, weights): Ordered Weighted Averaging (OWA) aggregation operator for IFS, deprecated in favour of pyifdm.aggregation.ifowa.
 
     Example:
     ```
@@ -261,6 +262,9 @@ class IFS:
         """
         Compute the Ordered Weighted Averaging (OWA) aggregation of the IFS.
 
+        Deprecated: the method calculates the weighted sum of the degrees of a single IFS.
+        Use pyifdm.aggregation.ifowa to aggregate arrays of IFS.
+
         Parameters:
         - weights (list): A list of weights for each component (non-membership, uncertainty, membership).
 
@@ -269,6 +273,7 @@ class IFS:
         
         """
 
+        warnings.warn('IFS.owa_aggregation is deprecated, use pyifdm.aggregation.ifowa to aggregate IFS', DeprecationWarning, stacklevel=2)
         values = [self.non_membership, self.uncertainty, self.membership]
         return np.sum(np.multiply(weights, values))
 
@@ -3,4 +3,14 @@ from . import correlations
 from . import helpers
 from . import weights
 from . import IFS
-from . import graphs
\ No newline at end of file
+from . import graphs
+from . import encoding
+from . import precision
+from . import workspace
+from . import backend
+from . import profiling
+from .profiling import profile
+from . import metrics
+from . import neighbors
+from . import clustering
+from . import aggregation
@@ -0,0 +1,280 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+from .methods.ifs.score import chen_score_1
+from .precision import as_float
+
+__all__ = [
+    'ifha',
+    'ifowa',
+    'ifwa',
+    'ifwg',
+    'multiply',
+    'power',
+    'product'
+]
+
+
+def _axis(a, axis):
+    axis = axis % a.ndim
+    if axis == a.ndim - 1:
+        raise ValueError('IFS cannot be aggregated over the last axis with (u, v) degrees')
+    return axis
+
+
+def _weights(weights, a, axis):
+    """
+        Returns exponents of membership and non-membership degrees shaped to broadcast over the aggregated axis.
+        Crisp weights are used for both degrees, IFS weights give separate exponents for (u, v)
+    """
+    count = a.shape[axis]
+    if weights is None:
+        weights = np.full(count, 1 / count)
+    weights = as_float(weights)
+    if weights.ndim == 1:
+        weights = np.repeat(weights, 2).reshape((len(weights), 2))
+    if weights.shape[0] != count:
+        raise ValueError(f'Number of weights {weights.shape[0]} does not match the size {count} of the aggregated axis')
+    shape = (count, ) + (1, ) * (a.ndim - 2 - axis)
+    return weights[:, 0].reshape(shape), weights[:, 1].reshape(shape)
+
+
+def _ifs(u, v, components, out=None):
+    """
+        Stacks the degrees to the array of IFS, hesitancy is added for the arrays of 3 components
+    """
+    if out is None:
+        out = np.empty(u.shape + (components, ), dtype=u.dtype)
+    components = out.shape[-1]
+    out[..., 0] = u
+    out[..., 1] = v
+    if components > 2:
+        out[..., 2] = 1 - u - v
+    return out
+
+
+def multiply(a, weights, axis=-2, out=None):
+    """
+        Multiplies Intuitionistic Fuzzy Sets by the weights, l * (u, v) = (1 - (1 - u)^l, v^l), which is the weighting of the IFWA operator
+
+        Parameters
+        ----------
+            a : ndarray
+                Array with Intuitionistic Fuzzy Sets (u, v) in the last axis
+
+            weights : ndarray
+                Vector of weights in a crisp or Intuitionistic Fuzzy form, for the elements along the axis
+
+            axis : int, default=-2
+                Axis of the elements corresponding to the weights, e.g. criteria of the decision matrix
+
+            out : ndarray, default=None
+                Array to store the weighted IFS
+
+        Returns
+        -------
+            ndarray
+                Array with weighted Intuitionistic Fuzzy Sets
+    """
+    a = as_float(a)
+    wu, wv = _weights(weights, a, _axis(a, axis))
+    return _ifs(1 - (1 - a[..., 0]) ** wu, a[..., 1] ** wv, a.shape[-1], out)
+
+
+def power(a, weights, axis=-2, out=None):
+    """
+        Raises Intuitionistic Fuzzy Sets to the power of the weights, (u, v)^l = (u^l, 1 - (1 - v)^l), which is the weighting of the IFWG operator
+
+        Parameters
+        ----------
+            a : ndarray
+                Array with Intuitionistic Fuzzy Sets (u, v) in the last axis
+
+            weights : ndarray
+                Vector of weights in a crisp or Intuitionistic Fuzzy form, for the elements along the axis
+
+            axis : int, default=-2
+                Axis of the elements corresponding to the weights, e.g. criteria of the decision matrix
+
+            out : ndarray, default=None
+                Array to store the weighted IFS
+
+        Returns
+        -------
+            ndarray
+                Array with weighted Intuitionistic Fuzzy Sets
+    """
+    a = as_float(a)
+    wu, wv = _weights(weights, a, _axis(a, axis))
+    return _ifs(a[..., 0] ** wu, 1 - (1 - a[..., 1]) ** wv, a.shape[-1], out)
+
+
+def product(a, weights, axis=-2, out=None):
+    """
+        Multiplies Intuitionistic Fuzzy Sets by the weights with the algebraic product, (u, v) * (wu, wv) = (u * wu, v + wv - v * wv),
+        crisp weights w are used as (w, w). It is the weighting of the TOPSIS and MOORA methods
+
+        Parameters
+        ----------
+            a : ndarray
+                Array with Intuitionistic Fuzzy Sets (u, v) in the last axis
+
+            weights : ndarray
+                Vector of weights in a crisp or Intuitionistic Fuzzy form, for the elements along the axis
+
+            axis : int, default=-2
+                Axis of the elements corresponding to the weights, e.g. criteria of the decision matrix
+
+            out : ndarray, default=None
+                Array to store the weighted IFS
+
+        Returns
+        -------
+            ndarray
+                Array with weighted Intuitionistic Fuzzy Sets
+    """
+    a = as_float(a)
+    wu, wv = _weights(weights, a, _axis(a, axis))
+    return _ifs(a[..., 0] * wu, a[..., 1] + wv - a[..., 1] * wv, a.shape[-1], out)
+
+
+def ifwa(a, weights=None, axis=-2, out=None):
+    """
+        Aggregates Intuitionistic Fuzzy Sets along the axis with the Intuitionistic Fuzzy Weighted Averaging operator,
+        (1 - prod (1 - u)^w, prod v^w). Weights are used as given, they should sum up to 1.
+
+        Parameters
+        ----------
+            a : ndarray
+                Array with Intuitionistic Fuzzy Sets (u, v) in the last axis, e.g. decision matrix or the batch of matrices
+
+            weights : ndarray, default=None
+                Vector of weights in a crisp or Intuitionistic Fuzzy form, equal weights if not given
+
+            axis : int, default=-2
+                Aggregated axis, e.g. criteria of the decision matrix
+
+            out : ndarray, default=None
+                Array to store the aggregated IFS
+
+        Returns
+        -------
+            ndarray
+                Array with aggregated Intuitionistic Fuzzy Sets, without the aggregated axis
+    """
+    a = as_float(a)
+    axis = _axis(a, axis)
+    wu, wv = _weights(weights, a, axis)
+    u = 1 - np.prod((1 - a[..., 0]) ** wu, axis=axis)
+    v = np.prod(a[..., 1] ** wv, axis=axis)
+    return _ifs(u, v, a.shape[-1], out)
+
+
+def ifwg(a, weights=None, axis=-2, out=None):
+    """
+        Aggregates Intuitionistic Fuzzy Sets along the axis with the Intuitionistic Fuzzy Weighted Geometric operator,
+        (prod u^w, 1 - prod (1 - v)^w). Weights are used as given, they should sum up to 1.
+
+        Parameters
+        ----------
+            a : ndarray
+                Array with Intuitionistic Fuzzy Sets (u, v) in the last axis, e.g. decision matrix or the batch of matrices
+
+            weights : ndarray, default=None
+                Vector of weights in a crisp or Intuitionistic Fuzzy form, equal weights if not given
+
+            axis : int, default=-2
+                Aggregated axis, e.g. criteria of the decision matrix
+
+            out : ndarray, default=None
+                Array to store the aggregated IFS
+
+        Returns
+        -------
+            ndarray
+                Array with aggregated Intuitionistic Fuzzy Sets, without the aggregated axis
+    """
+    a = as_float(a)
+    axis = _axis(a, axis)
+    wu, wv = _weights(weights, a, axis)
+    u = np.prod(a[..., 0] ** wu, axis=axis)
+    v = 1 - np.prod((1 - a[..., 1]) ** wv, axis=axis)
+    return _ifs(u, v, a.shape[-1], out)
+
+
+def _ordered(a, axis, score):
+    """
+        Sorts Intuitionistic Fuzzy Sets along the axis in descending order of the score, equal scores are ordered by the accuracy u + v
+    """
+    order = np.lexsort((-(a[..., 0] + a[..., 1]), -score(a)), axis=axis)
+    return np.take_along_axis(a, order[..., np.newaxis], axis=axis)
+
+
+def ifowa(a, weights=None, axis=-2, score=chen_score_1, out=None):
+    """
+        Aggregates Intuitionistic Fuzzy Sets along the axis with the Intuitionistic Fuzzy Ordered Weighted Averaging operator.
+        Weights are assigned to the positions of IFS sorted in descending order of the score.
+
+        Parameters
+        ----------
+            a : ndarray
+                Array with Intuitionistic Fuzzy Sets (u, v) in the last axis, e.g. decision matrix or the batch of matrices
+
+            weights : ndarray, default=None
+                Vector of position weights in a crisp or Intuitionistic Fuzzy form, equal weights if not given
+
+            axis : int, default=-2
+                Aggregated axis, e.g. criteria of the decision matrix
+
+            score : callable, default=chen_score_1
+                Function used to order the IFS
+
+            out : ndarray, default=None
+                Array to store the aggregated IFS
+
+        Returns
+        -------
+            ndarray
+                Array with aggregated Intuitionistic Fuzzy Sets, without the aggregated axis
+    """
+    a = as_float(a)
+    axis = _axis(a, axis)
+    return ifwa(_ordered(a, axis, score), weights, axis, out)
+
+
+def ifha(a, weights=None, position_weights=None, axis=-2, score=chen_score_1, out=None):
+    """
+        Aggregates Intuitionistic Fuzzy Sets along the axis with the Intuitionistic Fuzzy Hybrid Averaging operator.
+        IFS are multiplied by n * w, where n is the number of aggregated IFS, then aggregated with the IFOWA operator.
+
+        Parameters
+        ----------
+            a : ndarray
+                Array with Intuitionistic Fuzzy Sets (u, v) in the last axis, e.g. decision matrix or the batch of matrices
+
+            weights : ndarray, default=None
+                Vector of weights of the IFS in a crisp or Intuitionistic Fuzzy form, equal weights if not given
+
+            position_weights : ndarray, default=None
+                Vector of position weights in a crisp form, equal weights if not given
+
+            axis : int, default=-2
+                Aggregated axis, e.g. criteria of the decision matrix
+
+            score : callable, default=chen_score_1
+                Function used to order the IFS
+
+            out : ndarray, default=None
+                Array to store the aggregated IFS
+
+        Returns
+        -------
+            ndarray
+                Array with aggregated Intuitionistic Fuzzy Sets, without the aggregated axis
+    """
+    a = as_float(a)
+    axis = _axis(a, axis)
+    if weights is None:
+        weights = np.full(a.shape[axis], 1 / a.shape[axis])
+    weighted = multiply(a, a.shape[axis] * as_float(weights), axis)
+    return ifowa(weighted, position_weights, axis, score, out)
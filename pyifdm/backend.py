@@ -0,0 +1,49 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import os
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+__all__ = [
+    'get_backend',
+    'jit'
+]
+
+# compiled kernels are used if Numba is installed, unless NumPy backend is forced with PYIFDM_BACKEND=numpy
+_backend = 'numba' if numba is not None and os.environ.get('PYIFDM_BACKEND', '').lower() != 'numpy' else 'numpy'
+
+
+def get_backend():
+    """
+        Returns name of the backend used for the loop-heavy kernels of the methods
+
+        Returns
+        -------
+            str
+                'numba' if the kernels are compiled, 'numpy' otherwise
+    """
+    return _backend
+
+
+def jit(func):
+    """
+        Compiles the function with Numba in the nopython mode if the numba backend is active.
+        Compiled functions are cached on disk, so they are not compiled again in the new processes.
+        With the numpy backend the function is returned unchanged.
+
+        Parameters
+        ----------
+            func : callable
+                Function with the loops over the arrays
+
+        Returns
+        -------
+            callable
+                Compiled or unchanged function
+    """
+    if _backend == 'numba':
+        return numba.njit(cache=True)(func)
+    return func
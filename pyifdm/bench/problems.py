@@ -0,0 +1,55 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+
+__all__ = [
+    'METHODS',
+    'random_problem'
+]
+
+# names of the method classes from pyifdm.methods
+METHODS = [
+    'ifARAS',
+    'ifCODAS',
+    'ifCOPRAS',
+    'ifEDAS',
+    'ifMABAC',
+    'ifMAIRCA',
+    'ifMARCOS',
+    'ifMOORA',
+    'ifOCRA',
+    'ifTOPSIS',
+    'ifVIKOR',
+    'ifWASPAS',
+    'ifWPM',
+    'ifWSM'
+]
+
+
+def random_problem(m, n, seed=0):
+    """
+        Generates random decision problem with fixed seed
+
+        Parameters
+        ----------
+            m : int
+                Number of alternatives
+
+            n : int
+                Number of criteria
+
+            seed : int, default=0
+                Seed of the random generator
+
+        Returns
+        -------
+            tuple
+                Matrix with Intuitionistic Fuzzy Sets (u, v, p), crisp weights and types of criteria
+    """
+    rng = np.random.default_rng(seed)
+    u = rng.random((m, n))
+    v = rng.random((m, n)) * (1 - u)
+    matrix = np.dstack((u, v, 1 - u - v))
+    weights = np.ones(n) / n
+    types = np.where(np.arange(n) % 2 == 0, 1, -1)
+    return matrix, weights, types
@@ -0,0 +1,161 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import argparse
+import json
+import sys
+import time
+import numpy as np
+from .. import methods
+from .problems import METHODS, random_problem
+
+__all__ = [
+    'check_budget',
+    'fit_exponent',
+    'scaling_report'
+]
+
+
+def _best_time(func, args, repeat):
+    """
+        Returns the shortest time of the repeated function calls
+    """
+    # warm up call, e.g. to fill the method workspace
+    func(*args)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def fit_exponent(sizes, times):
+    """
+        Fits the growth exponent k of the time t ~ c * size^k as the slope of the line in the log-log scale
+
+        Parameters
+        ----------
+            sizes : ndarray
+                Sizes of the problem
+
+            times : ndarray
+                Times measured for the sizes
+
+        Returns
+        -------
+            float
+                Growth exponent
+    """
+    return float(np.polyfit(np.log(sizes), np.log(times), 1)[0])
+
+
+def scaling_report(names=None, m_sizes=(250, 500, 1000, 2000, 4000), n_sizes=(4, 8, 16, 32, 64),
+                   m_fixed=250, n_fixed=8, repeat=3, seed=0):
+    """
+        Measures times of the methods for the geometric sweeps of the numbers of alternatives and criteria
+        and fits the growth exponents in m and n. For the method of O(m*n) complexity both exponents are close to 1.
+
+        Parameters
+        ----------
+            names : iterable, default=None
+                Names of the method classes, all methods if not given
+
+            m_sizes : iterable, default=(250, 500, 1000, 2000, 4000)
+                Numbers of alternatives, evaluated with n_fixed criteria
+
+            n_sizes : iterable, default=(4, 8, 16, 32, 64)
+                Numbers of criteria, evaluated with m_fixed alternatives
+
+            m_fixed : int, default=250
+                Number of alternatives in the sweep of criteria
+
+            n_fixed : int, default=8
+                Number of criteria in the sweep of alternatives
+
+            repeat : int, default=3
+                Number of timed calls, the shortest time is used
+
+            seed : int, default=0
+                Seed of the random generator
+
+        Returns
+        -------
+            dict
+                Growth exponents and times of the sweeps for each method
+    """
+    names = METHODS if names is None else list(names)
+    report = {}
+    for name in names:
+        method = getattr(methods, name)()
+        m_times = [_best_time(method, random_problem(m, n_fixed, seed), repeat) for m in m_sizes]
+        n_times = [_best_time(method, random_problem(m_fixed, n, seed), repeat) for n in n_sizes]
+        report[name] = {
+            'm_exponent': fit_exponent(m_sizes, m_times),
+            'n_exponent': fit_exponent(n_sizes, n_times),
+            'm_sizes': list(m_sizes),
+            'm_times': m_times,
+            'n_sizes': list(n_sizes),
+            'n_times': n_times
+        }
+    return report
+
+
+def check_budget(report, budget=1.5, budgets=None):
+    """
+        Selects the methods which growth exponents exceed the budget
+
+        Parameters
+        ----------
+            report : dict
+                Report returned by scaling_report
+
+            budget : float, default=1.5
+                Largest accepted growth exponent in m and n
+
+            budgets : dict, default=None
+                Budgets of the particular methods, given as a float or a dict with 'm' and 'n' keys
+
+        Returns
+        -------
+            list
+                Tuples with name of the method, axis, growth exponent and its budget
+    """
+    budgets = {} if budgets is None else budgets
+    violations = []
+    for name, result in report.items():
+        limit = budgets.get(name, budget)
+        for axis in ['m', 'n']:
+            axis_limit = limit.get(axis, budget) if isinstance(limit, dict) else limit
+            exponent = result[f'{axis}_exponent']
+            if exponent > axis_limit:
+                violations.append((name, axis, exponent, axis_limit))
+    return violations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m pyifdm.bench.scaling', description='Growth exponents of the methods in the number of alternatives and criteria')
+    parser.add_argument('methods', nargs='*', default=None, help='names of the method classes, all methods if not given')
+    parser.add_argument('-b', '--budget', type=float, default=1.5, help='largest accepted growth exponent')
+    parser.add_argument('-m', '--sizes', type=int, nargs='+', default=[250, 500, 1000, 2000, 4000], help='numbers of alternatives')
+    parser.add_argument('-n', '--criteria', type=int, nargs='+', default=[4, 8, 16, 32, 64], help='numbers of criteria')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='number of timed calls')
+    parser.add_argument('-o', '--output', default=None, help='path of the JSON file with the report')
+    args = parser.parse_args(argv)
+
+    report = scaling_report(args.methods or None, args.sizes, args.criteria, repeat=args.repeat)
+    violations = check_budget(report, args.budget)
+
+    for name, result in report.items():
+        print(f"{name:10} m^{result['m_exponent']:.2f} n^{result['n_exponent']:.2f}")
+    for name, axis, exponent, limit in violations:
+        print(f'{name} exceeds the budget in {axis}: {exponent:.2f} > {limit:.2f}')
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump({'budget': args.budget, 'report': report, 'violations': violations}, f, indent=2)
+
+    return 1 if violations else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
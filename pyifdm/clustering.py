@@ -0,0 +1,193 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from .methods.ifs.distance import hamming_distance, pairwise_distance
+from .precision import as_float
+
+__all__ = [
+    'KMedoids'
+]
+
+# profiles kept by the processes of the pool, so they are not sent with each task
+_shared = {}
+
+
+def _share(profiles):
+    _shared['profiles'] = profiles
+
+
+def _assign(profiles, centers, distance, block_size):
+    """
+        Returns the index of the nearest center and the distance to it for each profile
+    """
+    d = pairwise_distance(profiles, centers, distance, block_size)
+    labels = np.argmin(d, axis=1)
+    return labels, d[np.arange(d.shape[0]), labels]
+
+
+def _assign_shared(start, end, centers, distance, block_size):
+    return _assign(_shared['profiles'][start:end], centers, distance, block_size)
+
+
+class KMedoids():
+    def __init__(self, n_clusters, distance=hamming_distance, max_iter=100, max_candidates=1000,
+                 chunk_size=100000, block_size=2**20, n_jobs=None, seed=0):
+        """
+            Clustering of the profiles of Intuitionistic Fuzzy Sets into groups represented by the medoids, the profiles
+            of the smallest sum of distances to the other profiles in the group. Distance between profiles is the sum of
+            the distances of IFS over the criteria. Distances are calculated in blocks, so the matrix of distances
+            between all profiles is never created.
+
+            Parameters
+            ----------
+                n_clusters : int
+                    Number of clusters
+
+                distance : callable, default=hamming_distance
+                    Function used to calculate distance between two IFS
+
+                max_iter : int, default=100
+                    Largest number of iterations of the assignment and update steps
+
+                max_candidates : int, default=1000
+                    Largest number of profiles of the cluster checked as its new medoid, larger clusters are sampled.
+                    Sum of distances of each candidate is calculated to all profiles of the cluster
+
+                chunk_size : int, default=100000
+                    Number of profiles assigned to the clusters in a single task
+
+                block_size : int, default=2**20
+                    Largest number of pairs of IFS compared at once, limits the memory used by the calculations
+
+                n_jobs : int, default=None
+                    Number of processes assigning the profiles to the clusters, assigned in the current process if not given
+
+                seed : int, default=0
+                    Seed of the random generator selecting the initial medoids and candidates
+        """
+        self.n_clusters = n_clusters
+        self.distance = distance
+        self.max_iter = max_iter
+        self.max_candidates = max_candidates
+        self.chunk_size = chunk_size
+        self.block_size = block_size
+        self.n_jobs = n_jobs
+        self.seed = seed
+
+    def _assign(self, profiles, centers, executor=None):
+        starts = range(0, profiles.shape[0], self.chunk_size)
+        if executor is None:
+            results = [_assign(profiles[start:start + self.chunk_size], centers, self.distance, self.block_size) for start in starts]
+        else:
+            results = executor.map(_assign_shared, starts, [start + self.chunk_size for start in starts],
+                                   repeat(centers), repeat(self.distance), repeat(self.block_size))
+        labels, distances = zip(*results)
+        return np.concatenate(labels), np.concatenate(distances)
+
+    def _initialize(self, profiles, rng, executor):
+        """
+            Selects the initial medoids with probability proportional to the squared distance to the nearest selected medoid (k-medoids++)
+        """
+        m = profiles.shape[0]
+        medoids = [int(rng.integers(m))]
+        nearest = np.full(m, np.inf)
+        for _ in range(1, self.n_clusters):
+            _, d = self._assign(profiles, profiles[medoids[-1:]], executor)
+            nearest = np.minimum(nearest, d)
+            weights = nearest.astype(float) ** 2
+            weights[medoids] = 0
+            if np.sum(weights) == 0:
+                # remaining profiles are equal to the medoids
+                weights = np.ones(m)
+                weights[medoids] = 0
+            medoids.append(int(rng.choice(m, p=weights / np.sum(weights))))
+        return np.array(medoids)
+
+    def _update(self, profiles, labels, medoids, rng):
+        """
+            Selects the profile of the smallest sum of distances to the other profiles in each cluster
+        """
+        medoids = medoids.copy()
+        for cluster in range(self.n_clusters):
+            members = np.flatnonzero(labels == cluster)
+            if members.shape[0] == 0:
+                continue
+            candidates = members
+            if members.shape[0] > self.max_candidates:
+                candidates = rng.choice(members, self.max_candidates, replace=False)
+                candidates = np.union1d(candidates, medoids[cluster])
+
+            costs = np.zeros(candidates.shape[0])
+            for start in range(0, members.shape[0], self.chunk_size):
+                costs += np.sum(pairwise_distance(profiles[candidates], profiles[members[start:start + self.chunk_size]],
+                                                  self.distance, self.block_size), axis=1)
+            # current medoid is kept unless other profile is strictly better
+            current = costs[candidates == medoids[cluster]]
+            if current.shape[0] == 0 or np.min(costs) < current[0]:
+                medoids[cluster] = candidates[np.argmin(costs)]
+        return medoids
+
+    def fit(self, profiles):
+        """
+            Clusters the profiles
+
+            Parameters
+            ----------
+                profiles : ndarray
+                    Profiles of Intuitionistic Fuzzy Sets, of shape (m, n, 2|3), e.g. alternatives of the decision matrix
+
+            Returns
+            -------
+                self
+                    Clustering with medoids, centers, labels, inertia and n_iter attributes
+        """
+        profiles = as_float(profiles)
+        if profiles.ndim != 3 or profiles.shape[-1] not in [2, 3]:
+            raise ValueError('Profiles should be given as the array of shape (m, n, 2|3)')
+        if not 1 <= self.n_clusters <= profiles.shape[0]:
+            raise ValueError(f'Number of clusters should be in range from 1 to {profiles.shape[0]}')
+        if self.max_iter < 1:
+            raise ValueError('Number of iterations should be at least 1')
+
+        rng = np.random.default_rng(self.seed)
+        executor = None
+        if self.n_jobs is not None and self.n_jobs > 1:
+            executor = ProcessPoolExecutor(self.n_jobs, initializer=_share, initargs=(profiles, ))
+        try:
+            medoids = self._initialize(profiles, rng, executor)
+            for iteration in range(1, self.max_iter + 1):
+                labels, distances = self._assign(profiles, profiles[medoids], executor)
+                updated = self._update(profiles, labels, medoids, rng)
+                if np.all(updated == medoids):
+                    break
+                medoids = updated
+            else:
+                labels, distances = self._assign(profiles, profiles[medoids], executor)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.medoids = medoids
+        self.centers = profiles[medoids]
+        self.labels = labels
+        self.inertia = float(np.sum(distances))
+        self.n_iter = iteration
+        return self
+
+    def predict(self, profiles):
+        """
+            Assigns the profiles to the nearest medoids
+
+            Parameters
+            ----------
+                profiles : ndarray
+                    Profiles of Intuitionistic Fuzzy Sets, of shape (p, n, 2|3)
+
+            Returns
+            -------
+                ndarray
+                    Clusters of the profiles
+        """
+        return self._assign(as_float(profiles), self.centers)[0]
@@ -1,12 +1,20 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+from .backend import get_backend, jit
 
 __all__ = [
+    'kendall_tau_coef',
     'pearson_coef',
+    'pearson_matrix',
     'spearman_coef',
+    'spearman_footrule_distance',
+    'spearman_matrix',
+    'top_k_footrule_distance',
     'weighted_spearman_coef',
-    'ws_rank_similarity_coef'
+    'weighted_spearman_matrix',
+    'ws_rank_similarity_coef',
+    'ws_rank_similarity_matrix'
 ]
 
 def pearson_coef(x, y):
@@ -86,3 +94,314 @@ def ws_rank_similarity_coef(x, y):
     """
     N = x.shape[0]
     return 1 - np.sum(2.0**(-1.0 * x) * (np.fabs(x - y)) / (np.max((np.fabs(1 - x), np.fabs(N - x)), axis=0)))
+
+def _average_ranks(R):
+    """
+        Ranks the values in each row in ascending order, tied values get the average of their ranks
+    """
+    order = np.argsort(R, axis=1, kind='stable')
+    s = np.take_along_axis(R, order, axis=1)
+    k, m = R.shape
+    idx = np.broadcast_to(np.arange(m), (k, m))
+
+    # first and last position of the group of tied values in the sorted rows
+    first = np.ones((k, m), dtype=bool)
+    first[:, 1:] = s[:, 1:] != s[:, :-1]
+    last = np.ones((k, m), dtype=bool)
+    last[:, :-1] = first[:, 1:]
+    start = np.maximum.accumulate(np.where(first, idx, 0), axis=1)
+    end = np.minimum.accumulate(np.where(last, idx, m - 1)[:, ::-1], axis=1)[:, ::-1]
+
+    ranks = np.empty((k, m))
+    np.put_along_axis(ranks, order, (start + end) / 2 + 1, axis=1)
+    return ranks
+
+def pearson_matrix(R):
+    """
+        Calculate Pearson correlation between each pair of vectors
+
+        Parameters
+        ----------
+            R : ndarray
+                Array of k vectors with m values, of shape (k, m)
+
+        Returns
+        -------
+            ndarray
+                Correlations between the vectors, of shape (k, k)
+    """
+    R = np.asarray(R, dtype=float)
+    centered = R - np.mean(R, axis=1, keepdims=True)
+    centered /= np.sqrt(np.sum(centered ** 2, axis=1, keepdims=True))
+    return centered @ centered.T
+
+def spearman_matrix(R):
+    """
+        Calculate Spearman correlation between each pair of vectors, values are ranked in each vector and tied values get the average rank
+
+        Parameters
+        ----------
+            R : ndarray
+                Array of k vectors with m values, of shape (k, m)
+
+        Returns
+        -------
+            ndarray
+                Correlations between the vectors, of shape (k, k)
+    """
+    return pearson_matrix(_average_ranks(np.asarray(R, dtype=float)))
+
+def weighted_spearman_matrix(R):
+    """
+        Calculate Weighted Spearman correlation between each pair of rankings
+
+        Parameters
+        ----------
+            R : ndarray
+                Array of k rankings of m alternatives, of shape (k, m)
+
+        Returns
+        -------
+            ndarray
+                Correlations between the rankings, of shape (k, k)
+    """
+    R = np.asarray(R, dtype=float)
+    N = R.shape[1]
+    a = 2 * N + 2
+    R2 = R ** 2
+    # sum of (x - y)^2 * (2N + 2 - x - y) expanded to the products of the rankings
+    x = a * np.sum(R2, axis=1) - np.sum(R2 * R, axis=1)
+    products = R2 @ R.T
+    total = x[:, np.newaxis] + x[np.newaxis, :] - 2 * a * (R @ R.T) + products + products.T
+    return 1 - (6 * total) / (N**4 + N**3 - N**2 - N)
+
+def ws_rank_similarity_matrix(R, block_size=2**20):
+    """
+        Calculate WS Rank Similarity Coefficient between each pair of rankings, the rows are used as the reference rankings
+
+        Parameters
+        ----------
+            R : ndarray
+                Array of k rankings of m alternatives, of shape (k, m)
+
+            block_size : int, default=2**20
+                Largest number of values compared at once, limits the memory used by the calculations
+
+        Returns
+        -------
+            ndarray
+                Coefficients between the rankings, of shape (k, k), the value [i, j] is equal to ws_rank_similarity_coef(R[i], R[j])
+    """
+    R = np.asarray(R, dtype=float)
+    k, N = R.shape
+    weights = 2.0**(-1.0 * R) / np.maximum(np.fabs(1 - R), np.fabs(N - R))
+
+    result = np.empty((k, k))
+    rows = max(1, block_size // max(1, k * N))
+    for start in range(0, k, rows):
+        block = slice(start, start + rows)
+        differences = np.fabs(R[block, np.newaxis, :] - R[np.newaxis, :, :])
+        result[block] = 1 - np.einsum('ijm,im->ij', differences, weights[block])
+    return result
+
+def _group_starts(*keys):
+    """
+        Returns the position of the first value in the group of tied values, for each value of the rows sorted by the keys
+    """
+    k, m = keys[0].shape
+    first = np.ones((k, m), dtype=bool)
+    first[:, 1:] = np.any([key[:, 1:] != key[:, :-1] for key in keys], axis=0)
+    idx = np.broadcast_to(np.arange(m), (k, m))
+    return idx, np.maximum.accumulate(np.where(first, idx, 0), axis=1)
+
+def _tied_pairs(*keys):
+    """
+        Counts pairs of tied values in the rows sorted by the keys
+    """
+    idx, start = _group_starts(*keys)
+    return np.sum(idx - start, axis=1)
+
+def _dense_ranks(R):
+    """
+        Ranks the values in each row in ascending order with consecutive integers from 0, tied values get the same rank
+    """
+    order = np.argsort(R, axis=1, kind='stable')
+    s = np.take_along_axis(R, order, axis=1)
+    first = np.ones(R.shape, dtype=np.int64)
+    first[:, 0] = 0
+    first[:, 1:] = s[:, 1:] != s[:, :-1]
+    ranks = np.empty(R.shape, dtype=np.int64)
+    np.put_along_axis(ranks, order, np.cumsum(first, axis=1), axis=1)
+    return ranks
+
+@jit
+def _merge_inversions(R, out):
+    # bottom-up merge sort of each row counting the pairs moved over each other
+    k, m = R.shape
+    buffer = np.empty(m, dtype=R.dtype)
+    for r in range(k):
+        row = R[r].copy()
+        count = 0
+        width = 1
+        while width < m:
+            for left in range(0, m - width, 2 * width):
+                middle = left + width
+                right = min(left + 2 * width, m)
+                i, j, t = left, middle, left
+                while i < middle and j < right:
+                    if row[j] < row[i]:
+                        count += middle - i
+                        buffer[t] = row[j]
+                        j += 1
+                    else:
+                        buffer[t] = row[i]
+                        i += 1
+                    t += 1
+                while i < middle:
+                    buffer[t] = row[i]
+                    i += 1
+                    t += 1
+                while j < right:
+                    buffer[t] = row[j]
+                    j += 1
+                    t += 1
+                row[left:right] = buffer[left:right]
+            width *= 2
+        out[r] = count
+    return out
+
+def _inversions(R):
+    """
+        Counts pairs i < j with R[i] > R[j] in each row of non-negative integers in O(m log m).
+        With the numba backend rows are sorted with the merge sort. Otherwise rows are partitioned by the consecutive bits
+        of the values starting from the highest one, as in the radix sort, and the inversions decided by the bit
+        are counted for the values of the same higher bits.
+    """
+    k, m = R.shape
+    if get_backend() == 'numba':
+        return _merge_inversions(R, np.zeros(k))
+
+    bits = int(R.max()).bit_length() if R.size else 0
+    # rows are separated by the higher bits, which are not partitioned
+    values = (R + (np.arange(k)[:, np.newaxis] << bits)).ravel()
+    total = np.zeros(k)
+
+    idx = np.arange(values.shape[0])
+    first = np.ones(values.shape[0], dtype=bool)
+    for b in range(bits - 1, -1, -1):
+        bit = (values >> b) & 1
+        prefix = values >> (b + 1)
+        first[1:] = prefix[1:] != prefix[:-1]
+        starts = np.flatnonzero(first)
+        group = np.cumsum(first) - 1
+        group_start = starts[group]
+
+        # numbers of the preceding values with the bit set and not set in the group
+        ones_before = np.cumsum(bit) - bit
+        ones_before -= ones_before[group_start]
+        zeros_before = idx - group_start - ones_before
+        zero = bit == 0
+        total += np.bincount((values >> bits)[zero], weights=ones_before[zero], minlength=k)
+
+        # stable partition of the groups, values with zero bit are placed first
+        group_zeros = (np.diff(starts, append=values.shape[0]) - np.add.reduceat(bit, starts))[group]
+        positions = np.where(zero, group_start + zeros_before, group_start + group_zeros + ones_before)
+        partitioned = np.empty_like(values)
+        partitioned[positions] = values
+        values = partitioned
+    return total
+
+def _as_rows(x, y):
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    return x.reshape(-1, x.shape[-1]), y.reshape(-1, y.shape[-1]), x.shape[:-1]
+
+def kendall_tau_coef(x, y):
+    """
+        Calculate Kendall tau-b correlation between two vectors, accounting for the tied values, in O(m log m)
+
+        Parameters
+        ----------
+            x : ndarray
+                Array with values, batch of vectors can be given with the leading axes (..., m)
+
+            y : ndarray
+                Array with values, batch of vectors can be given with the leading axes (..., m)
+
+        Returns
+        -------
+            float or ndarray
+                Correlation between two vectors, of shape (...) for the batch of vectors
+    """
+    x, y, shape = _as_rows(x, y)
+    m = x.shape[1]
+    order = np.lexsort((y, x), axis=-1)
+    xs = np.take_along_axis(x, order, axis=1)
+    ys = np.take_along_axis(y, order, axis=1)
+
+    n0 = m * (m - 1) / 2
+    n1 = _tied_pairs(xs)
+    n2 = _tied_pairs(np.sort(y, axis=1))
+    n3 = _tied_pairs(xs, ys)
+    # pairs ordered differently by y in the vectors sorted by x
+    discordant = _inversions(np.take_along_axis(_dense_ranks(y), order, axis=1))
+
+    tau = (n0 - n1 - n2 + n3 - 2 * discordant) / np.sqrt((n0 - n1) * (n0 - n2))
+    return tau.reshape(shape) if shape else tau[0]
+
+def spearman_footrule_distance(x, y, normalize=False):
+    """
+        Calculate Spearman footrule distance between two rankings, the sum of absolute differences of positions
+
+        Parameters
+        ----------
+            x : ndarray
+                Array with ranking, batch of rankings can be given with the leading axes (..., m)
+
+            y : ndarray
+                Array with ranking, batch of rankings can be given with the leading axes (..., m)
+
+            normalize : bool, default=False
+                Divide the distance by its maximum value floor(m^2 / 2), so it is in the range [0, 1]
+
+        Returns
+        -------
+            float or ndarray
+                Distance between two rankings, of shape (...) for the batch of rankings
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    distance = np.sum(np.fabs(x - y), axis=-1)
+    if normalize:
+        m = max(x.shape[-1], y.shape[-1])
+        distance = distance / (m ** 2 // 2)
+    return distance
+
+def top_k_footrule_distance(x, y, k, normalize=False):
+    """
+        Calculate footrule distance between the top k alternatives of two rankings.
+        Positions below k are replaced with k + 1, so only the disagreement in the top of the rankings is measured (Fagin et al., 2003).
+
+        Parameters
+        ----------
+            x : ndarray
+                Array with ranking, batch of rankings can be given with the leading axes (..., m)
+
+            y : ndarray
+                Array with ranking, batch of rankings can be given with the leading axes (..., m)
+
+            k : int
+                Number of the top positions compared
+
+            normalize : bool, default=False
+                Divide the distance by its maximum value k * (k + 1) for disjoint top k lists, so it is in the range [0, 1]
+
+        Returns
+        -------
+            float or ndarray
+                Distance between two rankings, of shape (...) for the batch of rankings
+    """
+    x = np.minimum(np.asarray(x, dtype=float), k + 1)
+    y = np.minimum(np.asarray(y, dtype=float), k + 1)
+    distance = np.sum(np.fabs(x - y), axis=-1)
+    if normalize:
+        distance = distance / (k * (k + 1))
+    return distance
@@ -0,0 +1,426 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+from .precision import as_float, get_dtype
+from .methods.ifs.distance import elementwise_distance
+
+__all__ = [
+    'CodebookMatrix',
+    'EncodedMatrix',
+    'QuantizedMatrix',
+    'apply_distance',
+    'apply_score',
+    'iter_preferences'
+]
+
+
+class EncodedMatrix():
+    """
+        Base object for the Intuitionistic Fuzzy matrices stored in a compact form.
+        Encoded matrices can be passed to the methods, which decode them when needed.
+    """
+
+    @property
+    def ndim(self):
+        return 3
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self, dtype=None, copy=None):
+        return self.decode() if dtype is None else self.decode().astype(dtype)
+
+
+class CodebookMatrix(EncodedMatrix):
+    def __init__(self, terms, codes):
+        """
+            Intuitionistic Fuzzy matrix encoded with a codebook of terms, e.g. from a linguistic scale.
+            Each element of the matrix is stored as an index of its term, so the score and distance
+            functions can be evaluated once per term and gathered by the indexes.
+
+            Parameters
+            ----------
+                terms : ndarray
+                    Array with distinct Intuitionistic Fuzzy Sets (u, v) or (u, v, p) used in the matrix
+
+                codes : ndarray
+                    Matrix with indexes of the terms.
+                    Alternatives are in rows and Criteria are in columns.
+        """
+
+        terms = np.asarray(terms, dtype=float)
+        codes = np.asarray(codes)
+
+        if terms.ndim != 2 or (terms.shape[1] != 2 and terms.shape[1] != 3):
+            raise ValueError('Codebook terms should all have length of 2 or 3')
+        if codes.ndim != 2:
+            raise ValueError(f'Codes should be given as a matrix, not as an array with {codes.ndim} dimensions')
+        if codes.size and (np.min(codes) < 0 or np.max(codes) >= terms.shape[0]):
+            raise ValueError(f'Codes should be indexes of the {terms.shape[0]} terms')
+
+        self.terms = terms
+        if terms.shape[0] <= 2**8:
+            dtype = np.uint8
+        elif terms.shape[0] <= 2**16:
+            dtype = np.uint16
+        else:
+            dtype = np.uint32
+        self.codes = codes.astype(dtype)
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """
+            Encodes Intuitionistic Fuzzy matrix with the codebook of its distinct elements
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+            Returns
+            -------
+                CodebookMatrix
+                    Encoded matrix
+        """
+        matrix = np.asarray(matrix, dtype=float)
+        terms, codes = np.unique(matrix.reshape((-1, matrix.shape[2])), axis=0, return_inverse=True)
+        return cls(terms, codes.reshape(matrix.shape[:2]))
+
+    @property
+    def shape(self):
+        return self.codes.shape + (self.terms.shape[1], )
+
+    @property
+    def nbytes(self):
+        return self.terms.nbytes + self.codes.nbytes
+
+    def decode(self):
+        """
+            Decodes the matrix to the Intuitionistic Fuzzy matrix
+
+            Returns
+            -------
+                ndarray
+                    Decision matrix with the Intuitionistic Fuzzy Sets
+        """
+        return self.terms[self.codes]
+
+    def score(self, score):
+        """
+            Calculates score of each element of the matrix, the score is evaluated once per term
+
+            Parameters
+            ----------
+                score : callable
+                    Function used to calculate crisp score of IFS
+
+            Returns
+            -------
+                ndarray
+                    Matrix with crisp scores
+        """
+        return as_float(score(as_float(self.terms)))[self.codes]
+
+    def distance(self, distance, b):
+        """
+            Calculates distance between each element of the matrix and given IFS, the distance is evaluated once per term
+
+            Parameters
+            ----------
+                distance : callable
+                    Function used to calculate distance between two IFS
+
+                b : ndarray
+                    Intuitionistic Fuzzy Set (u, v)
+
+            Returns
+            -------
+                ndarray
+                    Matrix with crisp distances
+        """
+        return np.array([distance(t, b) for t in as_float(self.terms)], dtype=get_dtype())[self.codes]
+
+    def distance_table(self, distance, other=None):
+        """
+            Calculates distances between all pairs of terms from two codebooks
+
+            Parameters
+            ----------
+                distance : callable
+                    Function used to calculate distance between two IFS
+
+                other : CodebookMatrix, default=None
+                    Matrix with the second codebook, the own codebook is used if not given
+
+            Returns
+            -------
+                ndarray
+                    Table with distances, the rows follow own terms and columns follow terms of the other matrix
+        """
+        other_terms = self.terms if other is None else other.terms
+        return np.array([[distance(a, b) for b in other_terms] for a in self.terms], dtype=float)
+
+
+class QuantizedMatrix(EncodedMatrix):
+    # number of quantization levels of the membership and non-membership degrees
+    LEVELS = 65535
+
+    def __init__(self, data):
+        """
+            Intuitionistic Fuzzy matrix with the membership and non-membership degrees quantized to uint16.
+            Hesitancy degree is derived when the matrix is decoded.
+
+            The quantization error of the membership and non-membership degrees is not greater than 1/65535 (~1.53e-5),
+            and the error of the derived hesitancy degree is not greater than 2/65535. Preferences calculated from
+            the quantized matrix are only approximations and there is no common bound of their error:
+
+            - MAIRCA, MARCOS, MOORA and OCRA use the degrees through sums, distances and scores, their preferences
+              change in the order of the quantization error scaled by the normalization.
+            - ARAS, COPRAS, MABAC, WASPAS, WPM and WSM raise the degrees to the power of the weights, e.g. v**w,
+              which is steep near 0. A degree quantized to 0 can change the weighted degree by up to (1/131070)**w,
+              about 0.17 for w = 0.15. EDAS raises the products of the degrees to the power 1/m in the average
+              solution and divides by its score, its preferences are sensitive for the degrees and scores close to 0.
+            - ARAS, TOPSIS and VIKOR select the ideal solutions by the greatest membership degree, CODAS compares
+              the distances with the tau threshold and MABAC compares the scores with the border area. Preferences
+              change by a step when the quantization changes the selected element or the result of the comparison.
+
+            The quantized matrix is suited for the screening of alternatives, the selected alternatives should be
+            evaluated again with the original matrix.
+
+            Parameters
+            ----------
+                data : ndarray
+                    Array of uint16 with quantized degrees (u, v).
+                    Alternatives are in rows and Criteria are in columns.
+        """
+
+        data = np.asarray(data)
+        if data.ndim != 3 or data.shape[2] != 2 or data.dtype != np.uint16:
+            raise ValueError('Quantized data should be an uint16 array with the elements of length 2')
+
+        self.data = data
+
+    @classmethod
+    def quantize(cls, matrix):
+        """
+            Quantizes membership and non-membership degrees of the Intuitionistic Fuzzy matrix
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Matrix with Intuitionistic Fuzzy Sets
+
+            Returns
+            -------
+                ndarray
+                    Array of uint16 with quantized degrees (u, v)
+        """
+        matrix = np.asarray(matrix)
+        q = np.rint(np.clip(matrix[..., :2], 0, 1) * cls.LEVELS).astype(np.uint16)
+        # rounding cannot make the sum of degrees greater than 1
+        q[..., 1] = np.minimum(q[..., 1], cls.LEVELS - q[..., 0])
+        return q
+
+    @classmethod
+    def from_matrix(cls, matrix, chunk_size=10000):
+        """
+            Quantizes Intuitionistic Fuzzy matrix, the rows are converted in chunks
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                chunk_size : int, default=10000
+                    Number of alternatives converted at once
+
+            Returns
+            -------
+                QuantizedMatrix
+                    Quantized matrix
+        """
+        data = np.zeros((matrix.shape[0], matrix.shape[1], 2), dtype=np.uint16)
+        for start in range(0, matrix.shape[0], chunk_size):
+            data[start:start + chunk_size] = cls.quantize(matrix[start:start + chunk_size])
+        return cls(data)
+
+    @classmethod
+    def from_chunks(cls, chunks):
+        """
+            Quantizes Intuitionistic Fuzzy matrix given in consecutive chunks of alternatives
+
+            Parameters
+            ----------
+                chunks : iterable
+                    Iterable with matrices of the consecutive alternatives
+
+            Returns
+            -------
+                QuantizedMatrix
+                    Quantized matrix
+        """
+        return cls(np.concatenate([cls.quantize(chunk) for chunk in chunks], axis=0))
+
+    @property
+    def shape(self):
+        return self.data.shape[:2] + (3, )
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+
+    def decode(self, start=0, stop=None):
+        """
+            Decodes the alternatives to the Intuitionistic Fuzzy matrix with derived hesitancy degrees
+
+            Parameters
+            ----------
+                start : int, default=0
+                    Index of the first decoded alternative
+
+                stop : int, default=None
+                    Index after the last decoded alternative, all remaining alternatives if not given
+
+            Returns
+            -------
+                ndarray
+                    Decision matrix with the Intuitionistic Fuzzy Sets (u, v, p)
+        """
+        data = self.data[start:stop]
+        matrix = np.zeros(data.shape[:2] + (3, ), dtype=get_dtype())
+        matrix[:, :, :2] = data / matrix.dtype.type(self.LEVELS)
+        matrix[:, :, 2] = 1 - matrix[:, :, 0] - matrix[:, :, 1]
+        return matrix
+
+    def iter_chunks(self, chunk_size=10000):
+        """
+            Decodes the matrix in consecutive chunks of alternatives
+
+            Parameters
+            ----------
+                chunk_size : int, default=10000
+                    Number of alternatives decoded at once
+
+            Returns
+            -------
+                generator
+                    Decision matrices with the consecutive alternatives
+        """
+        for start in range(0, self.data.shape[0], chunk_size):
+            yield self.decode(start, start + chunk_size)
+
+
+def apply_score(score, matrix):
+    """
+        Calculates score of each element of the Intuitionistic Fuzzy matrix.
+        For the encoded matrix the score is evaluated once per term.
+
+        Parameters
+        ----------
+            score : callable
+                Function used to calculate crisp score of IFS
+
+            matrix : ndarray or EncodedMatrix
+                Matrix with Intuitionistic Fuzzy Sets
+
+        Returns
+        -------
+            ndarray
+                Matrix with crisp scores
+    """
+    if isinstance(matrix, CodebookMatrix):
+        return matrix.score(score)
+    if isinstance(matrix, QuantizedMatrix):
+        return np.concatenate([score(chunk) for chunk in matrix.iter_chunks()], axis=0)
+    return score(matrix)
+
+
+def apply_distance(distance, matrix, b, out=None):
+    """
+        Calculates distance between each element of the Intuitionistic Fuzzy matrix and given IFS.
+        For the encoded matrix the distance is evaluated once per term.
+
+        Parameters
+        ----------
+            distance : callable
+                Function used to calculate distance between two IFS
+
+            matrix : ndarray or EncodedMatrix
+                Matrix with Intuitionistic Fuzzy Sets
+
+            b : ndarray
+                Intuitionistic Fuzzy Set (u, v)
+
+            out : ndarray, default=None
+                Array to store the distances
+
+        Returns
+        -------
+            ndarray
+                Matrix with crisp distances
+    """
+    if isinstance(matrix, CodebookMatrix):
+        if out is None:
+            return matrix.distance(distance, b)
+        out[...] = matrix.distance(distance, b)
+        return out
+
+    if isinstance(matrix, QuantizedMatrix):
+        if out is None:
+            out = np.zeros(matrix.shape[:2], dtype=get_dtype())
+        start = 0
+        for chunk in matrix.iter_chunks():
+            elementwise_distance(distance, chunk, b, out=out[start:start + chunk.shape[0]])
+            start += chunk.shape[0]
+        return out
+
+    return elementwise_distance(distance, matrix, b, out=out)
+
+
+def iter_preferences(method, matrix, weights, types, chunk_size=10000):
+    """
+        Calculates preferences of alternatives in consecutive chunks, so the whole matrix is never decoded.
+        Supported are the methods which evaluate each alternative independently from the others,
+        i.e. WASPAS, WPM, WSM and MOORA without normalization or with swap normalization.
+        The preferences can be passed directly to the top_k_stream helper.
+
+        Parameters
+        ----------
+            method : object
+                Method object used to calculate preferences
+
+            matrix : ndarray or EncodedMatrix
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            weights : ndarray
+                Vector of criteria weights in a crisp or Intuitionistic Fuzzy form
+
+            types : ndarray
+                Types of criteria, 1 profit, -1 cost
+
+            chunk_size : int, default=10000
+                Number of alternatives evaluated at once
+
+        Returns
+        -------
+            generator
+                Preferences of the consecutive chunks of alternatives
+    """
+    from .methods import ifMOORA, ifWASPAS, ifWPM, ifWSM
+    from .methods.incremental import ROW_NORMALIZATIONS
+
+    if not isinstance(method, (ifMOORA, ifWASPAS, ifWPM, ifWSM)) or \
+            not (method.normalization is None or method.normalization in ROW_NORMALIZATIONS):
+        raise ValueError(f'{type(method).__name__} method with given normalization requires the whole matrix')
+
+    if isinstance(matrix, QuantizedMatrix):
+        chunks = matrix.iter_chunks(chunk_size)
+    else:
+        matrix = np.asarray(matrix)
+        chunks = (matrix[start:start + chunk_size] for start in range(0, matrix.shape[0], chunk_size))
+
+    for chunk in chunks:
+        yield method(chunk, weights, types)
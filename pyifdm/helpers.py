@@ -1,10 +1,13 @@
 # Copyright (c) 2022 Jakub Więckowski
 
+import heapq
 import numpy as np
 
 __all__ = [
     'rank',
-    'generate_ifs_matrix'
+    'generate_ifs_matrix',
+    'top_k',
+    'top_k_stream'
 ]
 
 
@@ -56,3 +59,96 @@ def generate_ifs_matrix(m, n):
             arr.append(t)
     return np.array(arr, dtype=object).reshape((m, n, 2)).astype(float)
 
+
+def top_k(x, k, descending=True):
+    """
+        Selects indices of the k best values with the given direction, default descending order.
+        Uses partial selection, so the full vector is not sorted.
+        Values that are equal are ordered by their index, the lower index is placed first.
+        NaN values are always placed last.
+
+        Parameters
+        ----------
+            x: ndarray
+                Array with values
+
+            k: int
+                Number of selected values
+
+            descending: boolean, default=True
+                Switch to change ranking order
+
+        Returns
+        -------
+            ndarray
+                Indices of the k best values, starting from the best one
+
+    """
+    x = np.asarray(x, dtype=float)
+    if x.ndim != 1:
+        raise ValueError(f'Values should be given as a vector, not as an array with {x.ndim} dimensions')
+    if int(k) != k or k < 0:
+        raise ValueError(f'Number of selected values should be a non-negative integer, not {k}')
+
+    k = min(int(k), x.shape[0])
+    if k == 0:
+        return np.array([], dtype=int)
+
+    key = -x if descending else x.copy()
+    key[np.isnan(key)] = np.inf
+
+    # values placed strictly before the k-th one and the ties resolved by index
+    threshold = np.max(key[np.argpartition(key, k - 1)[:k]])
+    better = np.flatnonzero(key < threshold)
+    ties = np.flatnonzero(key == threshold)[:k - better.shape[0]]
+
+    idx = np.concatenate((better, ties))
+    return idx[np.lexsort((idx, key[idx]))]
+
+
+def top_k_stream(chunks, k, descending=True):
+    """
+        Selects the k best values from the values given in consecutive chunks, default descending order.
+        Only the k best candidates are kept in a bounded heap, so the whole vector is never stored.
+        Values that are equal are ordered by their global index, the lower index is placed first.
+        NaN values are always placed last.
+
+        Parameters
+        ----------
+            chunks: iterable
+                Iterable with vectors of values, indexing continues between chunks
+
+            k: int
+                Number of selected values
+
+            descending: boolean, default=True
+                Switch to change ranking order
+
+        Returns
+        -------
+            tuple
+                Indices and values of the k best values, starting from the best one
+
+    """
+    heap = []
+    offset = 0
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=float)
+        for idx in top_k(chunk, k, descending):
+            value = chunk[idx]
+            if np.isnan(value):
+                key = -np.inf
+            else:
+                key = value if descending else -value
+            # the worst candidate is kept in the heap root
+            item = (key, -(offset + int(idx)), value)
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+        offset += chunk.shape[0]
+
+    heap.sort(reverse=True)
+    indices = np.array([-item[1] for item in heap], dtype=int)
+    values = np.array([item[2] for item in heap], dtype=float)
+    return indices, values
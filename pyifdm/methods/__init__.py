@@ -12,4 +12,6 @@ from .if_vikor import ifVIKOR
 from .if_waspas import ifWASPAS
 from .if_wpm import ifWPM
 from .if_wsm import ifWSM
+from .result import Result
 from . import ifs
+from . import incremental
\ No newline at end of file
@@ -1,8 +1,13 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+from ...profiling import stage
+from ..ifs.normalization import apply_normalization
+from ..ifs.score import elementwise_score
+from ...workspace import Workspace
+from ...aggregation import multiply
 
-def ifs(matrix, weights, types, normalization, score):
+def ifs(matrix, weights, types, normalization, score, workspace=None):
     """
         Calculates the alternatives preferences based on Intuitionistic Fuzzy Sets
 
@@ -22,44 +27,48 @@ def ifs(matrix, weights, types, normalization, score):
                 Function used to calculate normalized decision matrix
 
             score : callable
-                Function used to calculate crisp score of IFS 
+                Function used to calculate crisp score of IFS
+
+            workspace: Workspace, default=None
+                Buffers for the intermediate arrays reused between the calls
         Returns
         -------
             ndarray
                 Crisp preferences of alternatives
 
     """
+    # buffers reused between the calls of the method object
+    workspace = Workspace() if workspace is None else workspace
+
     # optimal preference ranking
-    R = np.zeros((matrix.shape[1], matrix.shape[2]), dtype=object)
-    for j in range(matrix.shape[1]):
-        if types[j] == 1:
-            R[j] = matrix[np.argmax(matrix[:, j, 0]), j]
-        else:
-            R[j] = matrix[np.argmin(matrix[:, j, 0]), j]
-
-    # extended decision matrix
-    exmatrix = np.ones((matrix.shape[0]+1, matrix.shape[1], matrix.shape[2]), dtype=object)
-    exmatrix[0] = R
-    exmatrix[1:] = matrix
+    with stage('ARAS', 'ideal'):
+        R = workspace.get('R', (matrix.shape[1], matrix.shape[2]))
+        for j in range(matrix.shape[1]):
+            if types[j] == 1:
+                R[j] = matrix[np.argmax(matrix[:, j, 0]), j]
+            else:
+                R[j] = matrix[np.argmin(matrix[:, j, 0]), j]
+
+        # extended decision matrix
+        exmatrix = workspace.get('exmatrix', (matrix.shape[0]+1, matrix.shape[1], matrix.shape[2]))
+        exmatrix[0] = R
+        exmatrix[1:] = matrix
 
     # normalized matrix
-    nmatrix = normalization(exmatrix, types)
+    with stage('ARAS', 'normalization'):
+        nmatrix = apply_normalization(normalization, exmatrix, types, out=workspace.get('nmatrix', exmatrix.shape))
 
     # weighted normalized matrix
-    wmatrix = np.zeros((nmatrix.shape[0], nmatrix.shape[1], nmatrix.shape[2]), dtype=object)
-
-    # crisp weights
-    if weights.ndim == 1:
-        weights = np.repeat(weights, 2).reshape((len(weights), 2))
-
-    wmatrix[:, :, 0] = 1 - (1 - nmatrix[:, :, 0])**weights[:, 0]
-    wmatrix[:, :, 1] = nmatrix[:, :, 1]**weights[:, 1]
+    with stage('ARAS', 'weighting'):
+        wmatrix = multiply(nmatrix, weights, axis=1, out=workspace.get('wmatrix', nmatrix.shape))
 
     # score values
-    S = score(wmatrix)
+    with stage('ARAS', 'score'):
+        S = elementwise_score(score, wmatrix, out=workspace.get('S', wmatrix.shape[:2]))
 
     # overal performance rating
-    M = np.sum(S, axis=1)
+    with stage('ARAS', 'aggregation'):
+        M = np.sum(S, axis=1)
 
-    Q = M[1:] / M[0]
-    return Q
+        Q = M[1:] / M[0]
+        return Q
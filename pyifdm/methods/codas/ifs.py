@@ -1,8 +1,82 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+from ...profiling import stage
+from ..ifs.normalization import apply_normalization
+from ...workspace import Workspace
+from ..ifs.distance import elementwise_distance
+from ...backend import get_backend, jit
+
+@jit
+def _assessment_score(D1, D2, tau):
+    # assessment score accumulated without the relative assessment matrix
+    AS = np.zeros_like(D1)
+    for i in range(D1.shape[0]):
+        for k in range(D1.shape[0]):
+            d = D1[i] - D1[k]
+            AS[i] += d
+            if abs(d) >= tau:
+                AS[i] += D2[i] - D2[k]
+    return AS
+
+def _count_leading(condition, m):
+    # binary search of the number of leading sorted alternatives meeting the condition for each alternative,
+    # the condition is met for the beginning of the sorted alternatives only
+    low, high = np.zeros(m, dtype=int), np.full(m, m)
+    while np.any(low < high):
+        mid = (low + high) // 2
+        met = condition(np.minimum(mid, m - 1)) & (low < high)
+        low = np.where(met, mid + 1, low)
+        high = np.where(~met & (low < high), mid, high)
+    return low
+
+def _sorted_assessment_score(D1, D2, tau):
+    # assessment score calculated without the relative assessment matrix, differences D1[i] - D1[k]
+    # do not increase for the sorted D1[k], so the alternatives with the difference not less than tau
+    # are placed at the beginning, and the alternatives with the difference not greater than -tau at the end
+    m = D1.shape[0]
+    order = np.argsort(D1, kind='stable')
+    s = D1[order]
+    prefix = np.concatenate(([0], np.cumsum(D2[order])))
+
+    if tau <= 0:
+        lo, hi = np.full(m, m), np.full(m, m)
+    else:
+        lo = _count_leading(lambda k: D1 - s[k] >= tau, m)
+        hi = _count_leading(lambda k: D1 - s[k] > -tau, m)
+
+    AS = m * D1 - np.sum(D1)
+    AS += (lo + m - hi) * D2 - (prefix[lo] + prefix[m] - prefix[hi])
+    return AS
 
-def ifs(matrix, weights, types, normalization, distance_1, distance_2, tau):
+def relative_assessment(D1, D2, tau, out=None):
+    """
+        Calculates the relative assessment matrix of alternatives
+
+        Parameters
+        ----------
+            D1 : ndarray
+                Distances of alternatives from the negative ideal solution calculated with the first distance
+
+            D2 : ndarray
+                Distances of alternatives from the negative ideal solution calculated with the second distance
+
+            tau : float
+                Threshold parameter, from 0.01 to 0.05
+
+            out : ndarray, default=None
+                Array to store the relative assessment matrix
+
+        Returns
+        -------
+            ndarray
+                Relative assessment matrix
+    """
+    RA = np.subtract.outer(D1, D1, out=out)
+    RA += (np.abs(RA) >= tau) * np.subtract.outer(D2, D2)
+    return RA
+
+def ifs(matrix, weights, types, normalization, distance_1, distance_2, tau, workspace=None):
     """
         Calculates the alternatives preferences based on Intuitionistic Fuzzy Sets
 
@@ -30,21 +104,18 @@ def ifs(matrix, weights, types, normalization, distance_1, distance_2, tau):
             tau: float
                 Threshold parameter
 
+            workspace: Workspace, default=None
+                Buffers for the intermediate arrays reused between the calls
+
         Returns
         -------
             ndarray
                 Crisp preferences of alternatives
 
     """
-    def _psi(ifs, tau=tau):
-        # tau from 0.01 to 0.05
-        if np.abs(ifs) >= tau:
-            return 1
-        return 0
-
-    def calculate_distance(method, wmatrix, Am, f):
+    def calculate_distance(method, wmatrix, Am, f, out, result):
         """
-            Calculates the distance between two Intuitionistic Fuzzy Sets (u, v) using given distance measure
+            Calculates the distances between alternatives and negative ideal solution using given distance measure
 
             Parameters
             ----------
@@ -60,65 +131,69 @@ def ifs(matrix, weights, types, normalization, distance_1, distance_2, tau):
                 f : float
                     Multiplication factor
 
+                out : ndarray
+                    Array to store the distances of alternatives for each criterion
+
+                result : ndarray
+                    Array to store the distances of alternatives
+
             Returns
             -------
-                float
-                    Crisp value representing distance
+                ndarray
+                    Crisp values representing distances of alternatives
         """
+        d = np.sum(elementwise_distance(method, wmatrix, Am, out=out), axis=1, out=result)
         if method.__name__ == 'normalized_euclidean_distance':
-            return np.sqrt(f * np.sum([method(wmatrix[j], Am[j])
-                            for j in range(wmatrix.shape[0])]))
+            d *= f
+            np.sqrt(d, out=d)
         elif method.__name__ == 'normalized_hamming_distance':
-            return f * np.sum([method(wmatrix[j], Am[j])
-                            for j in range(wmatrix.shape[0])])
-        else:
-            return np.sum([method(wmatrix[j], Am[j])
-                            for j in range(wmatrix.shape[0])])
+            d *= f
+        return d
+
+    # buffers reused between the calls of the method object
+    workspace = Workspace() if workspace is None else workspace
 
     # normalized matrix
-    nmatrix = normalization(matrix, types)
+    with stage('CODAS', 'normalization'):
+        nmatrix = apply_normalization(normalization, matrix, types, out=workspace.get('nmatrix', matrix.shape))
 
     # weighted normalized matrix
-    wmatrix = np.zeros((nmatrix.shape[0], nmatrix.shape[1], 3), dtype=object)
-    
-    # transform crisp weights to ifs
-    if weights.ndim == 1:
-        weights = np.repeat(weights, 2).reshape((len(weights), 2))
+    with stage('CODAS', 'weighting'):
+        wmatrix = workspace.get('wmatrix', (nmatrix.shape[0], nmatrix.shape[1], 3))
 
-    wmatrix[:, :, 0] = nmatrix[:, :, 0] * weights[:, 0]
-    wmatrix[:, :, 1] = nmatrix[:, :, 1] + weights[:, 1] - nmatrix[:, :, 1] * weights[:, 1]
-    wmatrix[:, :, 2] = 1 - wmatrix[:, :, 0] - wmatrix[:, :, 1]
+        # transform crisp weights to ifs
+        if weights.ndim == 1:
+            weights = np.repeat(weights, 2).reshape((len(weights), 2))
+
+        wmatrix[:, :, 0] = nmatrix[:, :, 0] * weights[:, 0]
+        wmatrix[:, :, 1] = nmatrix[:, :, 1] + weights[:, 1] - nmatrix[:, :, 1] * weights[:, 1]
+        wmatrix[:, :, 2] = 1 - wmatrix[:, :, 0] - wmatrix[:, :, 1]
 
     # negative ideal solution
-    Am = np.zeros((wmatrix.shape[1], 3), dtype=object)
-    # profit criteria
-    Am[types==1, 0] = np.min(wmatrix[:, types==1, 0], axis=0)
-    Am[types==1, 1] = np.max(wmatrix[:, types==1, 1], axis=0)
-    Am[types==1, 2] = 1 - Am[types==1, 0] - Am[types==1, 1]
-    # cost criteria
-    Am[types==-1, 0] = np.max(wmatrix[:, types==-1, 0], axis=0)
-    Am[types==-1, 1] = np.min(wmatrix[:, types==-1, 1], axis=0)
-    Am[types==-1, 2] = 1 - Am[types==-1, 0] - Am[types==-1, 1]
-
-    f1, f2 = 1, 1
-    if 'normalized' in distance_1.__name__:
-        f1 = 1/(2*matrix.shape[1])
-    if 'normalized' in distance_2.__name__:
-        f2 = 1/(2*matrix.shape[1])
-
-    # distances
-    D1, D2 = np.zeros((wmatrix.shape[0], 1), dtype=object), np.zeros((wmatrix.shape[0], 1), dtype=object)
-    for i in range(wmatrix.shape[0]):
-        D1[i] = calculate_distance(distance_1, wmatrix[i], Am, f1)
-        D2[i] = calculate_distance(distance_2, wmatrix[i], Am, f2)
-        
-    # relative assessment matrix
-    RA = np.zeros((matrix.shape[0], matrix.shape[0]))
-    for i in range(RA.shape[0]):
-        for j in range(RA.shape[1]):
-            RA[i, j] = (D1[i] - D1[j]) + \
-                (_psi(D1[i] - D1[j]) * (D2[i] - D2[j]))
-
-    # assessment score
-    AS = np.sum(RA, axis=1)
-    return AS
+    with stage('CODAS', 'ideal'):
+        Am = workspace.get('Am', (wmatrix.shape[1], 3))
+        # profit criteria
+        Am[types==1, 0] = np.min(wmatrix[:, types==1, 0], axis=0)
+        Am[types==1, 1] = np.max(wmatrix[:, types==1, 1], axis=0)
+        Am[types==1, 2] = 1 - Am[types==1, 0] - Am[types==1, 1]
+        # cost criteria
+        Am[types==-1, 0] = np.max(wmatrix[:, types==-1, 0], axis=0)
+        Am[types==-1, 1] = np.min(wmatrix[:, types==-1, 1], axis=0)
+        Am[types==-1, 2] = 1 - Am[types==-1, 0] - Am[types==-1, 1]
+
+    with stage('CODAS', 'distance'):
+        f1, f2 = 1, 1
+        if 'normalized' in distance_1.__name__:
+            f1 = 1/(2*matrix.shape[1])
+        if 'normalized' in distance_2.__name__:
+            f2 = 1/(2*matrix.shape[1])
+
+        # distances
+        D1 = calculate_distance(distance_1, wmatrix, Am, f1, workspace.get('distances', wmatrix.shape[:2]), workspace.get('D1', wmatrix.shape[:1]))
+        D2 = calculate_distance(distance_2, wmatrix, Am, f2, workspace.get('distances', wmatrix.shape[:2]), workspace.get('D2', wmatrix.shape[:1]))
+
+    with stage('CODAS', 'aggregation'):
+        # assessment score calculated without the relative assessment matrix of size m x m
+        if get_backend() == 'numba':
+            return _assessment_score(D1, D2, tau)
+        return _sorted_assessment_score(D1, D2, tau)
@@ -2,8 +2,12 @@
 # Copyright (c) 2022 Bartłomiej Kizielewicz
 
 import numpy as np
+from ...profiling import stage
+from ..ifs.normalization import apply_normalization
+from ..ifs.score import elementwise_score
+from ...workspace import Workspace
 
-def ifs(matrix, weights, types, normalization, score):
+def ifs(matrix, weights, types, normalization, score, workspace=None):
     """
         Calculates the alternatives preferences based on Intuitionistic Fuzzy Sets
 
@@ -25,6 +29,9 @@ def ifs(matrix, weights, types, normalization, score):
             score: callable
                 Function used to calculate crisp score of IFS
 
+            workspace: Workspace, default=None
+                Buffers for the intermediate arrays reused between the calls
+
         Returns
         -------
             ndarray
@@ -32,31 +39,39 @@ def ifs(matrix, weights, types, normalization, score):
 
     """
 
+    # buffers reused between the calls of the method object
+    workspace = Workspace() if workspace is None else workspace
+
     # normalized matrix
-    if normalization is not None:
-        nmatrix = normalization(matrix, types)
-    else:
-        nmatrix = matrix.copy()
+    with stage('COPRAS', 'normalization'):
+        if normalization is not None:
+            nmatrix = apply_normalization(normalization, matrix, types, out=workspace.get('nmatrix', matrix.shape))
+        else:
+            nmatrix = matrix
 
     # weighted matrix
-    wmatrix = np.zeros(nmatrix.shape)
+    with stage('COPRAS', 'weighting'):
+        wmatrix = workspace.get('wmatrix', nmatrix.shape)
+        wmatrix[:, :, 2:] = 0
 
-    # crisp weights
-    if weights.ndim == 1:
-        weights = np.repeat(weights, 2).reshape((len(weights), 2))
+        # crisp weights
+        if weights.ndim == 1:
+            weights = np.repeat(weights, 2).reshape((len(weights), 2))
 
-    wmatrix[:, :, 0] = np.sqrt(1 - (1 - nmatrix[:, :, 0] ** 2) ** weights[:, 0])
-    wmatrix[:, :, 1] = np.sqrt((nmatrix[:, :, 1] ** 2) ** weights[:, 1])
+        wmatrix[:, :, 0] = np.sqrt(1 - (1 - nmatrix[:, :, 0] ** 2) ** weights[:, 0])
+        wmatrix[:, :, 1] = np.sqrt((nmatrix[:, :, 1] ** 2) ** weights[:, 1])
 
     # Score function
-    s = score(wmatrix)
+    with stage('COPRAS', 'score'):
+        s = elementwise_score(score, wmatrix, out=workspace.get('s', wmatrix.shape[:2]))
 
     # Determine the maximizing and minimizing index
-    Sp = np.sum(s[:, types == 1], axis=1) / types[types == 1].shape
-    Sr = np.sum(s[:, types == -1], axis=1) / types[types == -1].shape
+    with stage('COPRAS', 'aggregation'):
+        Sp = np.mean(s[:, types == 1], axis=1)
+        Sr = np.mean(s[:, types == -1], axis=1)
 
-    # Determine the relative significance value of each alternative
-    N = np.sum(np.exp(Sr)) / np.sum(1 / np.exp(Sr))
-    Q =  Sp + (N / np.exp(Sr))
+        # Determine the relative significance value of each alternative
+        N = np.sum(np.exp(Sr)) / np.sum(1 / np.exp(Sr))
+        Q =  Sp + (N / np.exp(Sr))
 
-    return Q / np.max(Q)
+        return Q / np.max(Q)
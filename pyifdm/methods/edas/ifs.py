@@ -1,8 +1,12 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+from ...profiling import stage
+from ..ifs.normalization import apply_normalization
+from ...workspace import Workspace
+from ...precision import get_dtype
 
-def ifs(matrix, weights, types, normalization, score):
+def ifs(matrix, weights, types, normalization, score, workspace=None):
     """
         Calculates the alternatives preferences based on Intuitionistic Fuzzy Sets
 
@@ -24,6 +28,9 @@ def ifs(matrix, weights, types, normalization, score):
             score: callable
                 Function used to calculate crisp score of IFS
 
+            workspace: Workspace, default=None
+                Buffers for the intermediate arrays reused between the calls
+
         Returns
         -------
             ndarray
@@ -31,31 +38,39 @@ def ifs(matrix, weights, types, normalization, score):
 
     """
     
+    # buffers reused between the calls of the method object
+    workspace = Workspace() if workspace is None else workspace
+
     # normalized matrix
-    nmatrix = normalization(matrix, types)
+    with stage('EDAS', 'normalization'):
+        nmatrix = apply_normalization(normalization, matrix, types, out=workspace.get('nmatrix', matrix.shape))
 
     # average solution
-    av = np.array([[1 - (np.prod(1 - nmatrix[:, j, 0]))**(1/nmatrix.shape[0]),
-                  (np.prod(nmatrix[:, j, 1]))**(1/nmatrix.shape[0])] for j in range(nmatrix.shape[1])])
+    with stage('EDAS', 'ideal'):
+        av = np.array([[1 - (np.prod(1 - nmatrix[:, j, 0]))**(1/nmatrix.shape[0]),
+                      (np.prod(nmatrix[:, j, 1]))**(1/nmatrix.shape[0])] for j in range(nmatrix.shape[1])])
 
     # positive and negative distances from average
-    pda, nda = np.zeros((nmatrix.shape[0], nmatrix.shape[1])), np.zeros((nmatrix.shape[0], nmatrix.shape[1]))
-    for i in range(nmatrix.shape[0]):
-        for j in range(nmatrix.shape[1]):
-            pda[i, j] = np.max([0, (score(nmatrix[i, j]) - score(av[j]))]) / score(av[j])
-            nda[i, j] = np.max([0, (score(av[j]) - score(nmatrix[i, j]))]) / score(av[j])
+    with stage('EDAS', 'distance'):
+        pda, nda = workspace.get('pda', nmatrix.shape[:2]), workspace.get('nda', nmatrix.shape[:2])
+        for i in range(nmatrix.shape[0]):
+            for j in range(nmatrix.shape[1]):
+                pda[i, j] = np.maximum(0, (score(nmatrix[i, j]) - score(av[j]))) / score(av[j])
+                nda[i, j] = np.maximum(0, (score(av[j]) - score(nmatrix[i, j]))) / score(av[j])
 
     # crisp weights
-    if weights.ndim == 2:
-        weights = np.array([score(w) for w in weights])
+    with stage('EDAS', 'weighting'):
+        if weights.ndim == 2:
+            weights = np.array([score(w) for w in weights])
 
-    # weighted positive and negative distances
-    sp = np.sum(weights * pda, axis=1)
-    sn = np.sum(weights * nda, axis=1)
+        # weighted positive and negative distances
+        sp = np.sum(weights * pda, axis=1)
+        sn = np.sum(weights * nda, axis=1)
 
     # normalized weighted positive and negative distances
-    nsp = sp / np.max(sp) if np.max(sp) != 0 else np.zeros((sp.shape))
-    nsn = 1 - sn / np.max(sn) if np.max(sn) != 0 else np.zeros((sn.shape))
+    with stage('EDAS', 'aggregation'):
+        nsp = sp / np.max(sp) if np.max(sp) != 0 else np.zeros(sp.shape, dtype=get_dtype())
+        nsn = 1 - sn / np.max(sn) if np.max(sn) != 0 else np.zeros(sn.shape, dtype=get_dtype())
 
-    # appraisal score
-    return 1/2 * (nsp + nsn)
+        # appraisal score
+        return 1/2 * (nsp + nsn)
@@ -1,11 +1,16 @@
 # Copyright (c) 2022 Jakub Więckowski
 
-from .codas.ifs import ifs
+from .codas.ifs import ifs, relative_assessment
 from .ifs.normalization import swap_normalization
 from .ifs.distance import euclidean_distance, hamming_distance
-from ..helpers import rank
+from ..helpers import rank, top_k
+from ..encoding import EncodedMatrix
+from ..precision import as_float
+from ..metrics import instrument
+from ..workspace import Workspace
 
 from .validator import Validator
+from .result import Result, collect_intermediates
 
 
 class ifCODAS():
@@ -33,6 +38,7 @@ class ifCODAS():
         self.distance_1 = distance_1
         self.distance_2 = distance_2
         self.tau = tau
+        self.workspace = Workspace()
         self.__descending = True
 
     def __call__(self, matrix, weights, types):
@@ -57,11 +63,57 @@ class ifCODAS():
             ndarray:
                 Preference calculated for alternatives. Greater values are placed higher in ranking
         """
+        self.preferences = self._evaluate(matrix, weights, types, self.workspace)
+        return self.preferences
+
+    def evaluate(self, matrix, weights, types, explain=False):
+        """
+        Calculates the alternatives preferences without storing them in the method object.
+        Buffers of the calculations are allocated for each call, so the method object can be shared between threads.
+
+        Parameters
+        ----------
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            weights : ndarray
+                Vector of criteria weights in a crisp or Intuitionistic Fuzzy form
+
+            types : ndarray
+                Types of criteria, 1 profit, -1 cost.
+                Criteria types cannot be all profit or all cost.
+
+            explain : bool or iterable, default=False
+                Intermediate arrays of the calculations included in the result, True for all except the arrays of size m x m,
+                which are calculated only if given by name
+
+        Returns
+        ----------
+            Result:
+                Preferences and ranking of alternatives
+        """
+        workspace = Workspace()
+        preferences = self._evaluate(matrix, weights, types, workspace)
+
+        # relative assessment matrix of size m x m is not needed for the preferences, it is calculated only if requested
+        D1, D2, tau = workspace['D1'], workspace['D2'], self.tau
+        lazy = {'RA': lambda: relative_assessment(D1, D2, tau)}
+        return Result(preferences, self.__descending, collect_intermediates(workspace, explain, lazy))
+
+    @instrument('CODAS')
+    def _evaluate(self, matrix, weights, types, workspace):
         # validate data
         Validator.ifs_validation(matrix, weights, types, mixed_types=True)
 
-        self.preferences = ifs(matrix, weights, types, self.normalization, self.distance_1, self.distance_2, self.tau).astype(float)
-        return self.preferences
+        # decode matrix given in the compact form
+        if isinstance(matrix, EncodedMatrix):
+            matrix = matrix.decode()
+
+        # cast data to the floating point type of calculations
+        matrix, weights = as_float(matrix), as_float(weights)
+
+        return as_float(ifs(matrix, weights, types, self.normalization, self.distance_1, self.distance_2, self.tau, workspace=workspace))
 
     def rank(self):
         """
@@ -77,4 +129,25 @@ class ifCODAS():
         except AttributeError:
             raise AttributeError('Cannot calculate ranking before assessment')
         except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+            raise ValueError('Error occurred in ranking calculation')
+
+    def top_k(self, k):
+        """
+            Selects the k best alternatives based on the obtained preferences, without sorting all of them.
+            Alternatives with equal preferences are ordered by their index, the lower index is placed first.
+
+            Parameters
+            ----------
+                k : int
+                    Number of selected alternatives
+
+            Returns
+            ----------
+                ndarray:
+                    Indices of the k best alternatives, starting from the best one
+        """
+        try:
+            preferences = self.preferences
+        except AttributeError:
+            raise AttributeError('Cannot select alternatives before assessment')
+        return top_k(preferences, k, self.__descending)
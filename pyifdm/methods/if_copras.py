@@ -2,9 +2,14 @@
 
 from .copras.ifs import ifs
 from .ifs.score import thakur_score
-from ..helpers import rank
+from ..helpers import rank, top_k
+from ..encoding import EncodedMatrix
+from ..precision import as_float
+from ..metrics import instrument
+from ..workspace import Workspace
 
 from .validator import Validator
+from .result import Result, collect_intermediates
 
 
 class ifCOPRAS():
@@ -24,6 +29,7 @@ class ifCOPRAS():
 
         self.score = score
         self.normalization = normalization
+        self.workspace = Workspace()
         self.__descending = True
 
     def __call__(self, matrix, weights, types):
@@ -47,11 +53,52 @@ class ifCOPRAS():
             ndarray:
                 Preference calculated for alternatives. Greater values are placed higher in ranking
         """
+        self.preferences = self._evaluate(matrix, weights, types, self.workspace)
+        return self.preferences
+
+    def evaluate(self, matrix, weights, types, explain=False):
+        """
+        Calculates the alternatives preferences without storing them in the method object.
+        Buffers of the calculations are allocated for each call, so the method object can be shared between threads.
+
+        Parameters
+        ----------
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            weights : ndarray
+                Vector of criteria weights in a crisp or Intuitionistic Fuzzy form
+
+            types : ndarray
+                Types of criteria, 1 profit, -1 cost
+
+            explain : bool or iterable, default=False
+                Intermediate arrays of the calculations included in the result, True for all except the arrays of size m x m,
+                which are calculated only if given by name
+
+        Returns
+        ----------
+            Result:
+                Preferences and ranking of alternatives
+        """
+        workspace = Workspace()
+        preferences = self._evaluate(matrix, weights, types, workspace)
+        return Result(preferences, self.__descending, collect_intermediates(workspace, explain))
+
+    @instrument('COPRAS')
+    def _evaluate(self, matrix, weights, types, workspace):
         # validate data
         Validator.ifs_validation(matrix, weights, types)
 
-        self.preferences = ifs(matrix, weights, types, self.normalization, self.score).astype(float)
-        return self.preferences
+        # decode matrix given in the compact form
+        if isinstance(matrix, EncodedMatrix):
+            matrix = matrix.decode()
+
+        # cast data to the floating point type of calculations
+        matrix, weights = as_float(matrix), as_float(weights)
+
+        return as_float(ifs(matrix, weights, types, self.normalization, self.score, workspace=workspace))
 
     def rank(self):
         """
@@ -67,4 +114,25 @@ class ifCOPRAS():
         except AttributeError:
             raise AttributeError('Cannot calculate ranking before assessment')
         except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+            raise ValueError('Error occurred in ranking calculation')
+
+    def top_k(self, k):
+        """
+            Selects the k best alternatives based on the obtained preferences, without sorting all of them.
+            Alternatives with equal preferences are ordered by their index, the lower index is placed first.
+
+            Parameters
+            ----------
+                k : int
+                    Number of selected alternatives
+
+            Returns
+            ----------
+                ndarray:
+                    Indices of the k best alternatives, starting from the best one
+        """
+        try:
+            preferences = self.preferences
+        except AttributeError:
+            raise AttributeError('Cannot select alternatives before assessment')
+        return top_k(preferences, k, self.__descending)
@@ -2,9 +2,14 @@
 
 from .ocra.ifs import ifs
 from .ifs.score import chen_score_1
-from ..helpers import rank
+from ..helpers import rank, top_k
+from ..encoding import EncodedMatrix
+from ..precision import as_float
+from ..metrics import instrument
+from ..workspace import Workspace
 
 from .validator import Validator
+from .result import Result, collect_intermediates
 
 class ifOCRA():
     def __init__(self, score=chen_score_1):
@@ -43,11 +48,50 @@ class ifOCRA():
             ndarray:
                 Preference calculated for alternatives. Greater values are placed higher in ranking
         """
+        self.preferences = self._evaluate(matrix, weights, types)
+        return self.preferences
+
+    def evaluate(self, matrix, weights, types, explain=False):
+        """
+        Calculates the alternatives preferences without storing them in the method object.
+        The method object is not modified, so it can be shared between threads.
+
+        Parameters
+        ----------
+            matrix : ndarray
+                Decision matrix / alternatives data.
+                Alternatives are in rows and Criteria are in columns.
+
+            weights : ndarray
+                Vector of criteria weights in a crisp or Intuitionistic Fuzzy form
+
+            types : ndarray
+                Types of criteria, 1 profit, -1 cost.
+                Criteria types cannot be all profit or all cost.
+
+            explain : bool or iterable, default=False
+                Intermediate arrays of the calculations included in the result, True for all except the arrays of size m x m,
+                which are calculated only if given by name
+
+        Returns
+        ----------
+            Result:
+                Preferences and ranking of alternatives
+        """
+        # method does not keep the intermediate arrays
+        return Result(self._evaluate(matrix, weights, types), self.__descending, collect_intermediates(Workspace(), explain))
+
+    @instrument('OCRA')
+    def _evaluate(self, matrix, weights, types):
         # validate data
         Validator.ifs_validation(matrix, weights, types)
 
-        self.preferences = ifs(matrix, weights, types, self.score).astype(float)
-        return self.preferences
+        # cast data to the floating point type of calculations, encoded matrix is handled by the method
+        if not isinstance(matrix, EncodedMatrix):
+            matrix = as_float(matrix)
+        weights = as_float(weights)
+
+        return as_float(ifs(matrix, weights, types, self.score))
 
     def rank(self):
         """
@@ -63,4 +107,25 @@ class ifOCRA():
         except AttributeError:
             raise AttributeError('Cannot calculate ranking before assessment')
         except:
-            raise ValueError('Error occurred in ranking calculation')
\ No newline at end of file
+            raise ValueError('Error occurred in ranking calculation')
+
+    def top_k(self, k):
+        """
+            Selects the k best alternatives based on the obtained preferences, without sorting all of them.
+            Alternatives with equal preferences are ordered by their index, the lower index is placed first.
+
+            Parameters
+            ----------
+                k : int
+                    Number of selected alternatives
+
+            Returns
+            ----------
+                ndarray:
+                    Indices of the k best alternatives, starting from the best one
+        """
+        try:
+            preferences = self.preferences
+        except AttributeError:
+            raise AttributeError('Cannot select alternatives before assessment')
+        return top_k(preferences, k, self.__descending)
@@ -1,6 +1,7 @@
 # Copyright (c) 2022-2023 Jakub Więckowski
 
 import numpy as np
+from ...precision import as_float, get_dtype
 
 __all__ = [
     'euclidean_distance',
@@ -16,7 +17,15 @@ __all__ = [
 ]
 
 
-def euclidean_distance(a, b):
+def _result(d, out):
+    # distances are calculated over the last axis of the arrays with IFS, the result is cast since
+    # numpy 1.x promotes float32 scalars to float64, and indexing with [()] gives a scalar for a single pair of IFS
+    if out is not None:
+        return out
+    return as_float(d)[()]
+
+
+def euclidean_distance(a, b, out=None):
     """
         Calculates the distance between two Intuitionistic Fuzzy Sets (u, v) using Euclidean distance
 
@@ -28,21 +37,28 @@ def euclidean_distance(a, b):
             b : ndarray
                 Intuitionistic Fuzzy Sets (u, v)
 
+            out : ndarray, default=None
+                Array to store the distances calculated for the arrays of IFS
+
         Returns
         -------
             float
                 Crisp value representing distance
     """
-    
-    if len(a) == 2 or len(b) == 2:
-        ap = 1 - a[0] - a[1]
-        bp = 1 - b[0] - b[1]
+    # cast types
+    a = as_float(a)
+    b = as_float(b)
+
+    if a.shape[-1] == 2 or b.shape[-1] == 2:
+        ap = 1 - a[..., 0] - a[..., 1]
+        bp = 1 - b[..., 0] - b[..., 1]
     else:
-        ap, bp = a[2], b[2]
+        ap, bp = a[..., 2], b[..., 2]
 
-    return np.sqrt(((a[0] - b[0])**2 + (a[1] - b[1])**2 + (ap - bp)**2) / 2)
+    d = np.sqrt(((a[..., 0] - b[..., 0])**2 + (a[..., 1] - b[..., 1])**2 + (ap - bp)**2) / 2, out=out)
+    return _result(d, out)
 
-def grzegorzewski_distance(a, b):
+def grzegorzewski_distance(a, b, out=None):
     """
         Calculates the distance between two Intuitionistic Fuzzy Sets (u, v) using Grzegorzewski distance
 
@@ -54,15 +70,22 @@ def grzegorzewski_distance(a, b):
             b : ndarray
                 Intuitionistic Fuzzy Sets (u, v)
 
+            out : ndarray, default=None
+                Array to store the distances calculated for the arrays of IFS
+
         Returns
         -------
             float
                 Crisp value representing distance
     """
+    # cast types
+    a = as_float(a)
+    b = as_float(b)
 
-    return np.max([np.abs(a[0] - b[0]), np.abs(a[1] - b[1])])
+    d = np.maximum(np.abs(a[..., 0] - b[..., 0]), np.abs(a[..., 1] - b[..., 1]), out=out)
+    return _result(d, out)
 
-def hamming_distance(a, b):
+def hamming_distance(a, b, out=None):
     """
         Calculates the distance between two Intuitionistic Fuzzy Sets (u, v) using Hamming distance
 
@@ -74,21 +97,28 @@ def hamming_distance(a, b):
             b : ndarray
                 Intuitionistic Fuzzy Sets (u, v)
 
+            out : ndarray, default=None
+                Array to store the distances calculated for the arrays of IFS
+
         Returns
         -------
             float
                 Crisp value representing distance
     """
+    # cast types
+    a = as_float(a)
+    b = as_float(b)
 
-    if len(a) == 2 or len(b) == 2:
-        ap = 1 - a[0] - a[1]
-        bp = 1 - b[0] - b[1]
+    if a.shape[-1] == 2 or b.shape[-1] == 2:
+        ap = 1 - a[..., 0] - a[..., 1]
+        bp = 1 - b[..., 0] - b[..., 1]
     else:
-        ap, bp = a[2], b[2]
+        ap, bp = a[..., 2], b[..., 2]
 
-    return (np.abs(a[0] - b[0]) + np.abs(a[1] - b[1]) + np.abs(ap - bp)) / 2
+    d = np.divide(np.abs(a[..., 0] - b[..., 0]) + np.abs(a[..., 1] - b[..., 1]) + np.abs(ap - bp), 2, out=out)
+    return _result(d, out)
 
-def hausdorf_euclidean_distance(a, b):
+def hausdorf_euclidean_distance(a, b, out=None):
     """
         Calculates the distance between two Intuitionistic Fuzzy Sets (u, v) using Hausdorf measure-based Euclidean distance
 
@@ -100,15 +130,22 @@ def hausdorf_euclidean_distance(a, b):
             b : ndarray
                 Intuitionistic Fuzzy Sets (u, v)
 
+            out : ndarray, default=None
+                Array to store the distances calculated for the arrays of IFS
+
         Returns
         -------
             float
                 Crisp value representing distance
     """
+    # cast types
+    a = as_float(a)
+    b = as_float(b)
 
-    return np.max([(a[0] - b[0])**2, (a[1] - b[1])**2])
+    d = np.maximum((a[..., 0] - b[..., 0])**2, (a[..., 1] - b[..., 1])**2, out=out)
+    return _result(d, out)
 
-def luo_distance(a, b):
+def luo_distance(a, b, out=None):
     """
         Calculates the distance between two Intuitionistic Fuzzy Sets (u, v) using Luo distance
 
@@ -120,24 +157,31 @@ def luo_distance(a, b):
             b : ndarray
                 Intuitionistic Fuzzy Sets (u, v)
 
+            out : ndarray, default=None
+                Array to store the distances calculated for the arrays of IFS
+
         Returns
         -------
             float
                 Crisp value representing distance
     """
+    # cast types
+    a = as_float(a)
+    b = as_float(b)
 
-    if len(a) == 2 or len(b) == 2:
-        ap = 1 - a[0] - a[1]
-        bp = 1 - b[0] - b[1]
+    if a.shape[-1] == 2 or b.shape[-1] == 2:
+        ap = 1 - a[..., 0] - a[..., 1]
+        bp = 1 - b[..., 0] - b[..., 1]
     else:
-        ap, bp = a[2], b[2]
+        ap, bp = a[..., 2], b[..., 2]
 
-    l1 = (np.abs(a[0] - b[0]) + np.abs(a[1] - b[1]) + np.abs((a[0] + 1 - a[1]) - (b[0] + 1 - b[1]))) / 2
+    l1 = (np.abs(a[..., 0] - b[..., 0]) + np.abs(a[..., 1] - b[..., 1]) + np.abs((a[..., 0] + 1 - a[..., 1]) - (b[..., 0] + 1 - b[..., 1]))) / 2
     l2 = (ap - bp) / 2
-    l3 = np.max([np.abs(a[0] - b[0]), np.abs(a[1] - b[1]), np.abs(ap - bp)/2])
-    return 1/6 * (l1 + l2 + l3)
+    l3 = np.maximum(np.maximum(np.abs(a[..., 0] - b[..., 0]), np.abs(a[..., 1] - b[..., 1])), np.abs(ap - bp)/2)
+    d = np.multiply(1/6, l1 + l2 + l3, out=out)
+    return _result(d, out)
 
-def normalized_euclidean_distance(a, b):
+def normalized_euclidean_distance(a, b, out=None):
     """
         Calculates the distance between two Intuitionistic Fuzzy Sets (u, v) using normalized Euclidean distance
 
@@ -149,21 +193,28 @@ def normalized_euclidean_distance(a, b):
             b : ndarray
                 Intuitionistic Fuzzy Sets (u, v)
 
+            out : ndarray, default=None
+                Array to store the distances calculated for the arrays of IFS
+
         Returns
         -------
             float
                 Crisp value representing distance
     """
+    # cast types
+    a = as_float(a)
+    b = as_float(b)
 
-    if len(a) == 2 or len(b) == 2:
-        ap = 1 - a[0] - a[1]
-        bp = 1 - b[0] - b[1]
+    if a.shape[-1] == 2 or b.shape[-1] == 2:
+        ap = 1 - a[..., 0] - a[..., 1]
+        bp = 1 - b[..., 0] - b[..., 1]
     else:
-        ap, bp = a[2], b[2]
+        ap, bp = a[..., 2], b[..., 2]
 
-    return ((a[0] - b[0])**2 + (a[1] - b[1])**2 + (ap - bp)**2)
+    d = np.add((a[..., 0] - b[..., 0])**2 + (a[..., 1] - b[..., 1])**2, (ap - bp)**2, out=out)
+    return _result(d, out)
 
-def normalized_hamming_distance(a, b):
+def normalized_hamming_distance(a, b, out=None):
     """
         Calculates the distance between two Intuitionistic Fuzzy Sets (u, v) using normalized Hamming distance
 
@@ -175,21 +226,28 @@ def normalized_hamming_distance(a, b):
             b : ndarray
                 Intuitionistic Fuzzy Sets (u, v)
 
+            out : ndarray, default=None
+                Array to store the distances calculated for the arrays of IFS
+
         Returns
         -------
             float
                 Crisp value representing distance
     """
+    # cast types
+    a = as_float(a)
+    b = as_float(b)
 
-    if len(a) == 2 or len(b) == 2:
-        ap = 1 - a[0] - a[1]
-        bp = 1 - b[0] - b[1]
+    if a.shape[-1] == 2 or b.shape[-1] == 2:
+        ap = 1 - a[..., 0] - a[..., 1]
+        bp = 1 - b[..., 0] - b[..., 1]
     else:
-        ap, bp = a[2], b[2]
+        ap, bp = a[..., 2], b[..., 2]
 
-    return (np.abs(a[0] - b[0]) + np.abs(a[1] - b[1]) + np.abs(ap - bp))
+    d = np.add(np.abs(a[..., 0] - b[..., 0]) + np.abs(a[..., 1] - b[..., 1]), np.abs(ap - bp), out=out)
+    return _result(d, out)
 
-def wang_xin_distance_1(a, b):
+def wang_xin_distance_1(a, b, out=None):
     """
         Calculates the distance between two Intuitionistic Fuzzy Sets (u, v) using Wang Xin distance 1
 
@@ -201,15 +259,22 @@ def wang_xin_distance_1(a, b):
             b : ndarray
                 Intuitionistic Fuzzy Sets (u, v)
 
+            out : ndarray, default=None
+                Array to store the distances calculated for the arrays of IFS
+
         Returns
         -------
             float
                 Crisp value representing distance
     """
-    
-    return (np.abs(a[0] - b[0]) + np.abs(a[1] - b[1])) / 4 + np.max([np.abs(a[0] - b[0]), np.abs(a[1] - b[1])]) / 2
+    # cast types
+    a = as_float(a)
+    b = as_float(b)
+
+    d = np.add((np.abs(a[..., 0] - b[..., 0]) + np.abs(a[..., 1] - b[..., 1])) / 4, np.maximum(np.abs(a[..., 0] - b[..., 0]), np.abs(a[..., 1] - b[..., 1])) / 2, out=out)
+    return _result(d, out)
 
-def wang_xin_distance_2(a, b):
+def wang_xin_distance_2(a, b, out=None):
     """
         Calculates the distance between two Intuitionistic Fuzzy Sets (u, v) using Wang Xin distance 2
 
@@ -221,15 +286,22 @@ def wang_xin_distance_2(a, b):
             b : ndarray
                 Intuitionistic Fuzzy Sets (u, v)
 
+            out : ndarray, default=None
+                Array to store the distances calculated for the arrays of IFS
+
         Returns
         -------
             float
                 Crisp value representing distance
     """
+    # cast types
+    a = as_float(a)
+    b = as_float(b)
 
-    return (np.abs(a[0] - b[0])/2 + np.abs(a[1] - b[1])/2)
+    d = np.add(np.abs(a[..., 0] - b[..., 0])/2, np.abs(a[..., 1] - b[..., 1])/2, out=out)
+    return _result(d, out)
 
-def yang_chiclana_distance(a, b):
+def yang_chiclana_distance(a, b, out=None):
     """
         Calculates the distance between two Intuitionistic Fuzzy Sets (u, v) using Yang & Chiclana distance
 
@@ -241,17 +313,116 @@ def yang_chiclana_distance(a, b):
             b : ndarray
                 Intuitionistic Fuzzy Sets (u, v)
 
+            out : ndarray, default=None
+                Array to store the distances calculated for the arrays of IFS
+
         Returns
         -------
             float
                 Crisp value representing distance
     """
-    
-    if len(a) == 2 or len(b) == 2:
-        ap = 1 - a[0] - a[1]
-        bp = 1 - b[0] - b[1]
+    # cast types
+    a = as_float(a)
+    b = as_float(b)
+
+    if a.shape[-1] == 2 or b.shape[-1] == 2:
+        ap = 1 - a[..., 0] - a[..., 1]
+        bp = 1 - b[..., 0] - b[..., 1]
     else:
-        ap, bp = a[2], b[2]
+        ap, bp = a[..., 2], b[..., 2]
+
+    d = np.maximum(np.abs(a[..., 0] - b[..., 0]), np.abs(a[..., 1] - b[..., 1]) * np.abs(ap - bp), out=out)
+    return _result(d, out)
+
+
+# distance functions evaluated at once for the arrays of IFS
+VECTORIZED_DISTANCES = (
+    euclidean_distance,
+    grzegorzewski_distance,
+    hamming_distance,
+    hausdorf_euclidean_distance,
+    luo_distance,
+    normalized_euclidean_distance,
+    normalized_hamming_distance,
+    wang_xin_distance_1,
+    wang_xin_distance_2,
+    yang_chiclana_distance
+)
+
+
+def elementwise_distance(distance, a, b, out=None):
+    """
+        Calculates distances between the corresponding Intuitionistic Fuzzy Sets of two arrays.
+        The arrays are broadcast over all axes except the last one with IFS. Distances from this module
+        are evaluated at once, other functions are evaluated for each pair of IFS.
+
+        Parameters
+        ----------
+            distance : callable
+                Function used to calculate distance between two IFS
+
+            a : ndarray
+                Array with Intuitionistic Fuzzy Sets (u, v)
+
+            b : ndarray
+                Array with Intuitionistic Fuzzy Sets (u, v)
+
+            out : ndarray, default=None
+                Array to store the distances
+
+        Returns
+        -------
+            ndarray
+                Array with crisp distances
+    """
+    a = as_float(a)
+    b = as_float(b)
+
+    if distance in VECTORIZED_DISTANCES:
+        return as_float(distance(a, b, out=out))
+
+    shape = np.broadcast_shapes(a.shape[:-1], b.shape[:-1])
+    a = np.broadcast_to(a, shape + a.shape[-1:])
+    b = np.broadcast_to(b, shape + b.shape[-1:])
+    if out is None:
+        out = np.zeros(shape, dtype=get_dtype())
+    for idx in np.ndindex(shape):
+        out[idx] = distance(a[idx], b[idx])
+    return out
 
-    return np.max([np.abs(a[0] - b[0]), np.abs(a[1] - b[1]) * np.abs(ap - bp)])
 
+def pairwise_distance(A, B, distance, block_size=2**20):
+    """
+        Calculates distance of each profile of Intuitionistic Fuzzy Sets from A to each profile from B.
+        Distance between profiles is the sum of the distances of IFS over the criteria,
+        calculated in blocks of rows of A.
+
+        Parameters
+        ----------
+            A : ndarray
+                Profiles of Intuitionistic Fuzzy Sets, of shape (p, n, 2|3)
+
+            B : ndarray
+                Profiles of Intuitionistic Fuzzy Sets, of shape (q, n, 2|3)
+
+            distance : callable
+                Function used to calculate distance between two IFS
+
+            block_size : int, default=2**20
+                Largest number of pairs of IFS compared at once, limits the memory used by the calculations
+
+        Returns
+        -------
+            ndarray
+                Distances of the profiles, of shape (p, q)
+    """
+    A = as_float(A)
+    B = as_float(B)
+    if A.ndim != 3 or B.ndim != 3 or A.shape[1:] != B.shape[1:]:
+        raise ValueError('Profiles should be given as arrays of shape (p, n, 2|3) and (q, n, 2|3) with the same number of criteria')
+
+    out = np.zeros((A.shape[0], B.shape[0]), dtype=get_dtype())
+    rows = max(1, block_size // max(1, B.shape[0] * A.shape[1]))
+    for start in range(0, A.shape[0], rows):
+        np.sum(elementwise_distance(distance, A[start:start + rows, np.newaxis], B[np.newaxis]), axis=-1, out=out[start:start + rows])
+    return out
@@ -1,6 +1,7 @@
 # Copyright (c) 2022-2023 Jakub Więckowski
 
 import numpy as np
+from ...precision import get_dtype
 
 __all__ = [
     'ecer_normalization',
@@ -10,7 +11,19 @@ __all__ = [
     'swap_normalization',
 ]
 
-def ecer_normalization(matrix, types):
+
+def _output(matrix, out, copy):
+    # normalized matrix is written to the given array or to a new one
+    if out is None:
+        return np.array(matrix, dtype=get_dtype()) if copy else np.zeros(matrix.shape, dtype=get_dtype())
+    if copy:
+        out[...] = matrix
+    else:
+        out.fill(0)
+    return out
+
+
+def ecer_normalization(matrix, types, out=None):
     """
         Calculates the normalized value of Intuitionistic Fuzzy matrix using Ecer normalization
 
@@ -22,15 +35,18 @@ def ecer_normalization(matrix, types):
             types : ndarray
                 Types of criteria, 1 profit, -1 cost
 
+            out : ndarray, default=None
+                Array to store the normalized matrix
+
         Returns
         -------
             ndarray
                 Normalized Intuitionistic Fuzzy matrix
     """
-    nmatrix = matrix.copy()
+    nmatrix = _output(matrix, out, copy=True)
 
     # validate data
-    if isinstance(np.max(matrix[:, types==1], axis=0)[0], float):
+    if isinstance(np.max(matrix[:, types==1], axis=0)[0], (float, np.floating)):
         if any([m == 0 for m in np.max(matrix[:, types==1], axis=0)]):
             raise ValueError('Maximum value in matrix cannot equal 0')
     else:
@@ -40,9 +56,9 @@ def ecer_normalization(matrix, types):
     nmatrix[:, types==1] = matrix[:, types==1] / np.max(matrix[:, types==1], axis=0)
     nmatrix[:, types==-1] = np.min(matrix[:, types==-1], axis=0) / matrix[:, types==-1] 
     
-    return nmatrix.astype(float)
+    return nmatrix
 
-def max_normalization(matrix, types):
+def max_normalization(matrix, types, out=None):
     """
         Calculates the normalized value of Intuitionistic Fuzzy matrix using Max normalization
 
@@ -54,21 +70,24 @@ def max_normalization(matrix, types):
             types : ndarray
                 Types of criteria, 1 profit, -1 cost
 
+            out : ndarray, default=None
+                Array to store the normalized matrix
+
         Returns
         -------
             ndarray
                 Normalized Intuitionistic Fuzzy matrix
     """
 
-    nmatrix = matrix.copy()
+    nmatrix = _output(matrix, out, copy=True)
     if 1 in types:
         nmatrix[:, types == 1] = matrix[:, types == 1] / np.max(([np.max(matrix[:, types == 1, 0]), np.min(matrix[:, types == 1, 1])]))
     if -1 in types:
         nmatrix[:, types == -1] = np.min(([np.min(matrix[:, types == -1, 0]), np.max(matrix[:, types == 1, 1])])) / matrix[:, types == -1]
 
-    return nmatrix.astype(float)
+    return nmatrix
 
-def minmax_normalization(matrix, types):
+def minmax_normalization(matrix, types, out=None):
     """
         Calculates the normalized value of Intuitionistic Fuzzy matrix using Min-Max normalization
 
@@ -80,6 +99,9 @@ def minmax_normalization(matrix, types):
             types : ndarray
                 Types of criteria, 1 profit, -1 cost
 
+            out : ndarray, default=None
+                Array to store the normalized matrix
+
         Returns
         -------
             ndarray
@@ -93,13 +115,13 @@ def minmax_normalization(matrix, types):
     if np.min(cmax[types == 1] - cmin[types == 1]) == 0 or np.min(cmax[types == -1] - cmin[types == -1]) == 0:
         raise ValueError('Subtraction result of matrix elements cannot equal 0')
 
-    nmatrix = np.zeros((matrix.shape))
+    nmatrix = _output(matrix, out, copy=False)
     nmatrix[:, types == 1] = (matrix[:, types == 1] - cmin[types == 1]) / (cmax[types == 1] - cmin[types == 1])
     nmatrix[:, types == -1] = (cmax[types == -1] - matrix[:, types == -1]) / (cmax[types == -1] - cmin[types == -1])
 
-    return nmatrix.astype(float)
+    return nmatrix
 
-def supriya_normalization(matrix, *args):
+def supriya_normalization(matrix, *args, out=None):
     """
         Calculates the normalized value of Intuitionistic Fuzzy matrix using Supriya normalization
 
@@ -111,19 +133,22 @@ def supriya_normalization(matrix, *args):
             *args : 
                 Additional parameters
 
+            out : ndarray, default=None
+                Array to store the normalized matrix
+
         Returns
         -------
             ndarray
                 Normalized Intuitionistic Fuzzy matrix
     """
-    nmatrix = np.zeros(matrix.shape, dtype=object)
+    nmatrix = _output(matrix, out, copy=False)
 
     nmatrix[:, :, 0] = matrix[:, :, 0] / np.max(matrix[:, :, 0], axis=0)
     nmatrix[:, :, 1] = (matrix[:, :, 1] - np.min(matrix[:, :, 1], axis=0)) / (1 - np.min(matrix[:, :, 1], axis=0))
 
-    return nmatrix.astype(float)
+    return nmatrix
 
-def swap_normalization(matrix, types):
+def swap_normalization(matrix, types, out=None):
     """
         Calculates the normalized value of Intuitionistic Fuzzy matrix using Swap normalization
 
@@ -135,13 +160,55 @@ def swap_normalization(matrix, types):
             types : ndarray
                 Types of criteria, 1 profit, -1 cost
 
+            out : ndarray, default=None
+                Array to store the normalized matrix
+
         Returns
         -------
             ndarray
                 Normalized Intuitionistic Fuzzy matrix
     """
-    nmatrix = matrix.copy()
+    nmatrix = _output(matrix, out, copy=True)
 
     nmatrix[:, types==-1, 0], nmatrix[:, types==-1, 1] = nmatrix[:, types==-1, 1], nmatrix[:, types==-1, 0]
     
-    return nmatrix.astype(float)
+    return nmatrix
+
+
+# normalization functions writing the normalized matrix to the given array
+OUT_NORMALIZATIONS = (
+    ecer_normalization,
+    max_normalization,
+    minmax_normalization,
+    supriya_normalization,
+    swap_normalization
+)
+
+
+def apply_normalization(normalization, matrix, types, out=None):
+    """
+        Calculates the normalized matrix. Normalizations from this module write it to the given array,
+        other functions return a new array.
+
+        Parameters
+        ----------
+            normalization : callable
+                Function used to normalize the decision matrix
+
+            matrix : ndarray
+                Matrix with Intuitionistic Fuzzy Sets
+
+            types : ndarray
+                Types of criteria, 1 profit, -1 cost
+
+            out : ndarray, default=None
+                Array to store the normalized matrix
+
+        Returns
+        -------
+            ndarray
+                Normalized Intuitionistic Fuzzy matrix
+    """
+    if normalization in OUT_NORMALIZATIONS:
+        return normalization(matrix, types, out=out)
+    return normalization(matrix, types)
@@ -1,6 +1,8 @@
 # Copyright (c) 2022 Jakub Więckowski
 
+import inspect
 import numpy as np
+from ...precision import as_float, get_dtype
 
 __all__ = [
     'chen_score_1',
@@ -17,7 +19,15 @@ __all__ = [
     'zhang_xu_score_2'
 ]
 
-def chen_score_1(a):
+
+def _result(s, out):
+    # scores are calculated over the last axis of the arrays with IFS, the result is cast since
+    # numpy 1.x promotes float32 scalars to float64, and indexing with [()] gives a scalar for a single IFS
+    if out is not None:
+        return out
+    return as_float(s)[()]
+
+def chen_score_1(a, out=None):
     """
         Calculates score of the Intuitionistic Fuzzy Set (u, v) and returns a crisp value.
         Uses a formula: (u - v)
@@ -25,24 +35,23 @@ def chen_score_1(a):
         Parameters
         ----------
             a : ndarray
-                Intuitionistic Fuzzy Set (u, v)
+                Intuitionistic Fuzzy Set (u, v), or array of IFS with the last axis (u, v) for any leading axes
+
+            out : ndarray, default=None
+                Array to store the scores
 
         Returns
         -------
-            float
-                Crisp value
+            float or ndarray
+                Crisp value, array of the shape of leading axes for the array of IFS
     """
     # cast types
-    a = a.astype(float)
+    a = as_float(a)
 
-    if a.ndim == 1:
-        return a[0] - a[1]
-    elif a.ndim == 2:
-        return a[:, 0] - a[:, 1]
-    else:
-        return a[:, :, 0] - a[:, :, 1]
+    s = np.subtract(a[..., 0], a[..., 1], out=out)
+    return _result(s, out)
 
-def chen_score_2(a, y=0.5):
+def chen_score_2(a, y=0.5, out=None):
     """
         Calculates score of the Intuitionistic Fuzzy Set (u, v) and returns a crisp value.
         Uses a formula: (y * u + (1 - y) * (1 - v)) 
@@ -50,27 +59,26 @@ def chen_score_2(a, y=0.5):
         Parameters
         ----------
             a : ndarray
-                Intuitionistic Fuzzy Set (u, v)
+                Intuitionistic Fuzzy Set (u, v), or array of IFS with the last axis (u, v) for any leading axes
             
             y : float, default=0.5
                 Adjusting parameter
 
+            out : ndarray, default=None
+                Array to store the scores
+
         Returns
         -------
-            float
-                Crisp value
+            float or ndarray
+                Crisp value, array of the shape of leading axes for the array of IFS
     """
     # cast types
-    a = a.astype(float)
+    a = as_float(a)
 
-    if a.ndim == 1:
-        return y * a[0] + (1 - y) * (1 - a[1])
-    elif a.ndim == 2:
-        return y * a[:, 0] + (1 - y) * (1 - a[:, 1])
-    else:
-        return y * a[:, :, 0] + (1 - y) * (1 - a[:, :, 1])
+    s = np.add(y * a[..., 0], (1 - y) * (1 - a[..., 1]), out=out)
+    return _result(s, out)
 
-def kharal_score_1(a):
+def kharal_score_1(a, out=None):
     """
         Calculates score of the Intuitionistic Fuzzy Set (u, v) and returns a crisp value.
         Uses a formula: (u - (v + (1 - u - v)) / 2)
@@ -78,24 +86,23 @@ def kharal_score_1(a):
         Parameters
         ----------
             a : ndarray
-                Intuitionistic Fuzzy Set (u, v)
+                Intuitionistic Fuzzy Set (u, v), or array of IFS with the last axis (u, v) for any leading axes
+
+            out : ndarray, default=None
+                Array to store the scores
 
         Returns
         -------
-            float
-                Crisp value
+            float or ndarray
+                Crisp value, array of the shape of leading axes for the array of IFS
     """
     # cast types
-    a = a.astype(float)
+    a = as_float(a)
 
-    if a.ndim == 1:
-        return a[0] - (a[1] + (1 - a[0] - a[1])) / 2
-    elif a.ndim == 2:
-        return a[:, 0] - (a[:, 1] + (1 - a[:, 0] - a[:, 1])) / 2
-    else:
-        return a[:, :, 0] - (a[:, :, 1] + (1 - a[:, :, 0] - a[:, :, 1])) / 2
+    s = np.subtract(a[..., 0], (a[..., 1] + (1 - a[..., 0] - a[..., 1])) / 2, out=out)
+    return _result(s, out)
 
-def kharal_score_2(a):
+def kharal_score_2(a, out=None):
     """
         Calculates score of the Intuitionistic Fuzzy Set (u, v) and returns a crisp value.
         Uses a formula: (u + v) / 2 - (1 - u - v)
@@ -103,24 +110,23 @@ def kharal_score_2(a):
         Parameters
         ----------
             a : ndarray
-                Intuitionistic Fuzzy Set (u, v)
+                Intuitionistic Fuzzy Set (u, v), or array of IFS with the last axis (u, v) for any leading axes
+
+            out : ndarray, default=None
+                Array to store the scores
 
         Returns
         -------
-            float
-                Crisp value
+            float or ndarray
+                Crisp value, array of the shape of leading axes for the array of IFS
     """
     # cast types
-    a = a.astype(float)
+    a = as_float(a)
 
-    if a.ndim == 1:
-        return (a[0] + a[1]) / 2 - (1 - a[0] - a[1])
-    elif a.ndim == 2:
-        return (a[:, 0] + a[:, 1]) / 2 - (1 - a[:, 0] - a[:, 1])
-    else:
-        return (a[:, :, 0] + a[:, :, 1]) / 2 - (1 - a[:, :, 0] - a[:, :, 1])
+    s = np.subtract((a[..., 0] + a[..., 1]) / 2, 1 - a[..., 0] - a[..., 1], out=out)
+    return _result(s, out)
 
-def liu_wang_score(a):
+def liu_wang_score(a, out=None):
     """
         Calculates score of the Intuitionistic Fuzzy Set (u, v) and returns a crisp value.
         Uses a formula: u + u * (1 - u - v)
@@ -128,24 +134,23 @@ def liu_wang_score(a):
         Parameters
         ----------
             a : ndarray
-                Intuitionistic Fuzzy Set (u, v)
+                Intuitionistic Fuzzy Set (u, v), or array of IFS with the last axis (u, v) for any leading axes
+
+            out : ndarray, default=None
+                Array to store the scores
 
         Returns
         -------
-            float
-                Crisp value
+            float or ndarray
+                Crisp value, array of the shape of leading axes for the array of IFS
     """
     # cast types
-    a = a.astype(float)
+    a = as_float(a)
 
-    if a.ndim == 1:
-        return a[0] + a[0] * (1 - a[0] - a[1])
-    elif a.ndim == 2:
-        return a[:, 0] + a[:, 0] * (1 - a[:, 0] - a[:, 1])
-    else:
-        return a[:, :, 0] - a[:, :, 0] * (1 - a[:, :, 0] - a[:, :, 1])
+    s = np.add(a[..., 0], a[..., 0] * (1 - a[..., 0] - a[..., 1]), out=out)
+    return _result(s, out)
 
-def supriya_score(a):
+def supriya_score(a, out=None):
     """
         Calculates score of the Intuitionistic Fuzzy Set (u, v) and returns a crisp value.
         Uses a formula: (u - v * (1 - u - v))
@@ -153,24 +158,23 @@ def supriya_score(a):
         Parameters
         ----------
             a : ndarray
-                Intuitionistic Fuzzy Set (u, v)
+                Intuitionistic Fuzzy Set (u, v), or array of IFS with the last axis (u, v) for any leading axes
+
+            out : ndarray, default=None
+                Array to store the scores
 
         Returns
         -------
-            float
-                Crisp value
+            float or ndarray
+                Crisp value, array of the shape of leading axes for the array of IFS
     """
     # cast types
-    a = a.astype(float)
+    a = as_float(a)
 
-    if a.ndim == 1:
-        return a[0] - a[1] * (1 - a[0] - a[1])
-    elif a.ndim == 2:
-        return a[:, 0] - a[:, 1] * (1 - a[:, 0] - a[:, 1])
-    else:
-        return a[:, :, 0] - (1 - a[:, :, 0] - a[:, :, 1])
+    s = np.subtract(a[..., 0], a[..., 1] * (1 - a[..., 0] - a[..., 1]), out=out)
+    return _result(s, out)
 
-def thakur_score(a):
+def thakur_score(a, out=None):
     """
         Calculates score of the Intuitionistic Fuzzy Set (u, v) and returns a crisp value.
         Uses a formula: (u**v - v**2) 
@@ -178,24 +182,23 @@ def thakur_score(a):
         Parameters
         ----------
             a : ndarray
-                Intuitionistic Fuzzy Set (u, v)
+                Intuitionistic Fuzzy Set (u, v), or array of IFS with the last axis (u, v) for any leading axes
             
+            out : ndarray, default=None
+                Array to store the scores
+
         Returns
         -------
-            float
-                Crisp value
+            float or ndarray
+                Crisp value, array of the shape of leading axes for the array of IFS
     """
     # cast types
-    a = a.astype(float)
+    a = as_float(a)
 
-    if a.ndim == 1:
-        return a[0]**2 - a[1]**2
-    elif a.ndim == 2:
-        return a[:, 0]**2 - a[:, 1]**2
-    else:
-        return a[:, :, 0] ** 2 - a[:, :, 1] ** 2
+    s = np.subtract(a[..., 0] ** 2, a[..., 1] ** 2, out=out)
+    return _result(s, out)
 
-def wan_dong_score_1(a):
+def wan_dong_score_1(a, out=None):
     """
         Calculates score of the Intuitionistic Fuzzy Set (u, v) and returns a crisp value.
         Uses a formula: 1/2 * ((u - v) / 2 + 1)
@@ -203,24 +206,23 @@ def wan_dong_score_1(a):
         Parameters
         ----------
             a : ndarray
-                Intuitionistic Fuzzy Set (u, v)
+                Intuitionistic Fuzzy Set (u, v), or array of IFS with the last axis (u, v) for any leading axes
+
+            out : ndarray, default=None
+                Array to store the scores
 
         Returns
         -------
-            float
-                Crisp value
+            float or ndarray
+                Crisp value, array of the shape of leading axes for the array of IFS
     """
     # cast types
-    a = a.astype(float)
-    
-    if a.ndim == 1:
-        return 1/2 * ((a[0] - a[1]) / 2 + 1)
-    elif a.ndim == 2:
-        return 1/2 * ((a[:, 0] - a[:, 1]) / 2 + 1)
-    else:
-        return 1/2 * ((a[:, :, 0] - a[:, :, 1]) / 2 + 1)
-
-def wan_dong_score_2(a):
+    a = as_float(a)
+
+    s = np.multiply(1/2, (a[..., 0] - a[..., 1]) / 2 + 1, out=out)
+    return _result(s, out)
+
+def wan_dong_score_2(a, out=None):
     """
         Calculates score of the Intuitionistic Fuzzy Set (u, v) and returns a crisp value.
         Uses a formula: ((u - v) + 1) / 2
@@ -228,24 +230,23 @@ def wan_dong_score_2(a):
         Parameters
         ----------
             a : ndarray
-                Intuitionistic Fuzzy Set (u, v)
+                Intuitionistic Fuzzy Set (u, v), or array of IFS with the last axis (u, v) for any leading axes
+
+            out : ndarray, default=None
+                Array to store the scores
 
         Returns
         -------
-            float
-                Crisp value
+            float or ndarray
+                Crisp value, array of the shape of leading axes for the array of IFS
     """
     # cast types
-    a = a.astype(float)
+    a = as_float(a)
 
-    if a.ndim == 1:
-        return ((a[0] - a[1]) + 1) / 2
-    elif a.ndim == 2:
-        return ((a[:, 0] - a[:, 1]) + 1) / 2
-    else:
-        return ((a[:, :, 0] - a[:, :, 1]) + 1) / 2
+    s = np.divide((a[..., 0] - a[..., 1]) + 1, 2, out=out)
+    return _result(s, out)
 
-def wei_score(a):
+def wei_score(a, out=None):
     """
         Calculates score of the Intuitionistic Fuzzy Set (u, v) and returns a crisp value.
         Uses a formula (1 - u - v)
@@ -253,27 +254,24 @@ def wei_score(a):
         Parameters
         ----------
             a : ndarray
-                Intuitionistic Fuzzy Set (u, v)
+                Intuitionistic Fuzzy Set (u, v), or array of IFS with the last axis (u, v) for any leading axes
+
+            out : ndarray, default=None
+                Array to store the scores
 
         Returns
         -------
-            float
-                Crisp value
+            float or ndarray
+                Crisp value, array of the shape of leading axes for the array of IFS
     """
     # cast types
-    a = a.astype(float)
-
-    if a.ndim == 1:    
-        p = 1 - a[0] - a[1]
-        return np.cos(np.abs(a[0] - a[1]) / (2 * (1 + p)) * np.pi)
-    elif a.ndim == 2:    
-        p = 1 - a[:, 0] - a[:, 1]
-        return np.cos(np.abs(a[:, 0] - a[:, 1]) / (2 * (1 + p)) * np.pi)
-    else:
-        p = 1 - a[:, :, 0] - a[:, :, 1]
-        return np.cos(np.abs(a[:, :, 0] - a[:, :, 1]) / (2 * (1 + p)) * np.pi)
-
-def zhang_xu_score_1(a):
+    a = as_float(a)
+
+    p = 1 - a[..., 0] - a[..., 1]
+    s = np.cos(np.abs(a[..., 0] - a[..., 1]) / (2 * (1 + p)) * np.pi, out=out)
+    return _result(s, out)
+
+def zhang_xu_score_1(a, out=None):
     """
         Calculates score of the Intuitionistic Fuzzy Set (u, v) and returns a crisp value.
         Uses a formula: ((1 - v) / (2 - u - v))
@@ -281,24 +279,23 @@ def zhang_xu_score_1(a):
         Parameters
         ----------
             a : ndarray
-                Intuitionistic Fuzzy Set (u, v)
+                Intuitionistic Fuzzy Set (u, v), or array of IFS with the last axis (u, v) for any leading axes
+
+            out : ndarray, default=None
+                Array to store the scores
 
         Returns
         -------
-            float
-                Crisp value
+            float or ndarray
+                Crisp value, array of the shape of leading axes for the array of IFS
     """
     # cast types
-    a = a.astype(float)
-    
-    if a.ndim == 1:
-        return (1 - a[1]) / (2 - a[0] - a[1])
-    elif a.ndim == 2:
-        return (1 - a[:, 1]) / (2 - a[:, 0] - a[:, 1])
-    else:
-        return (1 - a[:, :, 1]) / (2 - a[:, :, 0] - a[:, :, 1])
-        
-def zhang_xu_score_2(a):
+    a = as_float(a)
+
+    s = np.divide(1 - a[..., 1], 2 - a[..., 0] - a[..., 1], out=out)
+    return _result(s, out)
+
+def zhang_xu_score_2(a, out=None):
     """
         Calculates score of the Intuitionistic Fuzzy Set (u, v) and returns a crisp value.
         Uses a formula: (1 - (1 - u) / (1 - u - v)) 
@@ -306,21 +303,199 @@ def zhang_xu_score_2(a):
         Parameters
         ----------
             a : ndarray
-                Intuitionistic Fuzzy Set (u, v)
+                Intuitionistic Fuzzy Set (u, v), or array of IFS with the last axis (u, v) for any leading axes
             
+            out : ndarray, default=None
+                Array to store the scores
+
         Returns
         -------
-            float
-                Crisp value
+            float or ndarray
+                Crisp value, array of the shape of leading axes for the array of IFS
     """
     # cast types
-    a = a.astype(float)
-    
-    if a.ndim == 1:
-        if 1 - (1 - a[0] - a[1]) == 0:
-            return 0
-        return 1 - (1 - a[0]) / (1 - (1 - a[0] - a[1]))
-    elif a.ndim == 2:
-        return np.nan_to_num(1 - (1 - a[:, 0]) / (1 - (1 - a[:, 0] - a[:, 1])))
-    else:
-        return np.nan_to_num(1 - (1 - a[:, :, 0]) / (1 - (1 - a[:, :, 0] - a[:, :, 1])))
+    a = as_float(a)
+
+    # score is equal to 0 for the IFS (0, 0) of the complete hesitancy
+    d = np.asarray(1 - (1 - a[..., 0] - a[..., 1]))
+    s = np.subtract(1, np.divide(1 - a[..., 0], d, out=np.ones_like(d), where=d != 0), out=out)
+    return _result(s, out)
+
+
+# score functions writing the scores to the given array
+OUT_SCORES = (
+    chen_score_1,
+    chen_score_2,
+    kharal_score_1,
+    kharal_score_2,
+    liu_wang_score,
+    supriya_score,
+    thakur_score,
+    wan_dong_score_1,
+    wan_dong_score_2,
+    wei_score,
+    zhang_xu_score_1,
+    zhang_xu_score_2
+)
+
+
+def elementwise_score(score, a, out=None):
+    """
+        Calculates score of each Intuitionistic Fuzzy Set of the array. Scores from this module write them to the given array,
+        other functions return a new array.
+
+        Parameters
+        ----------
+            score : callable
+                Function used to calculate crisp score of IFS
+
+            a : ndarray
+                Array with Intuitionistic Fuzzy Sets (u, v) in the last axis
+
+            out : ndarray, default=None
+                Array to store the scores
+
+        Returns
+        -------
+            ndarray
+                Array with crisp scores
+    """
+    if score in OUT_SCORES:
+        return score(a, out=out)
+    return score(a)
+
+
+def _fused_chen_score_2(t, out, y=0.5):
+    np.subtract(1, t['v'], out=out)
+    out *= 1 - y
+    out += y * t['u']
+
+def _fused_kharal_score_1(t, out):
+    np.add(t['v'], t['p'], out=out)
+    out /= -2
+    out += t['u']
+
+def _fused_kharal_score_2(t, out):
+    np.add(t['u'], t['v'], out=out)
+    out /= 2
+    out -= t['p']
+
+def _fused_liu_wang_score(t, out):
+    np.multiply(t['u'], t['p'], out=out)
+    out += t['u']
+
+def _fused_supriya_score(t, out):
+    np.multiply(t['v'], t['p'], out=out)
+    np.subtract(t['u'], out, out=out)
+
+def _fused_wan_dong_score_1(t, out):
+    np.divide(t['d'], 2, out=out)
+    out += 1
+    out *= 1/2
+
+def _fused_wan_dong_score_2(t, out):
+    np.add(t['d'], 1, out=out)
+    out /= 2
+
+def _fused_wei_score(t, out):
+    np.abs(t['d'], out=out)
+    out /= 2 * t['p1']
+    out *= np.pi
+    np.cos(out, out=out)
+
+def _fused_zhang_xu_score_1(t, out):
+    np.subtract(1, t['v'], out=out)
+    out /= t['p1']
+
+def _fused_zhang_xu_score_2(t, out):
+    # score is equal to 0 for the IFS (0, 0) of the complete hesitancy
+    d = 1 - t['p']
+    out[...] = 1
+    np.divide(1 - t['u'], d, out=out, where=d != 0)
+    np.subtract(1, out, out=out)
+
+
+# scores written to the given array from the terms shared by the score functions:
+# u, v, u - v, 1 - u - v, 1 + (1 - u - v) and squares of u and v, parameters of the scores are keyword arguments
+FUSED_SCORES = {
+    'chen_score_1': lambda t, out: np.copyto(out, t['d']),
+    'chen_score_2': _fused_chen_score_2,
+    'kharal_score_1': _fused_kharal_score_1,
+    'kharal_score_2': _fused_kharal_score_2,
+    'liu_wang_score': _fused_liu_wang_score,
+    'supriya_score': _fused_supriya_score,
+    'thakur_score': lambda t, out: np.subtract(t['u2'], t['v2'], out=out),
+    'wan_dong_score_1': _fused_wan_dong_score_1,
+    'wan_dong_score_2': _fused_wan_dong_score_2,
+    'wei_score': _fused_wei_score,
+    'zhang_xu_score_1': _fused_zhang_xu_score_1,
+    'zhang_xu_score_2': _fused_zhang_xu_score_2
+}
+
+
+def score_all(a, names=None, as_dict=False, chunk_size=8192, out=None, params=None):
+    """
+        Calculates several scores of each Intuitionistic Fuzzy Set of the array in one pass. The array is processed
+        in chunks small enough to stay in the cache, and terms shared by the scores are calculated once for each chunk.
+
+        Parameters
+        ----------
+            a : ndarray
+                Array with Intuitionistic Fuzzy Sets (u, v) in the last axis
+
+            names : iterable, default=None
+                Names or functions of the scores from this module, all scores if not given
+
+            as_dict : bool, default=False
+                Return the scores as the dict with names of the scores as keys
+
+            chunk_size : int, default=8192
+                Number of IFS processed at once
+
+            out : ndarray, default=None
+                Array to store the scores, of shape (len(names), ...)
+
+            params : dict, default=None
+                Parameters of the selected scores, e.g. {'chen_score_2': {'y': 0.3}}, default values are used if not given
+
+        Returns
+        -------
+            ndarray or dict
+                Scores of shape (len(names), ...) with the shape of leading axes of the array of IFS, or dict of the scores
+    """
+    a = as_float(a)
+    names = list(FUSED_SCORES) if names is None else [getattr(name, '__name__', name) for name in names]
+    for name in names:
+        if name not in FUSED_SCORES:
+            raise ValueError(f'Score {name} is not calculated by score_all, select from {list(FUSED_SCORES)}')
+
+    params = {} if params is None else {getattr(name, '__name__', name): kwargs for name, kwargs in params.items()}
+    for name, kwargs in params.items():
+        if name not in names:
+            raise ValueError(f'Parameters are given for the score {name}, which is not selected')
+        try:
+            inspect.signature(FUSED_SCORES[name]).bind(None, None, **kwargs)
+        except TypeError:
+            raise ValueError(f'Parameters {list(kwargs)} are not accepted by the score {name}')
+
+    shape = a.shape[:-1]
+    if out is None:
+        out = np.zeros((len(names), ) + shape, dtype=get_dtype())
+    flat = a.reshape(-1, a.shape[-1])
+    result = out.reshape(len(names), -1)
+
+    for start in range(0, flat.shape[0], chunk_size):
+        chunk = flat[start:start + chunk_size]
+        # degrees copied to the contiguous arrays, they are read by each score
+        u, v = np.ascontiguousarray(chunk[:, 0]), np.ascontiguousarray(chunk[:, 1])
+        p = 1 - u - v
+        t = {'u': u, 'v': v, 'd': u - v, 'p': p, 'p1': 1 + p, 'u2': u ** 2, 'v2': v ** 2}
+        for i, name in enumerate(names):
+            FUSED_SCORES[name](t, result[i, start:start + chunk_size], **params.get(name, {}))
+
+    # non-contiguous array given as out is not reshaped to the view
+    if not np.shares_memory(result, out):
+        out[...] = result.reshape(out.shape)
+    if as_dict:
+        return dict(zip(names, out))
+    return out
@@ -1,6 +1,8 @@
 # Copyright (c) 2023 Bartłomiej Kizielewicz
 
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from ...precision import as_float, get_dtype
 
 __all__ = [
     'chen_similarity',
@@ -12,6 +14,12 @@ __all__ = [
 ]
 
 
+def _result(s):
+    # numpy 1.x promotes float32 scalars to float64 in the arithmetic with Python numbers, the result is cast
+    # to the current precision, and indexing with [()] gives a scalar
+    return as_float(s)[()]
+
+
 def chen_similarity(a, b):
     """
         Calculates similarity of the Intuitionistic Fuzzy Sets (u1, v1)|(u2, v2) and returns a crisp value.
@@ -29,15 +37,17 @@ def chen_similarity(a, b):
                 Crisp value
     """
     # cast types
-    a = a.astype(float)
-    b = b.astype(float)
+    a = as_float(a)
+    b = as_float(b)
 
     if a.ndim == 1 and b.ndim == 1:
-        return 1 - (np.sum(np.abs(a[0] - a[1]) - np.abs(b[0] - b[1])) / 2 * a.ndim)
+        s = 1 - (np.sum(np.abs(a[0] - a[1]) - np.abs(b[0] - b[1])) / 2 * a.ndim)
     elif a.ndim == 2 and b.ndim == 2:
-        return 1 - (np.sum(np.abs(a[:, 0] - a[:, 1]) - np.abs(b[:, 0] - b[:, 1])) / 2 * a.ndim)
+        s = 1 - (np.sum(np.abs(a[:, 0] - a[:, 1]) - np.abs(b[:, 0] - b[:, 1])) / 2 * a.ndim)
     else:
-        return 1 - (np.sum(np.abs(a[:, :, 0] - a[:, :, 1]) - np.abs(b[:, :, 0] - b[:, :, 1])) / 2 * a.ndim)
+        s = 1 - (np.sum(np.abs(a[:, :, 0] - a[:, :, 1]) - np.abs(b[:, :, 0] - b[:, :, 1])) / 2 * a.ndim)
+
+    return _result(s)
 
 
 def hong_kim_similarity(a, b):
@@ -57,15 +67,17 @@ def hong_kim_similarity(a, b):
                 Crisp value
     """
     # cast types
-    a = a.astype(float)
-    b = b.astype(float)
+    a = as_float(a)
+    b = as_float(b)
 
     if a.ndim == 1 and b.ndim == 1:
-        return 1 - (np.sum(np.abs(a[0] - b[0]) + np.abs(a[1] - b[1])) / 2 * a.ndim)
+        s = 1 - (np.sum(np.abs(a[0] - b[0]) + np.abs(a[1] - b[1])) / 2 * a.ndim)
     elif a.ndim == 2 and b.ndim == 2:
-        return 1 - (np.sum(np.abs(a[:, 0] - b[:, 0]) + np.abs(a[:, 1] - b[:, 1])) / 2 * a.ndim)
+        s = 1 - (np.sum(np.abs(a[:, 0] - b[:, 0]) + np.abs(a[:, 1] - b[:, 1])) / 2 * a.ndim)
     else:
-        return 1 - (np.sum(np.abs(a[:, :, 0] - b[:, :, 0]) + np.abs(a[:, :, 1] - b[:, :, 1])) / 2 * a.ndim)
+        s = 1 - (np.sum(np.abs(a[:, :, 0] - b[:, :, 0]) + np.abs(a[:, :, 1] - b[:, :, 1])) / 2 * a.ndim)
+
+    return _result(s)
 
 
 def li_xu_similarity(a, b):
@@ -85,19 +97,21 @@ def li_xu_similarity(a, b):
                 Crisp value
     """
     # cast types
-    a = a.astype(float)
-    b = b.astype(float)
+    a = as_float(a)
+    b = as_float(b)
 
     if a.ndim == 1 and b.ndim == 1:
-        return 1 - np.sum(np.abs((a[0] - a[1]) - (b[0] - b[1]))) / 4 * a.ndim - np.sum(
+        s = 1 - np.sum(np.abs((a[0] - a[1]) - (b[0] - b[1]))) / 4 * a.ndim - np.sum(
             np.abs(a[0] - a[1]) + np.abs(b[0] - b[1])) / 4 * a.ndim
     elif a.ndim == 2 and b.ndim == 2:
-        return 1 - np.sum(np.abs((a[:, 0] - a[:, 1]) - (b[:, 0] - b[:, 1]))) / 4 * a.ndim - np.sum(
+        s = 1 - np.sum(np.abs((a[:, 0] - a[:, 1]) - (b[:, 0] - b[:, 1]))) / 4 * a.ndim - np.sum(
             np.abs(a[:, 0] - a[:, 1]) + np.abs(b[:, 0] - b[:, 1])) / 4 * a.ndim
     else:
-        return 1 - np.sum(np.abs((a[:, :, 0] - a[:, 1]) - (b[:, :, 0] - b[:, :, 1]))) / 4 * a.ndim - np.sum(
+        s = 1 - np.sum(np.abs((a[:, :, 0] - a[:, :, 1]) - (b[:, :, 0] - b[:, :, 1]))) / 4 * a.ndim - np.sum(
             np.abs(a[:, :, 0] - a[:, :, 1]) + np.abs(b[:, :, 0] - b[:, :, 1])) / 4 * a.ndim
 
+    return _result(s)
+
 
 def fan_zhang_similarity(a, b):
     """
@@ -116,18 +130,20 @@ def fan_zhang_similarity(a, b):
                 Crisp value
     """
     # cast types
-    a = a.astype(float)
-    b = b.astype(float)
+    a = as_float(a)
+    b = as_float(b)
 
     if a.ndim == 1 and b.ndim == 1:
-        return 1 - np.sum(np.abs((a[0] - a[1]) - (b[0] - b[1])) + np.abs((a[0] - b[0]) - (a[1] - b[1]))) / 4 * a.ndim
+        s = 1 - np.sum(np.abs((a[0] - a[1]) - (b[0] - b[1])) + np.abs((a[0] - b[0]) - (a[1] - b[1]))) / 4 * a.ndim
     elif a.ndim == 2 and b.ndim == 2:
-        return 1 - np.sum(np.abs((a[:, 0] - a[:, 1]) - (b[:, 0] - b[:, 1])) + np.abs(
+        s = 1 - np.sum(np.abs((a[:, 0] - a[:, 1]) - (b[:, 0] - b[:, 1])) + np.abs(
             (a[:, 0] - b[:, 0]) - (a[:, 1] - b[:, 1]))) / 4 * a.ndim
     else:
-        return 1 - np.sum(np.abs((a[:, :, 0] - a[:, :, 1]) - (b[:, :, 0] - b[:, :, 1])) + np.abs(
+        s = 1 - np.sum(np.abs((a[:, :, 0] - a[:, :, 1]) - (b[:, :, 0] - b[:, :, 1])) + np.abs(
             (a[:, :, 0] - b[:, :, 0]) - (a[:, :, 1] - b[:, :, 1]))) / 4 * a.ndim
 
+    return _result(s)
+
 
 def li_similarity(a, b):
     """
@@ -146,15 +162,17 @@ def li_similarity(a, b):
                 Crisp value
     """
     # cast types
-    a = a.astype(float)
-    b = b.astype(float)
+    a = as_float(a)
+    b = as_float(b)
 
     if a.ndim == 1 and b.ndim == 1:
-        return 1 - np.sqrt(np.sum((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) / 2 * a.ndim)
+        s = 1 - np.sqrt(np.sum((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) / 2 * a.ndim)
     elif a.ndim == 2 and b.ndim == 2:
-        return 1 - np.sqrt(np.sum((a[:, 0] - b[:, 0]) ** 2 + (a[:, 1] - b[:, 1]) ** 2) / 2 * a.ndim)
+        s = 1 - np.sqrt(np.sum((a[:, 0] - b[:, 0]) ** 2 + (a[:, 1] - b[:, 1]) ** 2) / 2 * a.ndim)
     else:
-        return 1 - np.sqrt(np.sum((a[:, :, 0] - b[:, :, 0]) ** 2 + (a[:, :, 1] - b[:, :, 1]) ** 2) / 2 * a.ndim)
+        s = 1 - np.sqrt(np.sum((a[:, :, 0] - b[:, :, 0]) ** 2 + (a[:, :, 1] - b[:, :, 1]) ** 2) / 2 * a.ndim)
+
+    return _result(s)
 
 
 def ye_similarity(a, b):
@@ -174,15 +192,98 @@ def ye_similarity(a, b):
                 Crisp value
     """
     # cast types
-    a = a.astype(float)
-    b = b.astype(float)
+    a = as_float(a)
+    b = as_float(b)
 
     if a.ndim == 1 and b.ndim == 1:
-        return np.sum(
+        s = np.sum(
             (a[0] * b[0] + a[1] * b[1]) / (np.sqrt(a[0] ** 2 + a[1] ** 2) * np.sqrt(b[0] ** 2 + b[1] ** 2))) / a.ndim
     elif a.ndim == 2 and b.ndim == 2:
-        return np.sum(
+        s = np.sum(
             (a[:, 0] * b[:, 0] + a[:, 1] * b[:, 1]) / (np.sqrt(a[:, 0] ** 2 + a[:, 1] ** 2) * np.sqrt(b[:, 0] ** 2 + b[:, 1] ** 2))) / a.ndim
     else:
-        return np.sum(
+        s = np.sum(
             (a[:, :, 0] * b[:, :, 0] + a[:, :, 1] * b[:, :, 1]) / (np.sqrt(a[:, :, 0] ** 2 + a[:, :, 1] ** 2) * np.sqrt(b[:, :, 0] ** 2 + b[:, :, 1] ** 2))) / a.ndim
+
+    return _result(s)
+
+
+# terms of the measures calculated for each pair of IFS and the similarity calculated from the sum of terms
+# over the criteria, profiles are given as 2-D arrays, so the dimension factor of the measures is equal to 2
+PAIRWISE_SIMILARITIES = {
+    chen_similarity: (
+        lambda a, b: np.abs(a[..., 0] - a[..., 1]) - np.abs(b[..., 0] - b[..., 1]),
+        lambda s: 1 - s / 2 * 2),
+    fan_zhang_similarity: (
+        lambda a, b: np.abs((a[..., 0] - a[..., 1]) - (b[..., 0] - b[..., 1])) + np.abs((a[..., 0] - b[..., 0]) - (a[..., 1] - b[..., 1])),
+        lambda s: 1 - s / 4 * 2),
+    hong_kim_similarity: (
+        lambda a, b: np.abs(a[..., 0] - b[..., 0]) + np.abs(a[..., 1] - b[..., 1]),
+        lambda s: 1 - s / 2 * 2),
+    li_similarity: (
+        lambda a, b: (a[..., 0] - b[..., 0]) ** 2 + (a[..., 1] - b[..., 1]) ** 2,
+        lambda s: 1 - np.sqrt(s / 2 * 2)),
+    li_xu_similarity: (
+        lambda a, b: np.abs((a[..., 0] - a[..., 1]) - (b[..., 0] - b[..., 1])) + np.abs(a[..., 0] - a[..., 1]) + np.abs(b[..., 0] - b[..., 1]),
+        lambda s: 1 - s / 4 * 2),
+    ye_similarity: (
+        lambda a, b: (a[..., 0] * b[..., 0] + a[..., 1] * b[..., 1]) / (np.sqrt(a[..., 0] ** 2 + a[..., 1] ** 2) * np.sqrt(b[..., 0] ** 2 + b[..., 1] ** 2)),
+        lambda s: s / 2)
+}
+
+
+def pairwise_similarity(A, B, measure, block_size=2**20, n_jobs=None):
+    """
+        Calculates similarity of each profile of Intuitionistic Fuzzy Sets from A to each profile from B.
+        Measures from this module are calculated with broadcasting in blocks of rows of A,
+        other functions are calculated for each pair of profiles.
+
+        Parameters
+        ----------
+            A : ndarray
+                Profiles of Intuitionistic Fuzzy Sets, of shape (p, n, 2|3)
+
+            B : ndarray
+                Profiles of Intuitionistic Fuzzy Sets, of shape (q, n, 2|3)
+
+            measure : callable
+                Function used to calculate similarity of two profiles
+
+            block_size : int, default=2**20
+                Largest number of pairs of IFS compared at once, limits the memory used by the calculations
+
+            n_jobs : int, default=None
+                Number of threads calculating the blocks, blocks are calculated sequentially if not given
+
+        Returns
+        -------
+            ndarray
+                Similarities of the profiles, of shape (p, q)
+    """
+    A = as_float(A)
+    B = as_float(B)
+    if A.ndim != 3 or B.ndim != 3 or A.shape[1:] != B.shape[1:]:
+        raise ValueError('Profiles should be given as arrays of shape (p, n, 2|3) and (q, n, 2|3) with the same number of criteria')
+
+    p, q, n = A.shape[0], B.shape[0], A.shape[1]
+    out = np.zeros((p, q), dtype=get_dtype())
+    rows = max(1, block_size // max(1, q * n))
+
+    def calculate(start):
+        block = slice(start, start + rows)
+        if measure in PAIRWISE_SIMILARITIES:
+            terms, similarity = PAIRWISE_SIMILARITIES[measure]
+            out[block] = similarity(np.sum(terms(A[block, np.newaxis], B[np.newaxis]), axis=-1))
+        else:
+            for i in range(*block.indices(p)):
+                for j in range(q):
+                    out[i, j] = measure(A[i], B[j])
+
+    starts = range(0, p, rows)
+    if n_jobs is None or n_jobs <= 1:
+        for start in starts:
+            calculate(start)
+    else:
+        with ThreadPoolExecutor(n_jobs) as executor:
+            list(executor.map(calculate, starts))
+    return out
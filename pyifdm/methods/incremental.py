@@ -0,0 +1,958 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import heapq
+import numpy as np
+
+from .aras.ifs import ifs as aras_ifs
+from .copras.ifs import ifs as copras_ifs
+from .marcos.ifs import ifs as marcos_ifs
+from .moora.ifs import ifs as moora_ifs
+from .topsis.ifs import ifs as topsis_ifs
+from .waspas.ifs import ifs as waspas_ifs
+from .wpm.ifs import ifs as wpm_ifs
+from .wsm.ifs import ifs as wsm_ifs
+from .ifs.distance import normalized_euclidean_distance
+from .ifs.normalization import ecer_normalization, max_normalization, minmax_normalization, supriya_normalization, swap_normalization
+from .ifs.score import chen_score_1, elementwise_score, thakur_score, wan_dong_score_1, zhang_xu_score_2
+from ..aggregation import ifwa, ifwg, multiply, power, product
+from ..helpers import rank, top_k
+from ..precision import as_float, get_dtype
+
+from .validator import Validator
+
+__all__ = [
+    'IncrementalARAS',
+    'IncrementalCOPRAS',
+    'IncrementalMARCOS',
+    'IncrementalMOORA',
+    'IncrementalTOPSIS',
+    'IncrementalWASPAS',
+    'IncrementalWPM',
+    'IncrementalWSM'
+]
+
+# normalizations which transform each alternative independently from the others
+ROW_NORMALIZATIONS = (swap_normalization, )
+
+# normalizations which depend on the other alternatives only through the extreme values of the criteria
+EXTREMA_NORMALIZATIONS = (ecer_normalization, max_normalization, minmax_normalization, supriya_normalization)
+
+
+class _ColumnExtrema():
+    def __init__(self, values, slots=None):
+        """
+            Keeps the maximum and minimum of a single criterion in heaps with lazy deletion.
+            Equal values are resolved by the lower slot, the same as in numpy argmax and argmin.
+
+            Parameters
+            ----------
+                values : ndarray
+                    Values of the criterion
+
+                slots : ndarray, default=None
+                    Slots of the values, consecutive slots if not given
+        """
+        slots = range(len(values)) if slots is None else slots
+
+        self.__max = [(-v, slot) for slot, v in zip(slots, values)]
+        self.__min = [(v, slot) for slot, v in zip(slots, values)]
+        heapq.heapify(self.__max)
+        heapq.heapify(self.__min)
+
+    def __len__(self):
+        return len(self.__max)
+
+    def push(self, value, slot):
+        """
+            Adds value of the alternative placed in the given slot
+        """
+        heapq.heappush(self.__max, (-value, slot))
+        heapq.heappush(self.__min, (value, slot))
+
+    def argmax(self, alive, values=None):
+        """
+            Returns slot of the maximum value among the alive slots.
+            If the current values of the slots are given, the outdated values of the changed slots are removed
+        """
+        while not alive[self.__max[0][1]] or (values is not None and -self.__max[0][0] != values[self.__max[0][1]]):
+            heapq.heappop(self.__max)
+        return self.__max[0][1]
+
+    def argmin(self, alive, values=None):
+        """
+            Returns slot of the minimum value among the alive slots.
+            If the current values of the slots are given, the outdated values of the changed slots are removed
+        """
+        while not alive[self.__min[0][1]] or (values is not None and self.__min[0][0] != values[self.__min[0][1]]):
+            heapq.heappop(self.__min)
+        return self.__min[0][1]
+
+
+class _IncrementalEvaluator():
+    def __init__(self, matrix, weights, types, normalization, incremental=True):
+        """
+            Base object for the evaluators updated when alternatives are added or removed.
+            Alternatives are identified by ids, the initial alternatives get ids from 0 to m-1.
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                weights : ndarray
+                    Vector of criteria weights in a crisp or Intuitionistic Fuzzy form
+
+                types : ndarray
+                    Types of criteria, 1 profit, -1 cost
+
+                normalization: callable
+                    Function used to normalize the decision matrix
+
+                incremental : bool, default=True
+                    Flag to determine if method supports incremental updates with given normalization,
+                    otherwise the whole matrix is evaluated after each change
+        """
+
+        self.weights = as_float(weights)
+        self.types = types
+        self.normalization = normalization
+        self._descending = True
+        self._incremental = incremental
+        self._next_id = matrix.shape[0]
+        self._build(as_float(matrix), np.arange(matrix.shape[0]))
+
+    def _build(self, matrix, ids):
+        self._size = matrix.shape[0]
+        self._matrix = matrix.copy()
+        self._ids = np.array(ids, dtype=int)
+        self._slots = {int(id): slot for slot, id in enumerate(self._ids)}
+        self._alive = np.ones(self._size, dtype=bool)
+        self._values = np.zeros(self._size, dtype=get_dtype())
+        self._partials = {}
+        if self._incremental:
+            self._initialize()
+            self._values[:self._size] = self._score(np.arange(self._size))
+        self._changed = True
+
+    def _grow(self):
+        capacity = max(2 * self._matrix.shape[0], 1)
+
+        def resize(array):
+            new_array = np.zeros((capacity, ) + array.shape[1:], dtype=array.dtype)
+            new_array[:array.shape[0]] = array
+            return new_array
+
+        self._matrix = resize(self._matrix)
+        self._ids = resize(self._ids)
+        self._alive = resize(self._alive)
+        self._values = resize(self._values)
+        self._partials = {name: resize(array) for name, array in self._partials.items()}
+
+    def _live_slots(self):
+        return np.flatnonzero(self._alive[:self._size])
+
+    def add(self, alternative):
+        """
+            Adds alternative to the evaluated set and updates the preferences
+
+            Parameters
+            ----------
+                alternative : ndarray
+                    Alternative data in the Intuitionistic Fuzzy form, one row of the decision matrix
+
+            Returns
+            ----------
+                int:
+                    Id of the added alternative
+        """
+        alternative = as_float(alternative)
+        if alternative.shape != self._matrix.shape[1:]:
+            raise ValueError(f'Alternative should have shape {self._matrix.shape[1:]}, not {alternative.shape}')
+
+        if self._size == self._matrix.shape[0]:
+            self._grow()
+
+        slot = self._size
+        self._size += 1
+        id = self._next_id
+        self._next_id += 1
+
+        self._matrix[slot] = alternative
+        self._ids[slot] = id
+        self._alive[slot] = True
+        self._slots[id] = slot
+
+        if self._incremental:
+            if self._insert(slot):
+                slots = self._live_slots()
+                self._values[slots] = self._score(slots)
+            else:
+                self._values[slot] = self._score(np.array([slot]))[0]
+        self._changed = True
+
+        return id
+
+    def remove(self, id):
+        """
+            Removes alternative from the evaluated set and updates the preferences
+
+            Parameters
+            ----------
+                id : int
+                    Id of the removed alternative
+        """
+        if id not in self._slots:
+            raise ValueError(f'Alternative with id {id} is not evaluated')
+        if len(self._slots) == 1:
+            raise ValueError('Cannot remove the last evaluated alternative')
+
+        slot = self._slots.pop(id)
+        self._alive[slot] = False
+
+        # removed slots are released when they outnumber the evaluated ones
+        if self._size - len(self._slots) > len(self._slots):
+            slots = self._live_slots()
+            self._build(self._matrix[slots], self._ids[slots])
+        elif self._incremental and self._delete(slot):
+            slots = self._live_slots()
+            self._values[slots] = self._score(slots)
+        self._changed = True
+
+    def update_cell(self, id, j, value):
+        """
+            Changes single Intuitionistic Fuzzy value of the decision matrix and updates the preferences
+
+            Parameters
+            ----------
+                id : int
+                    Id of the changed alternative, the initial alternatives have ids equal to their rows
+
+                j : int
+                    Index of the changed criterion
+
+                value : ndarray
+                    New Intuitionistic Fuzzy value
+
+            Returns
+            ----------
+                tuple:
+                    Preferences and ranking of the evaluated alternatives
+        """
+        if id not in self._slots:
+            raise ValueError(f'Alternative with id {id} is not evaluated')
+        value = as_float(value)
+        if value.shape != self._matrix.shape[2:]:
+            raise ValueError(f'Value should have shape {self._matrix.shape[2:]}, not {value.shape}')
+
+        slot = self._slots[id]
+        self._matrix[slot, j] = value
+
+        if self._incremental:
+            if self._update(slot, j):
+                slots = self._live_slots()
+                self._values[slots] = self._score(slots)
+            else:
+                self._values[slot] = self._score(np.array([slot]))[0]
+        self._changed = True
+
+        return self.preferences, self.rank()
+
+    def _update(self, slot, j):
+        # evaluators without delta updates of single values recalculate all partial terms
+        slots = self._live_slots()
+        self._build(self._matrix[slots], self._ids[slots])
+        return True
+
+    @property
+    def ids(self):
+        """
+            Ids of the evaluated alternatives in the order of the preferences
+        """
+        return self._ids[self._live_slots()]
+
+    @property
+    def matrix(self):
+        """
+            Decision matrix with the evaluated alternatives in the order of the preferences
+        """
+        return self._matrix[self._live_slots()]
+
+    @property
+    def preferences(self):
+        """
+            Preferences of the evaluated alternatives. Greater values are placed higher in ranking
+        """
+        if not self._incremental and self._changed:
+            slots = self._live_slots()
+            self._values[slots] = self._evaluate(self._matrix[slots])
+        self._changed = False
+        return self._values[self._live_slots()]
+
+    def rank(self):
+        """
+            Calculates the alternatives ranking based on the current preferences
+
+            Returns
+            ----------
+                ndarray:
+                    Ranking of alternatives in the order of the ids
+        """
+        return rank(self.preferences, self._descending)
+
+    def top_k(self, k):
+        """
+            Selects the k best alternatives based on the current preferences.
+            Alternatives with equal preferences are ordered by their position in the ids.
+
+            Parameters
+            ----------
+                k : int
+                    Number of selected alternatives
+
+            Returns
+            ----------
+                ndarray:
+                    Ids of the k best alternatives, starting from the best one
+        """
+        return self.ids[top_k(self.preferences, k, self._descending)]
+
+
+class IncrementalTOPSIS(_IncrementalEvaluator):
+    def __init__(self, matrix, weights, types, distance=normalized_euclidean_distance, normalization=None):
+        """
+            Creates Intuitionistic Fuzzy TOPSIS evaluator updated when alternatives are added or removed.
+            Distances of each alternative to the ideal solutions are kept per criterion,
+            the distances in a criterion are recalculated only when its ideal solution changes.
+            With normalization other than None or swap_normalization, the whole matrix is evaluated after each change.
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                weights : ndarray
+                    Vector of criteria weights in a crisp or Intuitionistic Fuzzy form
+
+                types : ndarray
+                    Types of criteria, 1 profit, -1 cost.
+                    Criteria types cannot be all profit or all cost.
+
+                distance: callable, default=normalized_euclidean_distance
+                    Function used to calculate distance between two IFS
+
+                normalization: callable, default=None
+                    Function used to normalize the decision matrix
+        """
+        # validate data
+        Validator.ifs_validation(matrix, weights, types, mixed_types=True)
+
+        self.distance = distance
+        incremental = normalization is None or normalization in ROW_NORMALIZATIONS
+        super().__init__(matrix, weights, types, normalization, incremental)
+
+    def _evaluate(self, matrix):
+        return as_float(topsis_ifs(matrix, self.weights, self.types, self.normalization, self.distance))
+
+    def _weighted(self, matrix):
+        if self.normalization is not None:
+            matrix = self.normalization(matrix, self.types)
+
+        # the same weighting as in the TOPSIS calculations
+        return product(matrix, self.weights, axis=1, out=np.zeros((matrix.shape[0], matrix.shape[1], 3), dtype=get_dtype()))
+
+    def _ideals(self, j):
+        extrema = self._extrema[j]
+        if self.types[j] == 1:
+            return extrema.argmax(self._alive), extrema.argmin(self._alive)
+        return extrema.argmin(self._alive), extrema.argmax(self._alive)
+
+    def _distances(self, slots, j):
+        W = self._partials['W']
+        aplus, aminus = W[self._aplus[j], j], W[self._aminus[j], j]
+        dplus = np.array([self.distance(W[slot, j], aplus) for slot in slots], dtype=get_dtype())
+        dminus = np.array([self.distance(W[slot, j], aminus) for slot in slots], dtype=get_dtype())
+        return dplus, dminus
+
+    def _update_column(self, j):
+        slots = self._live_slots()
+        dplus, dminus = self._distances(slots, j)
+        Dp, Dm = self._partials['Dp'], self._partials['Dm']
+        self._partials['Sp'][slots] += dplus - Dp[slots, j]
+        self._partials['Sm'][slots] += dminus - Dm[slots, j]
+        Dp[slots, j], Dm[slots, j] = dplus, dminus
+
+    def _update_ideals(self, columns):
+        moved = False
+        for j in columns:
+            aplus, aminus = self._ideals(j)
+            if aplus != self._aplus[j] or aminus != self._aminus[j]:
+                self._aplus[j], self._aminus[j] = aplus, aminus
+                self._update_column(j)
+                moved = True
+        return moved
+
+    def _initialize(self):
+        m, n = self._size, self._matrix.shape[1]
+        W = self._weighted(self._matrix[:m])
+        self._partials = {
+            'W': W,
+            'Dp': np.zeros((m, n), dtype=get_dtype()),
+            'Dm': np.zeros((m, n), dtype=get_dtype()),
+            'Sp': np.zeros(m, dtype=get_dtype()),
+            'Sm': np.zeros(m, dtype=get_dtype()),
+        }
+
+        self._extrema = [_ColumnExtrema(W[:, j, 0]) for j in range(n)]
+        self._aplus, self._aminus = np.zeros(n, dtype=int), np.zeros(n, dtype=int)
+        for j in range(n):
+            self._aplus[j], self._aminus[j] = self._ideals(j)
+            self._update_column(j)
+
+    def _insert(self, slot):
+        W = self._partials['W']
+        W[slot] = self._weighted(self._matrix[slot][np.newaxis])[0]
+
+        # distances to the current ideal solutions
+        for j in range(W.shape[1]):
+            self._extrema[j].push(W[slot, j, 0], slot)
+            dplus, dminus = self._distances([slot], j)
+            self._partials['Dp'][slot, j], self._partials['Dm'][slot, j] = dplus[0], dminus[0]
+        self._partials['Sp'][slot] = np.sum(self._partials['Dp'][slot])
+        self._partials['Sm'][slot] = np.sum(self._partials['Dm'][slot])
+
+        return self._update_ideals(range(W.shape[1]))
+
+    def _delete(self, slot):
+        columns = np.flatnonzero((self._aplus == slot) | (self._aminus == slot))
+        return self._update_ideals(columns)
+
+    def _score(self, slots):
+        splus, sminus = self._partials['Sp'][slots], self._partials['Sm'][slots]
+
+        f = 1 / (2 * self._matrix.shape[1])
+        if self.distance.__name__ == 'normalized_euclidean_distance':
+            splus, sminus = np.sqrt(f * splus), np.sqrt(f * sminus)
+        elif self.distance.__name__ == 'normalized_hamming_distance':
+            splus, sminus = f * splus, f * sminus
+
+        return sminus / (splus + sminus)
+
+
+class IncrementalARAS(_IncrementalEvaluator):
+    def __init__(self, matrix, weights, types, normalization=swap_normalization, score=wan_dong_score_1):
+        """
+            Creates Intuitionistic Fuzzy ARAS evaluator updated when alternatives are added or removed.
+            The overall performance rating of each alternative is kept, only the optimal alternative
+            is recalculated when it changes. With normalization other than None or swap_normalization,
+            the whole matrix is evaluated after each change.
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                weights : ndarray
+                    Vector of criteria weights in a crisp or Intuitionistic Fuzzy form
+
+                types : ndarray
+                    Types of criteria, 1 profit, -1 cost
+
+                normalization : callable, default=swap_normalization
+                    Function used to calculate normalized decision matrix
+
+                score : callable, default=wan_dong_score_1
+                    Function used to calculate crisp score of IFS
+        """
+        # validate data
+        Validator.ifs_validation(matrix, weights, types)
+
+        self.score = score
+        incremental = normalization is None or normalization in ROW_NORMALIZATIONS
+        super().__init__(matrix, weights, types, normalization, incremental)
+
+    def _evaluate(self, matrix):
+        return as_float(aras_ifs(matrix, self.weights, self.types, self.normalization, self.score))
+
+    def _performance(self, matrix):
+        if self.normalization is not None:
+            matrix = self.normalization(matrix, self.types)
+
+        # the same weighting as in the ARAS calculations
+        return np.sum(self.score(multiply(matrix, self.weights, axis=1)), axis=1)
+
+    def _optimal(self):
+        slots = np.zeros(len(self._extrema), dtype=int)
+        for j, extrema in enumerate(self._extrema):
+            slots[j] = extrema.argmax(self._alive) if self.types[j] == 1 else extrema.argmin(self._alive)
+        return slots
+
+    def _update_optimal(self):
+        slots = self._optimal()
+        if np.array_equal(slots, self._R):
+            return False
+
+        n = self._matrix.shape[1]
+        self._R = slots
+        self._M0 = self._performance(self._matrix[slots, np.arange(n)][np.newaxis])[0]
+        return True
+
+    def _initialize(self):
+        m, n = self._size, self._matrix.shape[1]
+        self._partials = {'M': self._performance(self._matrix[:m])}
+        self._extrema = [_ColumnExtrema(self._matrix[:m, j, 0]) for j in range(n)]
+        self._R = None
+        self._update_optimal()
+
+    def _insert(self, slot):
+        self._partials['M'][slot] = self._performance(self._matrix[slot][np.newaxis])[0]
+        for j, extrema in enumerate(self._extrema):
+            extrema.push(self._matrix[slot, j, 0], slot)
+        return self._update_optimal()
+
+    def _delete(self, slot):
+        if slot not in self._R:
+            return False
+        return self._update_optimal()
+
+    def _score(self, slots):
+        return self._partials['M'][slots] / self._M0
+
+
+class IncrementalMARCOS(_IncrementalEvaluator):
+    def __init__(self, matrix, weights, types):
+        """
+            Creates Intuitionistic Fuzzy MARCOS evaluator updated when alternatives are added or removed.
+            Weighted sums of each alternative are kept, only the ideal and anti-ideal solutions
+            are recalculated when criteria extrema change.
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                weights : ndarray
+                    Vector of criteria weights in a crisp or Intuitionistic Fuzzy form
+
+                types : ndarray
+                    Types of criteria, 1 profit, -1 cost.
+                    Criteria types cannot be all profit or all cost.
+        """
+        # validate data
+        Validator.ifs_validation(matrix, weights, types, mixed_types=True)
+
+        # if ifs weights, convert to to crisp
+        if not isinstance(weights[0], (float, np.floating)):
+            weights = chen_score_1(weights)
+
+        super().__init__(matrix, weights, types, None)
+
+    def _evaluate(self, matrix):
+        return as_float(marcos_ifs(matrix, self.weights, self.types))
+
+    def _if_values(self, matrix):
+        if matrix.shape[2] == 2:
+            pi = 1 - matrix[:, :, 0] - matrix[:, :, 1]
+        else:
+            pi = matrix[:, :, 2]
+
+        # the same aggregation as in the MARCOS calculations
+        matrix_p = np.sqrt((matrix[:, :, 0] - 1)**2 + matrix[:, :, 1]**2 + pi**2)
+        matrix_m = np.sqrt(matrix[:, :, 0]**2 + (matrix[:, :, 1] - 1)**2 + pi**2)
+        return matrix_m / (matrix_m + matrix_p)
+
+    def _sums(self, X):
+        profit, cost = self.types == 1, self.types == -1
+        return np.sum(X[..., profit] * self.weights[profit], axis=-1), np.sum(self.weights[cost] / X[..., cost], axis=-1)
+
+    def _update_solutions(self):
+        X = self._partials['X']
+        cmax = np.array([X[e.argmax(self._alive), j] for j, e in enumerate(self._extrema)])
+        cmin = np.array([X[e.argmin(self._alive), j] for j, e in enumerate(self._extrema)])
+        if self._cmax is not None and np.array_equal(cmax, self._cmax) and np.array_equal(cmin, self._cmin):
+            return False
+
+        profit, cost = self.types == 1, self.types == -1
+        self._cmax, self._cmin = cmax, cmin
+        self._gmax = np.max(cmax[profit])
+        self._gmin = np.min(cmin[cost])
+
+        # weighted sums of the ideal and anti-ideal solutions
+        self._ideal = self._sums(np.where(profit, cmax, cmin))
+        self._anti_ideal = self._sums(np.where(profit, cmin, cmax))
+        return True
+
+    def _initialize(self):
+        m, n = self._size, self._matrix.shape[1]
+        X = self._if_values(self._matrix[:m])
+        P, C = self._sums(X)
+        self._partials = {'X': X, 'P': P, 'C': C}
+        self._extrema = [_ColumnExtrema(X[:, j]) for j in range(n)]
+        self._cmax, self._cmin = None, None
+        self._update_solutions()
+
+    def _insert(self, slot):
+        X = self._partials['X']
+        X[slot] = self._if_values(self._matrix[slot][np.newaxis])[0]
+        self._partials['P'][slot], self._partials['C'][slot] = self._sums(X[slot])
+        for j, extrema in enumerate(self._extrema):
+            extrema.push(X[slot, j], slot)
+        return self._update_solutions()
+
+    def _delete(self, slot):
+        return self._update_solutions()
+
+    def _score(self, slots):
+        def s(P, C):
+            return P / self._gmax + self._gmin * C
+
+        smatrix = s(self._partials['P'][slots], self._partials['C'][slots])
+
+        # utility degree
+        km = smatrix / s(*self._anti_ideal)
+        kp = smatrix / s(*self._ideal)
+
+        # anti-ideal and ideal solutions utility functions
+        fkm = kp / (kp + km)
+        fkp = km / (kp + km)
+
+        # final utility function
+        return (kp + km) / (1 + ((1 - fkp) / fkp) + ((1 - fkm) / fkm))
+
+
+class _RowEvaluator(_IncrementalEvaluator):
+    """
+        Base object for the evaluators which aggregate each alternative independently from the others.
+        After a change only the terms of the changed alternative are recalculated. With the normalizations
+        based on the extreme values of the criteria, the extrema are kept in heaps, and the matrix is normalized
+        again only if the change moves the extremum, then the terms are recalculated for the alternatives
+        with changed normalized values. Other normalizations normalize the matrix again after each change.
+    """
+
+    # preferences depend on the terms of all alternatives
+    _global = False
+
+    def _normalized(self, matrix):
+        if self.normalization is None:
+            return matrix
+        return self.normalization(matrix, self.types)
+
+    def _ifs_weights(self):
+        weights = self.weights
+        if weights.ndim == 1:
+            weights = np.repeat(weights, 2).reshape((len(weights), 2))
+        return weights
+
+    def _set_rows(self, slots, nmatrix):
+        self._partials['N'][slots] = nmatrix
+        for name, values in self._terms(nmatrix, self._matrix[slots]).items():
+            self._partials[name][slots] = values
+
+    def _initialize(self):
+        m = self._size
+        nmatrix = as_float(self._normalized(self._matrix[:m]))
+        self._partials = {'N': nmatrix.copy(), **self._terms(nmatrix, self._matrix[:m])}
+
+        if self.normalization in EXTREMA_NORMALIZATIONS:
+            n, c = self._matrix.shape[1:]
+            self._extrema = [[_ColumnExtrema(self._matrix[:m, j, k]) for k in range(c)] for j in range(n)]
+            self._bounds = self._matrix[self._extreme_slots(), np.arange(n)[:, None, None], np.arange(c)[None, :, None]]
+
+    def _extreme_slots(self):
+        # slots of the maximum and minimum of each component of each criterion, of shape (n, c, 2)
+        slots = np.zeros((len(self._extrema), len(self._extrema[0]), 2), dtype=int)
+        for j, column in enumerate(self._extrema):
+            for k in range(len(column)):
+                values = self._matrix[:, j, k]
+                # heaps with many outdated values are built again from the evaluated alternatives
+                if len(column[k]) > 2 * self._size + 16:
+                    live = self._live_slots()
+                    column[k] = _ColumnExtrema(values[live], live)
+                slots[j, k] = column[k].argmax(self._alive, values), column[k].argmin(self._alive, values)
+        return slots
+
+    def _refresh(self, slot, j=None):
+        if self.normalization is None or self.normalization in ROW_NORMALIZATIONS:
+            if self._alive[slot]:
+                self._set_rows(np.array([slot]), self._normalized(self._matrix[slot][np.newaxis]))
+            return self._global
+
+        if self.normalization in EXTREMA_NORMALIZATIONS:
+            n, c = self._matrix.shape[1:]
+            if self._alive[slot]:
+                for column in range(n) if j is None else [j]:
+                    for k, extrema in enumerate(self._extrema[column]):
+                        extrema.push(self._matrix[slot, column, k], slot)
+
+            extreme = self._extreme_slots()
+            bounds = self._matrix[extreme, np.arange(n)[:, None, None], np.arange(c)[None, :, None]]
+            if np.array_equal(bounds, self._bounds):
+                # other alternatives keep their normalized values, the changed alternative is normalized
+                # together with the alternatives of the extreme values
+                if self._alive[slot]:
+                    matrix = np.concatenate((self._matrix[extreme.ravel()], self._matrix[slot][np.newaxis]))
+                    self._set_rows(np.array([slot]), as_float(self._normalized(matrix))[-1:])
+                return self._global
+            self._bounds = bounds
+
+        slots = self._live_slots()
+        nmatrix = as_float(self._normalized(self._matrix[slots]))
+        changed = np.any(nmatrix != self._partials['N'][slots], axis=(1, 2)) | (slots == slot)
+        self._set_rows(slots[changed], nmatrix[changed])
+        return self._global or bool(np.any(slots[changed] != slot))
+
+    def _insert(self, slot):
+        return self._refresh(slot)
+
+    def _delete(self, slot):
+        return self._refresh(slot)
+
+    def _update(self, slot, j):
+        return self._refresh(slot, j)
+
+
+class IncrementalWSM(_RowEvaluator):
+    def __init__(self, matrix, weights, types, score=chen_score_1, normalization=None):
+        """
+            Creates Intuitionistic Fuzzy WSM evaluator updated when single values or alternatives change.
+            The weighted sum of each alternative is kept and recalculated only for the changed alternative.
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                weights : ndarray
+                    Vector of criteria weights in a crisp or Intuitionistic Fuzzy form
+
+                types : ndarray
+                    Types of criteria, 1 profit, -1 cost
+
+                score: callable, default=chen_score_1
+                    Function used to calculate crisp score of IFS
+
+                normalization: callable, default=None
+                    Function used to normalize the decision matrix
+        """
+        # validate data
+        Validator.ifs_validation(matrix, weights, types)
+
+        self.score = score
+        super().__init__(matrix, weights, types, normalization)
+
+    def _evaluate(self, matrix):
+        return as_float(wsm_ifs(matrix, self.weights, self.types, self.normalization, self.score))
+
+    def _terms(self, nmatrix, matrix):
+        # the same weighting as in the WSM calculations
+        return {'Q': np.sum(multiply(nmatrix, self.weights, axis=1), axis=1)}
+
+    def _score(self, slots):
+        return as_float(elementwise_score(self.score, self._partials['Q'][slots]))
+
+
+class IncrementalWPM(_RowEvaluator):
+    def __init__(self, matrix, weights, types, score=chen_score_1, normalization=None):
+        """
+            Creates Intuitionistic Fuzzy WPM evaluator updated when single values or alternatives change.
+            The weighted product of each alternative is kept and recalculated only for the changed alternative.
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                weights : ndarray
+                    Vector of criteria weights in a crisp or Intuitionistic Fuzzy form
+
+                types : ndarray
+                    Types of criteria, 1 profit, -1 cost
+
+                score: callable, default=chen_score_1
+                    Function used to calculate crisp score of IFS
+
+                normalization: callable, default=None
+                    Function used to normalize the decision matrix
+        """
+        # validate data
+        Validator.ifs_validation(matrix, weights, types)
+
+        self.score = score
+        super().__init__(matrix, weights, types, normalization)
+
+    def _evaluate(self, matrix):
+        return as_float(wpm_ifs(matrix, self.weights, self.types, self.normalization, self.score))
+
+    def _terms(self, nmatrix, matrix):
+        # the same weighting as in the WPM calculations
+        return {'Q': np.prod(power(nmatrix, self.weights, axis=1), axis=1)}
+
+    def _score(self, slots):
+        return as_float(elementwise_score(self.score, self._partials['Q'][slots]))
+
+
+class IncrementalWASPAS(_RowEvaluator):
+    def __init__(self, matrix, weights, types, score=chen_score_1, normalization=None, v=0.5):
+        """
+            Creates Intuitionistic Fuzzy WASPAS evaluator updated when single values or alternatives change.
+            The weighted sum and product of each alternative are kept and recalculated only for the changed alternative.
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                weights : ndarray
+                    Vector of criteria weights in a crisp or Intuitionistic Fuzzy form
+
+                types : ndarray
+                    Types of criteria, 1 profit, -1 cost
+
+                score: callable, default=chen_score_1
+                    Function used to calculate crisp score of IFS
+
+                normalization: callable, default=None
+                    Function used to normalize the decision matrix
+
+                v: float, default=0.5
+                    The aggregating coefficient of decision precision
+        """
+        # validate data
+        Validator.ifs_validation(matrix, weights, types)
+
+        self.score = score
+        self.v = v
+        super().__init__(matrix, weights, types, normalization)
+
+    def _evaluate(self, matrix):
+        return as_float(waspas_ifs(matrix, self.weights, self.types, self.normalization, self.score, self.v))
+
+    def _terms(self, nmatrix, matrix):
+        # the same aggregations as in the WASPAS calculations
+        return {'WSM': ifwa(nmatrix, self.weights, axis=1), 'WPM': ifwg(nmatrix, self.weights, axis=1)}
+
+    def _score(self, slots):
+        Q1 = 1/2 * (self.score(self._partials['WSM'][slots]) + 1)
+        Q2 = 1/2 * (self.score(self._partials['WPM'][slots]) + 1)
+        return self.v * Q1 + (1 - self.v) * Q2
+
+
+class IncrementalCOPRAS(_RowEvaluator):
+    # relative significance depends on the indexes of all alternatives
+    _global = True
+
+    def __init__(self, matrix, weights, types, score=thakur_score, normalization=None):
+        """
+            Creates Intuitionistic Fuzzy COPRAS evaluator updated when single values or alternatives change.
+            The maximizing and minimizing indexes of each alternative are kept and recalculated only for
+            the changed alternative. The relative significance depends on all alternatives,
+            so it is recalculated from the kept indexes after each change.
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                weights : ndarray
+                    Vector of criteria weights in a crisp or Intuitionistic Fuzzy form
+
+                types : ndarray
+                    Types of criteria, 1 profit, -1 cost
+
+                score: callable, default=thakur_score
+                    Function used to calculate crisp score of IFS
+
+                normalization: callable, default=None
+                    Function used to normalize the decision matrix
+        """
+        # validate data
+        Validator.ifs_validation(matrix, weights, types)
+
+        self.score = score
+        super().__init__(matrix, weights, types, normalization)
+
+    def _evaluate(self, matrix):
+        return as_float(copras_ifs(matrix, self.weights, self.types, self.normalization, self.score))
+
+    def _terms(self, nmatrix, matrix):
+        weights = self._ifs_weights()
+
+        # the same weighting as in the COPRAS calculations
+        wmatrix = np.zeros(nmatrix.shape, dtype=get_dtype())
+        wmatrix[:, :, 0] = np.sqrt(1 - (1 - nmatrix[:, :, 0] ** 2) ** weights[:, 0])
+        wmatrix[:, :, 1] = np.sqrt((nmatrix[:, :, 1] ** 2) ** weights[:, 1])
+        s = self.score(wmatrix)
+
+        return {
+            'Sp': np.sum(s[:, self.types == 1], axis=1) / np.sum(self.types == 1),
+            'Sr': np.sum(s[:, self.types == -1], axis=1) / np.sum(self.types == -1),
+        }
+
+    def _score(self, slots):
+        Sp, Sr = self._partials['Sp'][slots], self._partials['Sr'][slots]
+
+        # relative significance value of each alternative
+        N = np.sum(np.exp(Sr)) / np.sum(1 / np.exp(Sr))
+        Q = Sp + (N / np.exp(Sr))
+        return Q / np.max(Q)
+
+
+class IncrementalMOORA(_RowEvaluator):
+    def __init__(self, matrix, weights, types, score=zhang_xu_score_2, normalization=None):
+        """
+            Creates Intuitionistic Fuzzy MOORA evaluator updated when single values or alternatives change.
+            The aggregated benefits and costs of each alternative are kept and recalculated only for
+            the changed alternative.
+
+            Parameters
+            ----------
+                matrix : ndarray
+                    Decision matrix / alternatives data.
+                    Alternatives are in rows and Criteria are in columns.
+
+                weights : ndarray
+                    Vector of criteria weights in a crisp or Intuitionistic Fuzzy form
+
+                types : ndarray
+                    Types of criteria, 1 profit, -1 cost.
+                    Criteria types cannot be all profit or all cost.
+
+                score: callable, default=zhang_xu_score_2
+                    Function used to calculate crisp score of IFS
+
+                normalization: callable, default=None
+                    Function used to normalize the decision matrix
+        """
+        # validate data
+        Validator.ifs_validation(matrix, weights, types, mixed_types=True)
+
+        self.score = score
+        super().__init__(matrix, weights, types, normalization)
+
+    def _evaluate(self, matrix):
+        return as_float(moora_ifs(matrix, self.weights, self.types, self.normalization, self.score))
+
+    def _terms(self, nmatrix, matrix):
+        # the same weighting as in the MOORA calculations
+        wmatrix = product(nmatrix, self.weights, axis=1)
+        u, v = wmatrix[:, :, 0], wmatrix[:, :, 1]
+
+        # sum of benefits and costs
+        terms = {}
+        for name, columns in [('Sp', self.types == 1), ('Sm', self.types == -1)]:
+            S = np.zeros((nmatrix.shape[0], 3), dtype=get_dtype())
+            S[:, 0] = 1 - np.prod(1 - u[:, columns], axis=1)
+            S[:, 1] = np.prod(v[:, columns], axis=1)
+            S[:, 2] = 1 - S[:, 0] - S[:, 1]
+            terms[name] = S
+        return terms
+
+    def _score(self, slots):
+        return self.score(self._partials['Sp'][slots]) - self.score(self._partials['Sm'][slots])
@@ -1,8 +1,15 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
-
-def ifs(matrix, weights, types, normalization, distance, score,p, g):
+from ...profiling import stage
+from ..ifs.normalization import apply_normalization
+from ..ifs.score import elementwise_score
+from ...workspace import Workspace
+from ...aggregation import ifwg, power
+from ..ifs.distance import elementwise_distance
+from ...precision import get_dtype
+
+def ifs(matrix, weights, types, normalization, distance, score,p, g, workspace=None):
     """
         Calculates the alternatives preferences based on Intuitionistic Fuzzy Sets
 
@@ -32,7 +39,10 @@ def ifs(matrix, weights, types, normalization, distance, score,p, g):
 
             g: float
                 Adjust parameter for distance calculation
-        
+
+            workspace: Workspace, default=None
+                Buffers for the intermediate arrays reused between the calls
+
         Returns
         -------
             ndarray
@@ -40,9 +50,9 @@ def ifs(matrix, weights, types, normalization, distance, score,p, g):
 
     """
 
-    def calculate_distance(method, wmatrix, G, f):
+    def calculate_distance(method, wmatrix, G, f, out):
         """
-            Calculates the distance between two Intuitionistic Fuzzy Sets (u, v) using given distance measure
+            Calculates the distances between elements of weighted matrix and border approximation area using given distance measure
 
             Parameters
             ----------
@@ -58,50 +68,54 @@ def ifs(matrix, weights, types, normalization, distance, score,p, g):
                 f : float
                     Multiplication factor
 
+                out : ndarray
+                    Array to store the distances
+
             Returns
             -------
-                float
-                    Crisp value representing distance
+                ndarray
+                    Crisp values representing distances
         """
+        d = elementwise_distance(method, wmatrix, G, out=out)
         if method.__name__ == 'normalized_euclidean_distance':
-            return np.sqrt(f * method(wmatrix, G))
+            return np.sqrt(f * d, out=d)
         elif method.__name__ == 'normalized_hamming_distance':
-            return f * method(wmatrix, G)
+            return np.multiply(f, d, out=d)
         else:
-            return method(wmatrix, G)
+            return d
+
+    # buffers reused between the calls of the method object
+    workspace = Workspace() if workspace is None else workspace
 
     # normalized matrix
-    nmatrix = normalization(matrix, types)
+    with stage('MABAC', 'normalization'):
+        nmatrix = apply_normalization(normalization, matrix, types, out=workspace.get('nmatrix', matrix.shape))
 
     # weighted matrix
-    wmatrix = np.zeros((nmatrix.shape[0], nmatrix.shape[1], 3), dtype=object)
-    
-    if weights.ndim == 1:
-        weights = np.repeat(weights, 2).reshape((len(weights), 2))
-
-    # intuitionistic fuzzy weighted geometric (IFWG) operator
-    wmatrix[:, :, 0] = nmatrix[:, :, 0]**weights[:, 0]
-    wmatrix[:, :, 1] = 1 - (1 - nmatrix[:, :, 1])**weights[:, 1]
-    wmatrix[:, :, 2] = 1 - wmatrix[:, :, 0] - wmatrix[:, :, 1]
+    with stage('MABAC', 'weighting'):
+        # weighting of the intuitionistic fuzzy weighted geometric (IFWG) operator
+        wmatrix = power(nmatrix, weights, axis=1, out=workspace.get('wmatrix', (nmatrix.shape[0], nmatrix.shape[1], 3)))
 
     # border approximation area
-    G = np.zeros((wmatrix.shape[1], wmatrix.shape[2]), dtype=object)
-    G[:, 0] = np.prod(wmatrix[:, :, 0], axis=0)**(1/wmatrix.shape[0])
-    G[:, 1] = 1 - np.prod(1 - wmatrix[:, :, 1], axis=0)**(1/wmatrix.shape[0])
-
-    f = 1
-    if 'normalized' in distance.__name__:
-        f = 1/(2*matrix.shape[1])
-
-    # discrimination measures
-    DM = np.zeros((wmatrix.shape[0], wmatrix.shape[1]))
-    for i in range(wmatrix.shape[0]):
-        for j in range(wmatrix.shape[1]):
-            if score(wmatrix[i,j]) > score(G[j]):
-                DM[i,j] = calculate_distance(distance, wmatrix[i,j], G[j], f)**g
-            else:
-                DM[i, j] = -p * calculate_distance(distance, wmatrix[i,j], G[j], f)**g
+    with stage('MABAC', 'ideal'):
+        # border approximation area aggregated with equal weights, its hesitancy is kept equal to 0
+        G = np.zeros((wmatrix.shape[1], wmatrix.shape[2]), dtype=get_dtype())
+        ifwg(wmatrix[:, :, :2], axis=0, out=G[:, :2])
+
+    with stage('MABAC', 'distance'):
+        f = 1
+        if 'normalized' in distance.__name__:
+            f = 1/(2*matrix.shape[1])
+
+        # discrimination measures
+        better = workspace.get('better', wmatrix.shape[:2], dtype=bool)
+        np.greater(elementwise_score(score, wmatrix, out=workspace.get('scores', wmatrix.shape[:2])), score(G), out=better)
+
+        DM = calculate_distance(distance, wmatrix, G, f, workspace.get('DM', wmatrix.shape[:2]))
+        np.power(DM, g, out=DM)
+        DM[~better] *= -p
 
     # assessment score
-    C = np.sum(DM, axis=1)
-    return C
+    with stage('MABAC', 'aggregation'):
+        C = np.sum(DM, axis=1)
+        return C
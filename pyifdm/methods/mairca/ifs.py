@@ -1,8 +1,12 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+from ...profiling import stage
+from ..ifs.normalization import apply_normalization
+from ...workspace import Workspace
+from ...encoding import apply_distance
 
-def ifs(matrix, weights, types, normalization, distance, score):
+def ifs(matrix, weights, types, normalization, distance, score, workspace=None):
     """
         Calculates the alternatives preferences based on Intuitionistic Fuzzy Sets
 
@@ -26,7 +30,10 @@ def ifs(matrix, weights, types, normalization, distance, score):
 
             score: callable
                 Function used to calculate crisp score of IFS
-                
+
+            workspace: Workspace, default=None
+                Buffers for the intermediate arrays reused between the calls
+
         Returns
         -------
             ndarray
@@ -38,47 +45,50 @@ def ifs(matrix, weights, types, normalization, distance, score):
     if 'normalized' in distance.__name__:
         f = 1/(2*matrix.shape[1])
 
-    # distance measures
-    dm = np.zeros((matrix.shape[0], matrix.shape[1], 2), dtype=object)
-    for i in range(matrix.shape[0]):
-        for j in range(matrix.shape[1]):
-            if distance.__name__ == 'normalized_euclidean_distance':
-                dm[i, j, 0] = np.sqrt(f * distance(matrix[i, j], np.array([1, 0, 0])))
-                dm[i, j, 1] = np.sqrt(f * distance(matrix[i, j], np.array([0, 1, 0])))
-            elif distance.__name__ == 'normalized_hamming_distance':
-                dm[i, j, 0] = f * distance(matrix[i, j], np.array([1, 0, 0]))
-                dm[i, j, 1] = f * distance(matrix[i, j], np.array([0, 1, 0]))
-            else:
-                dm[i, j, 0] = distance(matrix[i, j], np.array([1, 0, 0]))
-                dm[i, j, 1] = distance(matrix[i, j], np.array([0, 1, 0]))
+    # buffers reused between the calls of the method object
+    workspace = Workspace() if workspace is None else workspace
+
+    # distance measures, evaluated once per term for the encoded matrix
+    with stage('MAIRCA', 'distance'):
+        dm = workspace.get('dm', (matrix.shape[0], matrix.shape[1], 2))
+        apply_distance(distance, matrix, np.array([1, 0, 0], dtype=dm.dtype), out=dm[:, :, 0])
+        apply_distance(distance, matrix, np.array([0, 1, 0], dtype=dm.dtype), out=dm[:, :, 1])
+        if distance.__name__ == 'normalized_euclidean_distance':
+            dm *= f
+            np.sqrt(dm, out=dm)
+        elif distance.__name__ == 'normalized_hamming_distance':
+            dm *= f
 
     # normalization condition for different methods than in reference research paper
-    if normalization.__name__ != 'minmax_normalization':
-        dm =  normalization(dm, types)
+    with stage('MAIRCA', 'normalization'):
+        if normalization.__name__ != 'minmax_normalization':
+            dm = apply_normalization(normalization, dm, types, out=workspace.get('ndm', dm.shape))
 
-    # closeness coefficient
-    cw = dm[:, :, 1] / (dm[:, :, 1] + dm[:, :, 0])
+        # closeness coefficient
+        cw = dm[:, :, 1] / (dm[:, :, 1] + dm[:, :, 0])
 
-    # normalized matrix
-    if normalization.__name__ == 'minmax_normalization':
-        nmatrix = normalization(cw, types)
-    else:
-        nmatrix = cw
+        # normalized matrix
+        if normalization.__name__ == 'minmax_normalization':
+            nmatrix = apply_normalization(normalization, cw, types, out=workspace.get('nmatrix', cw.shape))
+        else:
+            nmatrix = cw
 
     # crisp weights
-    if weights.ndim == 2:
-        weights = np.array([score(w) for w in weights])
+    with stage('MAIRCA', 'ideal'):
+        if weights.ndim == 2:
+            weights = np.array([score(w) for w in weights])
 
-    # theoretical intuitionistic fuzzy decision matrix
-    tdm = 1 / matrix.shape[0] * nmatrix * weights
-    tdm = np.tile(np.max(tdm, axis=0), nmatrix.shape[0]).reshape((nmatrix.shape[0], nmatrix.shape[1]))
+        # theoretical intuitionistic fuzzy decision matrix
+        tdm = 1 / matrix.shape[0] * nmatrix * weights
+        tdm = np.tile(np.max(tdm, axis=0), nmatrix.shape[0]).reshape((nmatrix.shape[0], nmatrix.shape[1]))
 
     # real evaluation matrix
-    rem = nmatrix * tdm
+    with stage('MAIRCA', 'aggregation'):
+        rem = nmatrix * tdm
 
-    # gap matrix
-    gm = tdm - rem
+        # gap matrix
+        gm = tdm - rem
 
-    # utility score
-    s = np.sum(gm, axis=1)
-    return s
+        # utility score
+        s = np.sum(gm, axis=1)
+        return s
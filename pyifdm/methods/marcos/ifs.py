@@ -1,9 +1,13 @@
 # Copyright (c) 2023 Jakub Więckowski
 
 import numpy as np
+from ...profiling import stage
+from ...workspace import Workspace
+from ...precision import get_dtype
 from ..ifs.score import chen_score_1
+from ...encoding import CodebookMatrix, QuantizedMatrix
 
-def ifs(matrix, weights, types):
+def ifs(matrix, weights, types, workspace=None):
     """
         Calculates the alternatives preferences based on Intuitionistic Fuzzy Sets
 
@@ -18,6 +22,9 @@ def ifs(matrix, weights, types):
 
             types : ndarray
                 Types of criteria, 1 profit, -1 cost
+
+            workspace: Workspace, default=None
+                Buffers for the intermediate arrays reused between the calls
         Returns
         -------
             ndarray
@@ -25,56 +32,72 @@ def ifs(matrix, weights, types):
 
     """
 
+    # buffers reused between the calls of the method object
+    workspace = Workspace() if workspace is None else workspace
+
     # if ifs weights, convert to to crisp
     if not isinstance(weights[0], (float, np.floating)):
         weights = chen_score_1(weights)
 
-    if matrix.shape[2] == 2:
-        new_matrix = np.zeros((matrix.shape[0], matrix.shape[1], matrix.shape[2] + 1))
-        new_matrix[:, :, 0] = matrix[:, :, 0]
-        new_matrix[:, :, 1] = matrix[:, :, 1]
-        new_matrix[:, :, 2] = 1 - (matrix[:, :, 0] + matrix[:, :, 1])  
-        matrix = new_matrix
-
-    # aggregated IF decision matrix
-    matrix_p =  np.sqrt((matrix[:, :, 0] - 1)**2 + (matrix[:, :, 1] - 0)**2 + (matrix[:, :, 2] - 0)**2)
-    matrix_m =  np.sqrt((matrix[:, :, 0] - 0)**2 + (matrix[:, :, 1] - 1)**2 + (matrix[:, :, 2] - 0)**2)
-    if_matrix = matrix_m / (matrix_m + matrix_p)
-
-    # Extended initial IF decision matrix
-    exmatrix = np.zeros((if_matrix.shape[0] + 2, if_matrix.shape[1]))
-    exmatrix[:-2] = if_matrix
-
-    for i in range(if_matrix.shape[1]):
-        if types[i] == 1:
-            exmatrix[-2, i] = np.max(if_matrix[:, i])
-            exmatrix[-1, i] = np.min(if_matrix[:, i])
+    def aggregate(matrix):
+        if matrix.shape[2] == 2:
+            new_matrix = workspace.get('new_matrix', (matrix.shape[0], matrix.shape[1], matrix.shape[2] + 1))
+            new_matrix[:, :, 0] = matrix[:, :, 0]
+            new_matrix[:, :, 1] = matrix[:, :, 1]
+            new_matrix[:, :, 2] = 1 - (matrix[:, :, 0] + matrix[:, :, 1])  
+            matrix = new_matrix
+
+        matrix_p =  np.sqrt((matrix[:, :, 0] - 1)**2 + (matrix[:, :, 1] - 0)**2 + (matrix[:, :, 2] - 0)**2)
+        matrix_m =  np.sqrt((matrix[:, :, 0] - 0)**2 + (matrix[:, :, 1] - 1)**2 + (matrix[:, :, 2] - 0)**2)
+        return matrix_m / (matrix_m + matrix_p)
+
+    # aggregated IF decision matrix, evaluated once per term for the encoded matrix
+    with stage('MARCOS', 'score'):
+        if isinstance(matrix, CodebookMatrix):
+            if_matrix = aggregate(matrix.terms[np.newaxis].astype(get_dtype()))[0][matrix.codes]
+        elif isinstance(matrix, QuantizedMatrix):
+            if_matrix = np.concatenate([aggregate(chunk) for chunk in matrix.iter_chunks()], axis=0)
         else:
-            exmatrix[-2, i] = np.min(if_matrix[:, i])
-            exmatrix[-1, i] = np.max(if_matrix[:, i])
+            if_matrix = aggregate(matrix)
 
-    # normalized matrix
-    nmatrix = exmatrix.copy()
-    nmatrix[:, types == 1] = exmatrix[:, types == 1] / np.max(exmatrix[:, types == 1])
-    nmatrix[:, types == -1] = np.min(exmatrix[:, types == -1]) / exmatrix[:, types == -1]
+    # Extended initial IF decision matrix
+    with stage('MARCOS', 'ideal'):
+        exmatrix = workspace.get('exmatrix', (if_matrix.shape[0] + 2, if_matrix.shape[1]))
+        exmatrix[:-2] = if_matrix
+
+        for i in range(if_matrix.shape[1]):
+            if types[i] == 1:
+                exmatrix[-2, i] = np.max(if_matrix[:, i])
+                exmatrix[-1, i] = np.min(if_matrix[:, i])
+            else:
+                exmatrix[-2, i] = np.min(if_matrix[:, i])
+                exmatrix[-1, i] = np.max(if_matrix[:, i])
+
+    # normalized matrix, calculated in place of the extended matrix
+    with stage('MARCOS', 'normalization'):
+        nmatrix = exmatrix
+        nmatrix[:, types == 1] /= np.max(exmatrix[:, types == 1])
+        nmatrix[:, types == -1] = np.min(exmatrix[:, types == -1]) / exmatrix[:, types == -1]
 
     # weighted matrix
-    wmatrix = nmatrix * weights
+    with stage('MARCOS', 'weighting'):
+        wmatrix = nmatrix * weights
 
     # s matrix
-    smatrix = np.sum(wmatrix, axis=1)
+    with stage('MARCOS', 'aggregation'):
+        smatrix = np.sum(wmatrix, axis=1)
+
+        # utility degree
+        km = (smatrix / smatrix[-1])[:-2]
+        kp = (smatrix / smatrix[-2])[:-2]
 
-    # utility degree
-    km = (smatrix / smatrix[-1])[:-2]
-    kp = (smatrix / smatrix[-2])[:-2]
+        # anti-ideal and ideal solutions utility functions
+        fkm = kp / (kp + km)
+        fkp = km / (kp + km)
 
-    # anti-ideal and ideal solutions utility functions
-    fkm = kp / (kp + km)
-    fkp = km / (kp + km)
-    
-    # final utility function
-    f = (kp + km) / ( 1 + ((1 - fkp) / fkp) + ((1 - fkm) / fkm) )
+        # final utility function
+        f = (kp + km) / ( 1 + ((1 - fkp) / fkp) + ((1 - fkm) / fkm) )
 
-    return f
+        return f
 
 
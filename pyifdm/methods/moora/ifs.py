@@ -1,8 +1,27 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
-
-def ifs(matrix, weights, types, normalization, score):
+from ...profiling import stage
+from ..ifs.normalization import apply_normalization
+from ..ifs.score import elementwise_score
+from ...workspace import Workspace
+from ...aggregation import product
+from ...backend import get_backend, jit
+
+@jit
+def _fold(wmatrix, indexes, out):
+    # sequential algebraic sum of membership and product of non-membership degrees
+    for i in range(wmatrix.shape[0]):
+        u, v = 0.0, 1.0
+        for idx in indexes:
+            u = u + wmatrix[i, idx, 0] - u * wmatrix[i, idx, 0]
+            v = v * wmatrix[i, idx, 1]
+        out[i, 0] = u
+        out[i, 1] = v
+        out[i, 2] = 1 - u - v
+    return out
+
+def ifs(matrix, weights, types, normalization, score, workspace=None):
     """
         Calculates the alternatives preferences based on Intuitionistic Fuzzy Sets
 
@@ -24,54 +43,46 @@ def ifs(matrix, weights, types, normalization, score):
             score: callable, default
                 Function used to calculate crisp score of IFS
 
+            workspace: Workspace, default=None
+                Buffers for the intermediate arrays reused between the calls
+
         Returns
         -------
             ndarray
                 Crisp preferences of alternatives
 
     """
+    # buffers reused between the calls of the method object
+    workspace = Workspace() if workspace is None else workspace
+
     # normalized matrix
-    if normalization is not None:
-        nmatrix = normalization(matrix, types)
-    else:
-        nmatrix = matrix.copy()
+    with stage('MOORA', 'normalization'):
+        if normalization is not None:
+            nmatrix = apply_normalization(normalization, matrix, types, out=workspace.get('nmatrix', matrix.shape))
+        else:
+            nmatrix = matrix
 
     # weighted matrix
-    wmatrix = np.zeros((nmatrix.shape[0], nmatrix.shape[1], 3), dtype=object)
-
-    # crisp weights
-    if weights.ndim == 1:
-        weights = np.repeat(weights, 2).reshape((len(weights), 2))
-
-    wmatrix[:, :, 0] = nmatrix[:, :, 0] * weights[:, 0]
-    wmatrix[:, :, 1] = nmatrix[:, :, 1] + weights[:, 1] - nmatrix[:, :, 1] * weights[:, 1]
-    wmatrix[:, :, 2] = 1 - wmatrix[:, :, 1] - wmatrix[:, :, 0]
+    with stage('MOORA', 'weighting'):
+        wmatrix = product(nmatrix, weights, axis=1, out=workspace.get('wmatrix', (nmatrix.shape[0], nmatrix.shape[1], 3)))
 
     # sum of costs and benefits
-    Sp, Sm  = np.zeros((matrix.shape[0], 3)), np.zeros((matrix.shape[0], 3))
-    profit_indexes = np.where(types == 1)
-    cost_indexes = np.where(types == -1)
-    for i in range(wmatrix.shape[0]):
-        profit = wmatrix[i, profit_indexes[0][0]]
-        cost = wmatrix[i, cost_indexes[0][0]]
-
-        for idx in profit_indexes[0][1:]:
-            profit[0] = profit[0] + wmatrix[i, idx, 0] - profit[0] * wmatrix[i, idx, 0]
-            profit[1] *= wmatrix[i, idx, 1]
-
-        for idx in cost_indexes[0][1:]:
-            cost[0] = cost[0] + wmatrix[i, idx, 0] - cost[0] * wmatrix[i, idx, 0]
-            cost[1] *= wmatrix[i, idx, 1]
-
-        # Sp.append([profit[0], profit[1], 1 - profit[0] - profit[1]])
-        # Sm.append([cost[0], cost[1], 1 - cost[0] - cost[1]])
-        Sp[i] = [profit[0], profit[1], 1 - profit[0] - profit[1]]
-        Sm[i] = [cost[0], cost[1], 1 - cost[0] - cost[1]]
-
-    # Sp, Sm = np.array(Sp), np.array(Sm) 
+    with stage('MOORA', 'aggregation'):
+        Sp, Sm  = workspace.get('Sp', (matrix.shape[0], 3)), workspace.get('Sm', (matrix.shape[0], 3))
+        profit_indexes = np.flatnonzero(types == 1)
+        cost_indexes = np.flatnonzero(types == -1)
+        if get_backend() == 'numba':
+            _fold(wmatrix, profit_indexes, Sp)
+            _fold(wmatrix, cost_indexes, Sm)
+        else:
+            for S, indexes in [(Sp, profit_indexes), (Sm, cost_indexes)]:
+                S[:, 0] = 1 - np.prod(1 - wmatrix[:, indexes, 0], axis=1)
+                np.prod(wmatrix[:, indexes, 1], axis=1, out=S[:, 1])
+                S[:, 2] = 1 - S[:, 0] - S[:, 1]
 
     # score functions
-    Dp = score(Sp)
-    Dm = score(Sm)
+    with stage('MOORA', 'score'):
+        Dp = elementwise_score(score, Sp, out=workspace.get('Dp', Sp.shape[:1]))
+        Dm = elementwise_score(score, Sm, out=workspace.get('Dm', Sm.shape[:1]))
 
-    return Dp - Dm
+        return Dp - Dm
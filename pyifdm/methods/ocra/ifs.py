@@ -1,7 +1,9 @@
 # Copyright (c) 2023 Jakub Więckowski
 
 import numpy as np
+from ...profiling import stage
 from pyifdm.methods.ifs.score import * 
+from ...encoding import apply_score
 
 def ifs(matrix, weights, types, score):
     """
@@ -34,24 +36,26 @@ def ifs(matrix, weights, types, score):
         weights = chen_score_1(weights)
 
 
-    # score matrix
-    smatrix = score(matrix)
+    # score matrix, evaluated once per term for the encoded matrix
+    with stage('OCRA', 'score'):
+        smatrix = apply_score(score, matrix)
 
     #  if performance rating
-    P, Q = [], []
-    for j in range(smatrix.shape[1]):
-        if types[j] == 1:
-            P.append([weights[j] * ((smatrix[i, j]) - np.min(smatrix[:, j]) / (np.max(smatrix[:, j]) - np.min(smatrix[:, j]))) for i in range(smatrix.shape[0])])
-        else:
-            Q.append([weights[j] * ((np.max(smatrix[:, j] - smatrix[i, j]) / (np.max(smatrix[:, j]) - np.min(smatrix[:, j]))))  for i in range(smatrix.shape[0])])
-
-    P = np.sum(np.array(P), axis=0)
-    Q = np.sum(np.array(Q), axis=0)
-
-    # linear performance rating
-    P -= np.min(P)
-    Q -= np.min(Q)
-
-    # overall performance rating
-    OPR = (P + Q) - np.min(P + Q)
-    return OPR
+    with stage('OCRA', 'aggregation'):
+        P, Q = [], []
+        for j in range(smatrix.shape[1]):
+            if types[j] == 1:
+                P.append([weights[j] * ((smatrix[i, j]) - np.min(smatrix[:, j]) / (np.max(smatrix[:, j]) - np.min(smatrix[:, j]))) for i in range(smatrix.shape[0])])
+            else:
+                Q.append([weights[j] * ((np.max(smatrix[:, j] - smatrix[i, j]) / (np.max(smatrix[:, j]) - np.min(smatrix[:, j]))))  for i in range(smatrix.shape[0])])
+
+        P = np.sum(np.array(P), axis=0)
+        Q = np.sum(np.array(Q), axis=0)
+
+        # linear performance rating
+        P -= np.min(P)
+        Q -= np.min(Q)
+
+        # overall performance rating
+        OPR = (P + Q) - np.min(P + Q)
+        return OPR
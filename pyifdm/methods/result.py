@@ -0,0 +1,125 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+from collections.abc import Mapping
+from ..helpers import rank, top_k
+
+
+class Result():
+    def __init__(self, preferences, descending=True, intermediates=None):
+        """
+            Results of the alternatives evaluation returned by the evaluate method
+
+            Parameters
+            ----------
+                preferences : ndarray or tuple
+                    Preferences of alternatives, tuple of the S, R, Q preferences for the VIKOR method
+
+                descending : bool, default=True
+                    Greater preferences are placed higher in ranking if True, lower otherwise
+
+                intermediates : Intermediates, default=None
+                    Intermediate arrays of the calculations
+        """
+        self.preferences = preferences
+        self.descending = descending
+        self.intermediates = Intermediates() if intermediates is None else intermediates
+
+    @property
+    def ranking(self):
+        """
+            Ranking of alternatives, for the VIKOR method rankings for the S, R, Q approaches
+        """
+        if isinstance(self.preferences, tuple):
+            return np.array([rank(pref, self.descending) for pref in self.preferences])
+        return rank(self.preferences, self.descending)
+
+    def top_k(self, k):
+        """
+            Selects the k best alternatives, without sorting all of them.
+            Alternatives with equal preferences are ordered by their index, the lower index is placed first.
+
+            Parameters
+            ----------
+                k : int
+                    Number of selected alternatives
+
+            Returns
+            ----------
+                ndarray:
+                    Indices of the k best alternatives, starting from the best one
+        """
+        if isinstance(self.preferences, tuple):
+            return np.array([top_k(pref, k, self.descending) for pref in self.preferences])
+        return top_k(self.preferences, k, self.descending)
+
+
+class Intermediates(Mapping):
+    def __init__(self, arrays=None, lazy=None):
+        """
+            Named intermediate arrays of the calculations. Lazy arrays are calculated when they are accessed for the first time.
+
+            Parameters
+            ----------
+                arrays : dict, default=None
+                    Calculated arrays
+
+                lazy : dict, default=None
+                    Functions without arguments calculating the arrays
+        """
+        self._arrays = {} if arrays is None else dict(arrays)
+        self._lazy = {} if lazy is None else dict(lazy)
+
+    def __getitem__(self, name):
+        if name not in self._arrays and name in self._lazy:
+            self._arrays[name] = self._lazy.pop(name)()
+        return self._arrays[name]
+
+    def __iter__(self):
+        return iter(list(self._arrays) + list(self._lazy))
+
+    def __len__(self):
+        return len(self._arrays) + len(self._lazy)
+
+    def __repr__(self):
+        return f'Intermediates({list(self)})'
+
+
+def collect_intermediates(workspace, explain, lazy=None):
+    """
+        Selects the intermediate arrays from the buffers of the calculations
+
+        Parameters
+        ----------
+            workspace : Workspace
+                Buffers of the calculations
+
+            explain : bool or iterable
+                True selects all buffers except the lazy arrays, which are selected only by name.
+                Names of the selected arrays can be given directly, False selects nothing
+
+            lazy : dict, default=None
+                Functions calculating the arrays which are not retained by default, e.g. of size m x m
+
+        Returns
+        -------
+            Intermediates
+                Selected intermediate arrays
+    """
+    lazy = {} if lazy is None else lazy
+    if explain is False or explain is None:
+        return Intermediates()
+    if explain is True:
+        names = [name for name in workspace.names() if name not in lazy]
+    else:
+        names = [explain] if isinstance(explain, str) else list(explain)
+
+    arrays, selected = {}, {}
+    for name in names:
+        if name in lazy:
+            selected[name] = lazy[name]
+        elif name in workspace:
+            arrays[name] = workspace[name]
+        else:
+            raise ValueError(f'Intermediate array {name} is not calculated by the method')
+    return Intermediates(arrays, selected)
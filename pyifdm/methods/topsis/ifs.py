@@ -1,8 +1,13 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+from ...profiling import stage
+from ..ifs.distance import elementwise_distance
+from ..ifs.normalization import apply_normalization
+from ...workspace import Workspace
+from ...aggregation import product
 
-def ifs(matrix, weights, types, normalization, distance):
+def ifs(matrix, weights, types, normalization, distance, workspace=None):
     """
         Calculates the alternatives preferences based on Intuitionistic Fuzzy Sets
 
@@ -23,55 +28,54 @@ def ifs(matrix, weights, types, normalization, distance):
 
             distance: callable
                 Function used to calculate distance between two IFS
+
+            workspace: Workspace, default=None
+                Buffers for the intermediate arrays reused between the calls
         Returns
         -------
             ndarray
                 Crisp preferences of alternatives
 
     """
+    # buffers reused between the calls of the method object
+    workspace = Workspace() if workspace is None else workspace
+
     # normalized matrix
-    if normalization is not None:
-        nmatrix = normalization(matrix, types)
-    else:
-        nmatrix = matrix.copy()
+    with stage('TOPSIS', 'normalization'):
+        if normalization is not None:
+            nmatrix = apply_normalization(normalization, matrix, types, out=workspace.get('nmatrix', matrix.shape))
+        else:
+            nmatrix = matrix
 
     # weighted matrix
-    wmatrix = np.zeros((nmatrix.shape[0], nmatrix.shape[1], 3), dtype=object)
-
-    # crisp weights
-    if weights.ndim == 1:
-        weights = np.repeat(weights, 2).reshape((len(weights), 2))
-
-    wmatrix[:, :, 0] = nmatrix[:, :, 0] * weights[:, 0]
-    wmatrix[:, :, 1] = nmatrix[:, :, 1] + weights[:, 1] - nmatrix[:, :, 1] * weights[:, 1]
-    wmatrix[:, :, 2] = 1 - nmatrix[:, :, 1] - weights[:, 1] - nmatrix[:, :, 0] * weights[:, 0] + nmatrix[:, :, 1]  * weights[:, 1]
+    with stage('TOPSIS', 'weighting'):
+        wmatrix = product(nmatrix, weights, axis=1, out=workspace.get('wmatrix', (nmatrix.shape[0], nmatrix.shape[1], 3)))
 
     # closeness to intuitionistic fuzzy positive and negative ideal solution
-    aplus, aminus = np.zeros((matrix.shape[1], ), dtype=object), np.zeros((matrix.shape[1], ), dtype=object)
-    for j in range(matrix.shape[1]):
-        if types[j] == 1:
-            aplus[j] = wmatrix[np.argmax(wmatrix[:, j, 0]), j]
-            aminus[j] = wmatrix[np.argmin(wmatrix[:, j, 0]), j]
-        else:
-            aplus[j] = wmatrix[np.argmin(wmatrix[:, j, 0]), j]
-            aminus[j] = wmatrix[np.argmax(wmatrix[:, j, 0]), j]
+    with stage('TOPSIS', 'ideal'):
+        aplus, aminus = workspace.get('aplus', (matrix.shape[1], 3)), workspace.get('aminus', (matrix.shape[1], 3))
+        for j in range(matrix.shape[1]):
+            if types[j] == 1:
+                aplus[j] = wmatrix[np.argmax(wmatrix[:, j, 0]), j]
+                aminus[j] = wmatrix[np.argmin(wmatrix[:, j, 0]), j]
+            else:
+                aplus[j] = wmatrix[np.argmin(wmatrix[:, j, 0]), j]
+                aminus[j] = wmatrix[np.argmax(wmatrix[:, j, 0]), j]
 
-    f = 1
-    if 'normalized' in distance.__name__:
-        f = 1/(2*matrix.shape[1])
+    with stage('TOPSIS', 'distance'):
+        f = 1
+        if 'normalized' in distance.__name__:
+            f = 1/(2*matrix.shape[1])
 
-    # distance from ideal solution
-    splus, sminus = np.zeros((wmatrix.shape[0], )), np.zeros((wmatrix.shape[0], ))
-    for i in range(wmatrix.shape[0]):
+        # distance from ideal solution
+        dplus = elementwise_distance(distance, wmatrix, aplus, out=workspace.get('dplus', wmatrix.shape[:2]))
+        dminus = elementwise_distance(distance, wmatrix, aminus, out=workspace.get('dminus', wmatrix.shape[:2]))
+        splus, sminus = np.sum(dplus, axis=1), np.sum(dminus, axis=1)
         if distance.__name__== 'normalized_euclidean_distance':
-            splus[i] = np.sqrt(f * np.sum([distance(wmatrix[i, idx], ap) for idx, ap in enumerate(aplus)]))
-            sminus[i] = np.sqrt(f * np.sum([distance(wmatrix[i, idx], am) for idx, am in enumerate(aminus)]))
+            splus, sminus = np.sqrt(f * splus), np.sqrt(f * sminus)
         elif distance.__name__== 'normalized_hamming_distance':
-            splus[i] = f * np.sum([distance(wmatrix[i, idx], ap) for idx, ap in enumerate(aplus)])
-            sminus[i] = f * np.sum([distance(wmatrix[i, idx], am) for idx, am in enumerate(aminus)])
-        else:
-            splus[i] = np.sum([distance(wmatrix[i, idx], ap) for idx, ap in enumerate(aplus)])
-            sminus[i] = np.sum([distance(wmatrix[i, idx], am) for idx, am in enumerate(aminus)])
+            splus, sminus = f * splus, f * sminus
 
     # assessment score
-    return sminus / (splus + sminus)
+    with stage('TOPSIS', 'aggregation'):
+        return sminus / (splus + sminus)
@@ -1,8 +1,12 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+from ...profiling import stage
+from ..ifs.normalization import apply_normalization
+from ...workspace import Workspace
+from ..ifs.distance import elementwise_distance
 
-def ifs(matrix, weights, types, normalization, distance, v):
+def ifs(matrix, weights, types, normalization, distance, v, workspace=None):
     """
         Calculates the alternatives preferences based on Intuitionistic Fuzzy Sets
 
@@ -27,6 +31,9 @@ def ifs(matrix, weights, types, normalization, distance, v):
             v : float
                 Weights for the strategy of maximum group utility
 
+            workspace: Workspace, default=None
+                Buffers for the intermediate arrays reused between the calls
+
         Returns
         -------
             ndarray
@@ -34,40 +41,51 @@ def ifs(matrix, weights, types, normalization, distance, v):
 
     """
 
+    # buffers reused between the calls of the method object
+    workspace = Workspace() if workspace is None else workspace
+
     # normalized matrix
-    if normalization is not None:
-        nmatrix = normalization(matrix, types)
-    else:
-        nmatrix = matrix.copy()
+    with stage('VIKOR', 'normalization'):
+        if normalization is not None:
+            nmatrix = apply_normalization(normalization, matrix, types, out=workspace.get('nmatrix', matrix.shape))
+        else:
+            nmatrix = matrix
 
     # postive and negative ideal solution
-    pis, nis = np.zeros((nmatrix.shape[1], ), dtype=object), np.zeros((nmatrix.shape[1], ), dtype=object)
-    for j in range(matrix.shape[1]):
-        pis[j] = nmatrix[np.argmax(nmatrix[:, j, 0]), j]
-        nis[j] = nmatrix[np.argmin(nmatrix[:, j, 0]), j]
+    with stage('VIKOR', 'ideal'):
+        pis, nis = workspace.get('pis', nmatrix.shape[1:]), workspace.get('nis', nmatrix.shape[1:])
+        for j in range(matrix.shape[1]):
+            pis[j] = nmatrix[np.argmax(nmatrix[:, j, 0]), j]
+            nis[j] = nmatrix[np.argmin(nmatrix[:, j, 0]), j]
 
-    f = 1
-    if 'normalized' in distance.__name__:
-        f = 1/(2*matrix.shape[1])
+        f = 1
+        if 'normalized' in distance.__name__:
+            f = 1/(2*matrix.shape[1])
 
-    # validate data
-    if any([all(p == n) for p, n in zip(pis, nis)]):
-        raise ValueError('Matrix should not contain same values within a single column')
+        # validate data
+        if any([all(p == n) for p, n in zip(pis, nis)]):
+            raise ValueError('Matrix should not contain same values within a single column')
 
     # calculation of S and R rankings
-    S, R, Q = np.zeros((nmatrix.shape[0], )), np.zeros((nmatrix.shape[0], )), np.zeros((nmatrix.shape[0], ))
-    for i in range(matrix.shape[0]):
+    with stage('VIKOR', 'distance'):
+        dmatrix = elementwise_distance(distance, pis, nmatrix, out=workspace.get('dmatrix', nmatrix.shape[:2]))
+        dideal = elementwise_distance(distance, pis, nis)
         if distance.__name__== 'normalized_euclidean_distance':
-            S[i] = np.sum([weights[j] * (np.sqrt(f * distance(pis[j], nmatrix[i, j])) / np.sqrt(f * distance(pis[j], nis[j]))) for j in range(nmatrix.shape[1])])
-            R[i] = np.max([weights[j] * (np.sqrt(f * distance(pis[j], nmatrix[i, j])) / np.sqrt(f * distance(pis[j], nis[j]))) for j in range(nmatrix.shape[1])])
+            dmatrix, dideal = np.sqrt(f * dmatrix, out=dmatrix), np.sqrt(f * dideal)
         elif distance.__name__== 'normalized_hamming_distance':
-            S[i] = np.sum([weights[j] * ((f * distance(pis[j], nmatrix[i, j])) / (f * distance(pis[j], nis[j]))) for j in range(nmatrix.shape[1])])
-            R[i] = np.max([weights[j] * ((f * distance(pis[j], nmatrix[i, j])) / (f * distance(pis[j], nis[j]))) for j in range(nmatrix.shape[1])])
+            dmatrix, dideal = np.multiply(f, dmatrix, out=dmatrix), f * dideal
+
+    # weighted distances relative to the distance between ideal solutions
+    with stage('VIKOR', 'weighting'):
+        np.divide(dmatrix, dideal, out=dmatrix)
+        if weights.ndim == 1:
+            wdmatrix = np.multiply(weights, dmatrix, out=dmatrix)
         else:
-            S[i] = np.sum([weights[j] * (distance(pis[j], nmatrix[i, j]) / distance(pis[j], nis[j]))for j in range(nmatrix.shape[1])])
-            R[i] = np.max([weights[j] * (distance(pis[j], nmatrix[i, j]) / distance(pis[j], nis[j]))for j in range(nmatrix.shape[1])])
+            wdmatrix = (dmatrix[:, :, np.newaxis] * weights).reshape((nmatrix.shape[0], -1))
+        S, R = np.sum(wdmatrix, axis=1), np.max(wdmatrix, axis=1)
 
     # calculation of the compromise ranking Q
-    Q = v * ((S - np.min(S)) / (np.max(S) - np.min(S))) + (1 - v) * ((R - np.min(R)) / (np.max(R) - np.min(R)))
+    with stage('VIKOR', 'aggregation'):
+        Q = v * ((S - np.min(S)) / (np.max(S) - np.min(S))) + (1 - v) * ((R - np.min(R)) / (np.max(R) - np.min(R)))
 
-    return np.nan_to_num(S), np.nan_to_num(R), np.nan_to_num(Q)
+        return np.nan_to_num(S), np.nan_to_num(R), np.nan_to_num(Q)
@@ -1,9 +1,13 @@
 # Copyright (c) 2023 Bartłomiej Kizielewicz
 
 import numpy as np
+from ...profiling import stage
+from ..ifs.normalization import apply_normalization
+from ...workspace import Workspace
+from ...aggregation import ifwa, ifwg
 
 
-def ifs(matrix, weights, types, normalization, score, v):
+def ifs(matrix, weights, types, normalization, score, v, workspace=None):
     """
         Calculates the alternatives preferences based on Intuitionistic Fuzzy Sets
 
@@ -25,6 +29,9 @@ def ifs(matrix, weights, types, normalization, score, v):
             distance: callable
                 Function used to calculate distance between two IFS
 
+            workspace: Workspace, default=None
+                Buffers for the intermediate arrays reused between the calls
+
         Returns
         -------
             ndarray
@@ -32,25 +39,22 @@ def ifs(matrix, weights, types, normalization, score, v):
 
     """
 
-    # normalized matrix
-    if normalization is not None:
-        nmatrix = normalization(matrix, types)
-    else:
-        nmatrix = matrix.copy()
+    # buffers reused between the calls of the method object
+    workspace = Workspace() if workspace is None else workspace
 
-    # crisp weights
-    if weights.ndim == 1:
-        weights = np.repeat(weights, 2).reshape((len(weights), 2))
+    # normalized matrix
+    with stage('WASPAS', 'normalization'):
+        if normalization is not None:
+            nmatrix = apply_normalization(normalization, matrix, types, out=workspace.get('nmatrix', matrix.shape))
+        else:
+            nmatrix = matrix
 
     # WSM-based calculations
-    wsm_p = 1 - np.prod((1 - nmatrix[:, :, 0]) ** weights[:, 0], axis=1)
-    wsm_q = np.prod((nmatrix[:, :, 1] ** weights[:, 1]), axis=1)
-    Q1 = 1/2 * (score(np.vstack([wsm_p, wsm_q]).T) + 1)
+    with stage('WASPAS', 'aggregation'):
+        Q1 = 1/2 * (score(ifwa(nmatrix, weights, axis=1)) + 1)
 
-    # WPM-based calculations
-    wpm_p = np.prod(nmatrix[:, :, 0] ** weights[:, 0], axis=1)
-    wpm_q = 1 - np.prod((1 - nmatrix[:, :, 1]) ** weights[:, 1], axis=1)
-    Q2 = 1/2 * (score(np.vstack([wpm_p, wpm_q]).T) + 1)
+        # WPM-based calculations
+        Q2 = 1/2 * (score(ifwg(nmatrix, weights, axis=1)) + 1)
 
-    # assessment score
-    return np.array(v * Q1 + (1 - v) * Q2)
+        # assessment score
+        return np.array(v * Q1 + (1 - v) * Q2)
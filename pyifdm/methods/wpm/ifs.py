@@ -1,8 +1,12 @@
 # Copyright (c) 2023 Jakub Więckowski
 
 import numpy as np
+from ...profiling import stage
+from ..ifs.normalization import apply_normalization
+from ...workspace import Workspace
+from ...aggregation import power
 
-def ifs(matrix, weights, types, normalization, score):
+def ifs(matrix, weights, types, normalization, score, workspace=None):
     """
         Calculates the alternatives preferences based on Intuitionistic Fuzzy Sets
 
@@ -24,6 +28,9 @@ def ifs(matrix, weights, types, normalization, score):
             distance: callable
                 Function used to calculate distance between two IFS
 
+            workspace: Workspace, default=None
+                Buffers for the intermediate arrays reused between the calls
+
         Returns
         -------
             ndarray
@@ -31,23 +38,24 @@ def ifs(matrix, weights, types, normalization, score):
 
     """
 
-    # normalized matrix
-    if normalization is not None:
-        nmatrix = normalization(matrix, types)
-    else:
-        nmatrix = matrix.copy()
+    # buffers reused between the calls of the method object
+    workspace = Workspace() if workspace is None else workspace
 
-    # crisp weights
-    if weights.ndim == 1:
-        weights = np.repeat(weights, 2).reshape((len(weights), 2))
+    # normalized matrix
+    with stage('WPM', 'normalization'):
+        if normalization is not None:
+            nmatrix = apply_normalization(normalization, matrix, types, out=workspace.get('nmatrix', matrix.shape))
+        else:
+            nmatrix = matrix
 
     # weighted decision matrix
-    wmatrix = matrix.copy()
-    wmatrix[:, :, 0] = nmatrix[:, :, 0] ** weights[:, 0]
-    wmatrix[:, :, 1] = 1 - (1 - nmatrix[:, :, 1])** weights[:, 1]
+    with stage('WPM', 'weighting'):
+        wmatrix = power(nmatrix, weights, axis=1, out=workspace.get('wmatrix', matrix.shape))
 
     # product
-    Q  = np.prod(wmatrix, axis=1)
+    with stage('WPM', 'aggregation'):
+        Q  = np.prod(wmatrix, axis=1)
     
     # assessment score
-    return np.array([score(q) for q in Q])
+    with stage('WPM', 'score'):
+        return np.array([score(q) for q in Q])
@@ -0,0 +1,271 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import functools
+import math
+import threading
+import time
+import numpy as np
+
+__all__ = [
+    'Counter',
+    'Histogram',
+    'MetricsRegistry',
+    'REGISTRY',
+    'disable',
+    'enable',
+    'instrument',
+    'is_enabled',
+    'snapshot',
+    'to_prometheus'
+]
+
+
+class Counter():
+    def __init__(self, name, documentation, labels=()):
+        """
+            Counter of the events, kept separately for each combination of the labels values
+
+            Parameters
+            ----------
+                name : str
+                    Name of the metric
+
+                documentation : str
+                    Description of the metric
+
+                labels : tuple, default=()
+                    Names of the labels
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        """
+            Increments the counter for given labels values
+        """
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def reset(self):
+        with self._lock:
+            self._values = {}
+
+    def snapshot(self):
+        with self._lock:
+            return {labels: value for labels, value in self._values.items()}
+
+    def samples(self):
+        return [(self.name, dict(zip(self.labels, labels)), value) for labels, value in sorted(self.snapshot().items())]
+
+
+class Histogram():
+    def __init__(self, name, documentation, buckets, labels=()):
+        """
+            Histogram of the observed values with cumulative buckets, kept separately for each combination of the labels values
+
+            Parameters
+            ----------
+                name : str
+                    Name of the metric
+
+                documentation : str
+                    Description of the metric
+
+                buckets : iterable
+                    Upper bounds of the buckets, the bucket of infinity is added
+
+                labels : tuple, default=()
+                    Names of the labels
+        """
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets)) + (math.inf, )
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        """
+            Adds observed value for given labels values
+        """
+        with self._lock:
+            counts, total = self._values.get(labels, ([0] * len(self.buckets), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[labels] = (counts, total + value)
+
+    def reset(self):
+        with self._lock:
+            self._values = {}
+
+    def snapshot(self):
+        with self._lock:
+            return {labels: {'buckets': dict(zip(self.buckets, counts)), 'count': counts[-1], 'sum': total}
+                    for labels, (counts, total) in self._values.items()}
+
+    def samples(self):
+        result = []
+        for labels, value in sorted(self.snapshot().items()):
+            labels = dict(zip(self.labels, labels))
+            for bound, count in value['buckets'].items():
+                result.append((f'{self.name}_bucket', {**labels, 'le': '+Inf' if bound == math.inf else repr(float(bound))}, count))
+            result.append((f'{self.name}_count', labels, value['count']))
+            result.append((f'{self.name}_sum', labels, value['sum']))
+        return result
+
+
+class MetricsRegistry():
+    def __init__(self):
+        """
+            Registry of the metrics reported by the methods
+        """
+        self.metrics = {}
+
+    def register(self, metric):
+        """
+            Adds metric to the registry
+
+            Parameters
+            ----------
+                metric : Counter or Histogram
+                    Registered metric
+
+            Returns
+            -------
+                Counter or Histogram
+                    Registered metric
+        """
+        if metric.name in self.metrics:
+            raise ValueError(f'Metric {metric.name} is already registered')
+        self.metrics[metric.name] = metric
+        return metric
+
+    def reset(self):
+        """
+            Clears values of all metrics
+        """
+        for metric in self.metrics.values():
+            metric.reset()
+
+    def snapshot(self):
+        """
+            Returns current values of the metrics
+
+            Returns
+            -------
+                dict
+                    Values of each metric, given for the tuples of the labels values
+        """
+        return {name: metric.snapshot() for name, metric in self.metrics.items()}
+
+    def to_prometheus(self):
+        """
+            Exports the metrics in the Prometheus text format
+
+            Returns
+            -------
+                str
+                    Metrics in the text exposition format
+        """
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f"# TYPE {metric.name} {'counter' if isinstance(metric, Counter) else 'histogram'}")
+            for name, labels, value in metric.samples():
+                labels = ','.join(f'{key}="{value}"' for key, value in labels.items())
+                lines.append(f"{name}{{{labels}}} {value}" if labels else f'{name} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+EVALUATIONS = REGISTRY.register(Counter('pyifdm_evaluations_total', 'Number of the evaluations by the method', ['method']))
+FAILURES = REGISTRY.register(Counter('pyifdm_validation_failures_total', 'Number of the evaluations rejected with ValueError', ['method']))
+LATENCY = REGISTRY.register(Histogram('pyifdm_evaluation_seconds', 'Time of the evaluations in seconds',
+                                      [0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5], ['method']))
+ALTERNATIVES = REGISTRY.register(Histogram('pyifdm_matrix_alternatives', 'Number of the alternatives of the evaluated matrices',
+                                           [10, 100, 1000, 10000, 100000, 1000000], ['method']))
+CRITERIA = REGISTRY.register(Histogram('pyifdm_matrix_criteria', 'Number of the criteria of the evaluated matrices',
+                                       [2, 5, 10, 20, 50, 100], ['method']))
+WORKSPACE_HITS = REGISTRY.register(Counter('pyifdm_workspace_hits_total', 'Number of the workspace buffers reused'))
+WORKSPACE_MISSES = REGISTRY.register(Counter('pyifdm_workspace_misses_total', 'Number of the workspace buffers allocated'))
+
+# metrics are reported only if enabled
+_enabled = False
+
+
+def enable():
+    """
+        Enables reporting of the metrics by the methods
+    """
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """
+        Disables reporting of the metrics by the methods
+    """
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """
+        Returns True if the methods report the metrics
+    """
+    return _enabled
+
+
+def snapshot():
+    """
+        Returns current values of the metrics from the default registry
+    """
+    return REGISTRY.snapshot()
+
+
+def to_prometheus():
+    """
+        Exports the metrics from the default registry in the Prometheus text format
+    """
+    return REGISTRY.to_prometheus()
+
+
+def instrument(method):
+    """
+        Decorates the method call to report the evaluation, its time, size of the matrix and validation failure
+
+        Parameters
+        ----------
+            method : str
+                Name of the method used as the label value
+
+        Returns
+        -------
+            callable
+                Decorator of the method call
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, matrix, *args, **kwargs):
+            if not _enabled:
+                return func(self, matrix, *args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                result = func(self, matrix, *args, **kwargs)
+            except ValueError:
+                FAILURES.inc(method)
+                raise
+            LATENCY.observe(time.perf_counter() - start, method)
+
+            shape = np.shape(matrix)
+            EVALUATIONS.inc(method)
+            ALTERNATIVES.observe(shape[0], method)
+            CRITERIA.observe(shape[1], method)
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,312 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+from .methods.ifs import distance as distances
+from .methods.ifs.distance import elementwise_distance
+from .precision import as_float
+
+__all__ = [
+    'METRIC_DISTANCES',
+    'NeighborsIndex'
+]
+
+# distances satisfying the triangle inequality, their sums over the criteria are metrics for the profiles of IFS
+METRIC_DISTANCES = (
+    distances.euclidean_distance,
+    distances.grzegorzewski_distance,
+    distances.hamming_distance,
+    distances.normalized_hamming_distance,
+    distances.wang_xin_distance_1,
+    distances.wang_xin_distance_2
+)
+
+
+def _merge(best_d, best_i, d, i, k):
+    """
+        Keeps k nearest candidates from the current and new candidates, rows are the queries
+    """
+    d = np.concatenate((best_d, d), axis=1)
+    i = np.concatenate((best_i, i), axis=1)
+    if d.shape[1] > k:
+        selected = np.argpartition(d, k - 1, axis=1)[:, :k]
+        d = np.take_along_axis(d, selected, axis=1)
+        i = np.take_along_axis(i, selected, axis=1)
+    return d, i
+
+
+def _sorted(d, i):
+    """
+        Sorts the neighbours by the distance, equal distances are ordered by the index
+    """
+    order = np.lexsort((i, d), axis=-1)
+    return np.take_along_axis(d, order, axis=-1), np.take_along_axis(i, order, axis=-1)
+
+
+class NeighborsIndex():
+    def __init__(self, profiles, distance=distances.hamming_distance, method='vptree', leaf_size=1024, block_size=2**20, seed=0):
+        """
+            Index searching the nearest profiles of Intuitionistic Fuzzy Sets. Distance between profiles is the sum of
+            the distances of IFS over the criteria. The vantage-point tree is used for the metric distances,
+            other distances are supported only by the brute-force search calculated in memory-bounded blocks.
+            The tree prunes the most profiles if they form clusters, for uniformly spread profiles of many criteria
+            its search is close to the brute-force search.
+
+            Parameters
+            ----------
+                profiles : ndarray
+                    Reference profiles of Intuitionistic Fuzzy Sets, of shape (m, n, 2|3)
+
+                distance : callable, default=hamming_distance
+                    Function used to calculate distance between two IFS
+
+                method : str, default='vptree'
+                    'vptree' for the vantage-point tree, available for METRIC_DISTANCES, or 'brute' for the brute-force search
+
+                leaf_size : int, default=1024
+                    Largest number of profiles in the leaf of the tree, compared with the query at once.
+                    Large leaves reduce the overhead of the search, which is significant for many criteria
+
+                block_size : int, default=2**20
+                    Largest number of pairs of IFS compared at once by the brute-force search
+
+                seed : int, default=0
+                    Seed of the random generator selecting the vantage points
+        """
+        if method not in ['vptree', 'brute']:
+            raise ValueError(f"Method should be 'vptree' or 'brute', not {method}")
+        if method == 'vptree' and distance not in METRIC_DISTANCES:
+            raise ValueError(f"{getattr(distance, '__name__', distance)} is not a metric and is not supported by the vantage-point tree, use method='brute'")
+
+        profiles = as_float(profiles)
+        if profiles.ndim != 3 or profiles.shape[-1] not in [2, 3]:
+            raise ValueError('Profiles should be given as the array of shape (m, n, 2|3)')
+
+        self.distance = distance
+        self.method = method
+        self.leaf_size = leaf_size
+        self.block_size = block_size
+        self.profiles = profiles
+        self.indices = np.arange(profiles.shape[0])
+        if method == 'vptree':
+            self._build(np.random.default_rng(seed))
+
+    def _distances(self, query, profiles):
+        return np.sum(elementwise_distance(self.distance, query, profiles), axis=-1)
+
+    def _build(self, rng):
+        """
+            Builds the tree, profiles are reordered so each node covers a contiguous range of them.
+            Inner node splits its range by the median distance to the vantage point, the closer half is placed first.
+        """
+        m = self.profiles.shape[0]
+        order = np.arange(m)
+        nodes = []
+        stack = [(0, m, -1, 0)]
+        while stack:
+            start, end, parent, side = stack.pop()
+            node = len(nodes)
+            if parent >= 0:
+                nodes[parent][4 + side] = node
+
+            if end - start <= self.leaf_size:
+                nodes.append([start, end, -1, 0.0, -1, -1])
+                continue
+
+            vantage = order[start + rng.integers(end - start)]
+            d = self._distances(self.profiles[vantage], self.profiles[order[start:end]])
+            half = (end - start) // 2
+            split = np.argpartition(d, half - 1)
+            order[start:end] = order[start:end][split]
+            nodes.append([start, end, vantage, float(d[split[half - 1]]), -1, -1])
+            stack.append((start + half, end, node, 1))
+            stack.append((start, start + half, node, 0))
+
+        nodes = np.array(nodes)
+        self.profiles = self.profiles[order]
+        self.indices = order
+        self._start = nodes[:, 0].astype(int)
+        self._end = nodes[:, 1].astype(int)
+        # vantage points are given as the positions in the reordered profiles
+        self._vantage = np.argsort(order)[np.maximum(nodes[:, 2].astype(int), 0)]
+        self._vantage[nodes[:, 2] < 0] = -1
+        self._radius = nodes[:, 3]
+        self._children = nodes[:, 4:].astype(int)
+
+    def _search(self, query, k=None, radius=None):
+        """
+            Searches the tree for a single query, k nearest profiles or profiles within the radius
+        """
+        best_d, best_i = np.zeros((1, 0)), np.zeros((1, 0), dtype=int)
+        bound = np.inf if radius is None else radius
+        stack = [(0, 0.0)]
+        while stack:
+            node, lower = stack.pop()
+            if lower > bound:
+                continue
+
+            if self._children[node, 0] < 0:
+                start, end = self._start[node], self._end[node]
+                d = self._distances(query, self.profiles[start:end])
+                i = np.arange(start, end)
+                if radius is not None:
+                    best_d = np.concatenate((best_d[0], d[d <= radius]))[np.newaxis]
+                    best_i = np.concatenate((best_i[0], i[d <= radius]))[np.newaxis]
+                else:
+                    best_d, best_i = _merge(best_d, best_i, d[np.newaxis], i[np.newaxis], k)
+                    if best_d.shape[1] == k:
+                        bound = np.max(best_d)
+                continue
+
+            d = float(self._distances(query, self.profiles[self._vantage[node]]))
+            r = self._radius[node]
+            inner = (self._children[node, 0], max(d - r, 0.0, lower))
+            outer = (self._children[node, 1], max(r - d, 0.0, lower))
+            # closer child is searched first
+            stack.extend([outer, inner] if d <= r else [inner, outer])
+
+        return best_d[0], best_i[0]
+
+    def _brute(self, queries, k=None, radius=None):
+        """
+            Compares the queries with all profiles in blocks
+        """
+        b, m = queries.shape[0], self.profiles.shape[0]
+        pairs = max(1, self.block_size // max(1, queries.shape[1]))
+        rows = max(1, min(b, pairs))
+        columns = max(1, pairs // rows)
+
+        results = []
+        for q in range(0, b, rows):
+            block = queries[q:q + rows, np.newaxis]
+            best_d, best_i = np.zeros((block.shape[0], 0)), np.zeros((block.shape[0], 0), dtype=int)
+            found = [[] for _ in range(block.shape[0])]
+            for start in range(0, m, columns):
+                d = self._distances(block, self.profiles[np.newaxis, start:start + columns])
+                i = np.broadcast_to(np.arange(start, start + d.shape[1]), d.shape)
+                if radius is not None:
+                    for row in range(d.shape[0]):
+                        within = d[row] <= radius
+                        found[row].append((d[row][within], i[row][within]))
+                else:
+                    best_d, best_i = _merge(best_d, best_i, d, i, k)
+            if radius is not None:
+                results.extend((np.concatenate([f[0] for f in row]), np.concatenate([f[1] for f in row])) for row in found)
+            else:
+                results.extend(zip(best_d, best_i))
+        return results
+
+    def _queries(self, queries):
+        queries = as_float(queries)
+        single = queries.ndim == 2
+        queries = queries[np.newaxis] if single else queries
+        if queries.ndim != 3 or queries.shape[1:] != self.profiles.shape[1:]:
+            raise ValueError(f'Queries should be given as the array of shape (n, c) or (b, n, c) matching the profiles {self.profiles.shape[1:]}')
+        return queries, single
+
+    def query(self, queries, k=1):
+        """
+            Searches k nearest profiles of the queries
+
+            Parameters
+            ----------
+                queries : ndarray
+                    Profile of shape (n, 2|3) or the batch of profiles of shape (b, n, 2|3)
+
+                k : int, default=1
+                    Number of the nearest profiles
+
+            Returns
+            -------
+                tuple
+                    Distances and indices of the nearest profiles, sorted by the distance, of shape (k, ) or (b, k) for the batch
+        """
+        queries, single = self._queries(queries)
+        if not 1 <= k <= self.profiles.shape[0]:
+            raise ValueError(f'Number of neighbours should be in range from 1 to {self.profiles.shape[0]}')
+
+        if self.method == 'vptree':
+            results = [self._search(query, k=k) for query in queries]
+        else:
+            results = self._brute(queries, k=k)
+
+        d = np.array([result[0] for result in results])
+        i = np.array([self.indices[result[1]] for result in results])
+        d, i = _sorted(d, i)
+        return (d[0], i[0]) if single else (d, i)
+
+    def query_radius(self, queries, radius):
+        """
+            Searches profiles within the distance from the queries
+
+            Parameters
+            ----------
+                queries : ndarray
+                    Profile of shape (n, 2|3) or the batch of profiles of shape (b, n, 2|3)
+
+                radius : float
+                    Largest distance of the found profiles
+
+            Returns
+            -------
+                tuple
+                    Distances and indices of the found profiles, sorted by the distance, as arrays or lists of arrays for the batch
+        """
+        queries, single = self._queries(queries)
+
+        if self.method == 'vptree':
+            results = [self._search(query, radius=radius) for query in queries]
+        else:
+            results = self._brute(queries, radius=radius)
+
+        results = [_sorted(d, self.indices[i]) for d, i in results]
+        d, i = [result[0] for result in results], [result[1] for result in results]
+        return (d[0], i[0]) if single else (d, i)
+
+    def save(self, path):
+        """
+            Saves the index to the NumPy .npz file
+
+            Parameters
+            ----------
+                path : str
+                    Path of the file
+        """
+        if getattr(distances, getattr(self.distance, '__name__', ''), None) is not self.distance:
+            raise ValueError('Only the index with the distance from pyifdm.methods.ifs.distance can be saved')
+        arrays = {
+            'profiles': self.profiles,
+            'indices': self.indices,
+            'settings': np.array([self.distance.__name__, self.method, str(self.leaf_size), str(self.block_size)])
+        }
+        if self.method == 'vptree':
+            arrays.update(start=self._start, end=self._end, vantage=self._vantage, radius=self._radius, children=self._children)
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """
+            Loads the index saved to the NumPy .npz file, the tree is not built again
+
+            Parameters
+            ----------
+                path : str
+                    Path of the file
+
+            Returns
+            -------
+                NeighborsIndex
+                    Loaded index
+        """
+        with np.load(path) as data:
+            distance, method, leaf_size, block_size = data['settings']
+            index = cls.__new__(cls)
+            index.distance = getattr(distances, str(distance))
+            index.method = str(method)
+            index.leaf_size = int(leaf_size)
+            index.block_size = int(block_size)
+            index.profiles = data['profiles']
+            index.indices = data['indices']
+            if index.method == 'vptree':
+                index._start, index._end, index._vantage = data['start'], data['end'], data['vantage']
+                index._radius, index._children = data['radius'], data['children']
+        return index
@@ -0,0 +1,91 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import numpy as np
+
+__all__ = [
+    'as_float',
+    'get_dtype',
+    'precision',
+    'set_dtype'
+]
+
+# floating point types supported in the calculations
+DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+_default_dtype = np.dtype(np.float64)
+_context_dtype = ContextVar('pyifdm_dtype', default=None)
+
+
+def _validate_dtype(dtype):
+    dtype = np.dtype(dtype)
+    if dtype not in DTYPES:
+        raise ValueError(f'Calculations can be performed only with float32 or float64, not {dtype}')
+    return dtype
+
+
+def get_dtype():
+    """
+        Returns floating point type used in the calculations
+
+        Returns
+        -------
+            dtype
+                Type of the calculations, float64 by default
+    """
+    dtype = _context_dtype.get()
+    return _default_dtype if dtype is None else dtype
+
+
+def set_dtype(dtype):
+    """
+        Sets floating point type used globally in the calculations of methods, scores, distances and normalizations.
+        Float32 halves the memory usage and is sufficient when only the rankings of alternatives are needed.
+
+        Parameters
+        ----------
+            dtype : dtype
+                Type of the calculations, float32 or float64
+    """
+    global _default_dtype
+    _default_dtype = _validate_dtype(dtype)
+
+
+@contextmanager
+def precision(dtype):
+    """
+        Context manager setting floating point type of the calculations performed within its block
+
+        Parameters
+        ----------
+            dtype : dtype
+                Type of the calculations, float32 or float64
+
+        Examples
+        --------
+            >>> with precision(np.float32):
+            ...     preferences = ifTOPSIS()(matrix, weights, types)
+    """
+    token = _context_dtype.set(_validate_dtype(dtype))
+    try:
+        yield
+    finally:
+        _context_dtype.reset(token)
+
+
+def as_float(a):
+    """
+        Converts data to the floating point type of the calculations, no copy is made if the type already matches
+
+        Parameters
+        ----------
+            a : ndarray
+                Data to convert
+
+        Returns
+        -------
+            ndarray
+                Data in the floating point type of the calculations
+    """
+    return np.asarray(a, dtype=get_dtype())
@@ -0,0 +1,182 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+__all__ = [
+    'Profile',
+    'profile',
+    'stage'
+]
+
+# profile recording the stages, stages are not measured if it is not set
+_context_profile = ContextVar('profile', default=None)
+
+# context returned for the stages when profiling is disabled
+_disabled = nullcontext()
+
+
+class Profile():
+    def __init__(self, memory=True):
+        """
+            Records of the stages of the methods calculations
+
+            Parameters
+            ----------
+                memory : bool, default=True
+                    Measure memory allocated in the stages with tracemalloc
+        """
+        self.memory = memory
+        self.events = []
+        # peak of the traced memory is reset for each stage only if tracing was started by the profile
+        self._reset_peak = False
+        self._origin = time.perf_counter()
+
+    def to_dict(self):
+        """
+            Summarizes the recorded stages
+
+            Returns
+            -------
+                dict
+                    Total time in seconds, number of calls and allocated bytes of each stage, grouped by the method
+        """
+        summary = {}
+        for event in self.events:
+            stages = summary.setdefault(event['method'], {})
+            result = stages.setdefault(event['stage'], {'time': 0.0, 'calls': 0, 'bytes': 0})
+            result['time'] += event['duration']
+            result['calls'] += 1
+            result['bytes'] += event['bytes']
+        return summary
+
+    def to_chrome_trace(self):
+        """
+            Converts the recorded stages to the Chrome trace format, which can be opened in chrome://tracing or Perfetto
+
+            Returns
+            -------
+                dict
+                    Trace with complete events of the stages
+        """
+        events = [{
+            'name': event['stage'],
+            'cat': event['method'],
+            'ph': 'X',
+            'ts': event['start'] * 1e6,
+            'dur': event['duration'] * 1e6,
+            'pid': os.getpid(),
+            'tid': event['thread'],
+            'args': {'bytes': event['bytes']}
+        } for event in self.events]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def save_chrome_trace(self, path):
+        """
+            Saves the recorded stages to the JSON file in the Chrome trace format
+
+            Parameters
+            ----------
+                path : str
+                    Path of the file
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+class _Stage():
+    def __init__(self, profile, method, name):
+        self.profile = profile
+        self.method = method
+        self.name = name
+
+    def __enter__(self):
+        if self.profile.memory:
+            if self.profile._reset_peak:
+                tracemalloc.reset_peak()
+            self.allocated, self.peak = tracemalloc.get_traced_memory()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        duration = time.perf_counter() - self.start
+        allocated = 0
+        if self.profile.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # peak of the stage is known only if it exceeds the peak before the stage
+            allocated = (peak if peak > self.peak else current) - self.allocated
+        self.profile.events.append({
+            'method': self.method,
+            'stage': self.name,
+            'start': self.start - self.profile._origin,
+            'duration': duration,
+            'bytes': max(0, allocated),
+            'thread': threading.get_ident()
+        })
+        return False
+
+
+def stage(method, name):
+    """
+        Creates context measuring the stage of the method calculations.
+        If profiling is disabled the shared empty context is returned, so the stage is not measured.
+
+        Parameters
+        ----------
+            method : str
+                Name of the method
+
+            name : str
+                Name of the stage, e.g. normalization, weighting, ideal, distance, score, aggregation
+
+        Returns
+        -------
+            context manager
+                Context measuring the stage
+    """
+    profile = _context_profile.get()
+    if profile is None:
+        return _disabled
+    return _Stage(profile, method, name)
+
+
+@contextmanager
+def profile(memory=True):
+    """
+        Records wall time, number of calls and peak memory allocated in the stages of the methods called within the context
+
+        Parameters
+        ----------
+            memory : bool, default=True
+                Measure memory allocated in the stages with tracemalloc, which slows down the calculations.
+                If tracemalloc is already tracing, its peak is not reset, so the peak of the stage is measured
+                only if it exceeds the earlier peak, otherwise the memory held at the end of the stage is recorded
+
+        Returns
+        -------
+            Profile
+                Records of the stages
+
+        Examples
+        --------
+        >>> with profile() as prof:
+        ...     ifTOPSIS()(matrix, weights, types)
+        >>> prof.to_dict()['TOPSIS']['distance']
+    """
+    prof = Profile(memory)
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+        prof._reset_peak = hasattr(tracemalloc, 'reset_peak')
+    token = _context_profile.set(prof)
+    try:
+        yield prof
+    finally:
+        _context_profile.reset(token)
+        if started:
+            tracemalloc.stop()
@@ -1,8 +1,14 @@
 # Copyright (c) 2022 Jakub Więckowski, Bartłomiej Kizielewicz
 
 import numpy as np
+from .precision import as_float, get_dtype
 
 __all__ = [
+    'BurilloEntropyAccumulator',
+    'EntropyAccumulator',
+    'LiuEntropyAccumulator',
+    'ThakurEntropyAccumulator',
+    'YeEntropyAccumulator',
     'burillo_entropy_weights',
     'equal_weights',
     'entropy_weights',
@@ -12,6 +18,27 @@ __all__ = [
     'ye_entropy_weights',
 ]
 
+def _burillo_terms(matrix):
+    return 1 - (matrix[..., 0] + matrix[..., 1])
+
+def _liu_terms(matrix):
+    value = (np.pi / 4) + np.abs(matrix[..., 0] ** 2 - matrix[..., 1] ** 2) / 4 * np.pi
+    return np.cos(value) / np.sin(value)
+
+def _thakur_terms(matrix):
+    return (1 / np.cos(np.abs(np.abs(3 - 2 * matrix[..., 0] - 7 / 3) - 7 / 3) * np.pi / 7) + 1 / np.cos(
+        np.abs(np.abs(3 - 2 * matrix[..., 1] - 7 / 3) - 7 / 3) * np.pi / 7) - 334 / 135) / (206 / 135)
+
+def _ye_terms(matrix):
+    return (np.sin((1 + matrix[..., 0] - matrix[..., 1]) * np.pi / 4) + np.sin((1 - matrix[..., 0] + matrix[..., 1]) * np.pi / 4) - 1) * (
+        1 / (np.sqrt(2) - 1))
+
+def _complement_weights(entropy):
+    return (1 - entropy) / np.sum(1 - entropy, axis=-1, keepdims=True)
+
+def _inverse_weights(entropy):
+    return (1 / entropy) / np.sum(1 / entropy, axis=-1, keepdims=True)
+
 def burillo_entropy_weights(matrix):
     """
         Calculates the objective weights for Intuitionistic Fuzzy Matrix, weight depend on the Burillo entropy measure in the column
@@ -20,19 +47,18 @@ def burillo_entropy_weights(matrix):
         ----------
             matrix: ndarray
                 Decision matrix / alternatives data
-                Alternatives are in rows and Criteria are in columns
+                Alternatives are in rows and Criteria are in columns.
+                Batch of matrices can be given with the leading axis (k, m, n, 2|3)
 
         Returns
         -------
             ndarray
-                Array of weights based on matrix entropy
+                Array of weights based on matrix entropy, of shape (k, n) for the batch of matrices
     """
 
-    weights = np.zeros(matrix.shape[1])
-    for i in range(matrix.shape[1]):
-        weights[i] = np.sum(1 - (matrix[:, i, 0] + matrix[:, i, 1])) / matrix[:, i].shape[0]
-    
-    return (1 - weights) / np.sum(1 - weights)
+    matrix = as_float(matrix)
+
+    return _complement_weights(np.mean(_burillo_terms(matrix), axis=-2))
 
 def equal_weights(matrix):
     """
@@ -42,15 +68,17 @@ def equal_weights(matrix):
         ----------
             matrix: ndarray
                 Decision matrix / alternatives data
-                Alternatives are in rows and Criteria are in columns
+                Alternatives are in rows and Criteria are in columns.
+                Batch of matrices can be given with the leading axis (k, m, n, 2|3)
 
         Returns
         -------
             ndarray
-                Array of equal weights
+                Array of equal weights, of shape (k, n) for the batch of matrices
     """
 
-    return np.ones(matrix.shape[1]) / matrix.shape[1]
+    matrix = as_float(matrix)
+    return np.ones(matrix.shape[:-1][:-2] + matrix.shape[-2:-1], dtype=matrix.dtype) / matrix.shape[-2]
 
 def entropy_weights(matrix):
     """
@@ -60,24 +88,18 @@ def entropy_weights(matrix):
         ----------
             matrix: ndarray
                 Decision matrix / alternatives data
-                Alternatives are in rows and Criteria are in columns
+                Alternatives are in rows and Criteria are in columns.
+                Batch of matrices can be given with the leading axis (k, m, n, 2|3)
 
         Returns
         -------
             ndarray
-                Array of weights based on matrix entropy
+                Array of weights based on matrix entropy, of shape (k, n) for the batch of matrices
     """
 
-    p = []
-    for j in range(matrix.shape[1]):
-        p.append(1 / matrix.shape[0] * sum([1 - matrix[i, j, 0] - matrix[i, j, 1]
-                                            for i in range(matrix.shape[0])]))
-
-    w = np.zeros(matrix.shape[1])
-    for idx, pp in enumerate(p):
-        w[idx] = (1/pp) / np.sum(1/np.array(p))
+    matrix = as_float(matrix)
 
-    return w
+    return _inverse_weights(np.mean(_burillo_terms(matrix), axis=-2))
 
 def liu_entropy_weights(matrix):
     """
@@ -87,20 +109,18 @@ def liu_entropy_weights(matrix):
         ----------
             matrix: ndarray
                 Decision matrix / alternatives data
-                Alternatives are in rows and Criteria are in columns
+                Alternatives are in rows and Criteria are in columns.
+                Batch of matrices can be given with the leading axis (k, m, n, 2|3)
 
         Returns
         -------
             ndarray
-                Array of weights based on matrix entropy
+                Array of weights based on matrix entropy, of shape (k, n) for the batch of matrices
     """
-    
-    weights = np.zeros(matrix.shape[1])
-    for i in range(matrix.shape[1]):
-        value = (np.pi / 4) + np.abs(matrix[:, i, 0] ** 2 - matrix[:, i, 1] ** 2) / 4 * np.pi
-        weights[i] = np.sum(np.cos(value) / np.sin(value)) / matrix[:, i].shape[0]
-    
-    return weights
+
+    matrix = as_float(matrix)
+
+    return np.mean(_liu_terms(matrix), axis=-2)
 
 def szmidt_entropy_weights(matrix):
     """
@@ -110,20 +130,22 @@ def szmidt_entropy_weights(matrix):
         ----------
             matrix: ndarray
                 Decision matrix / alternatives data
-                Alternatives are in rows and Criteria are in columns
+                Alternatives are in rows and Criteria are in columns.
+                Batch of matrices can be given with the leading axis (k, m, n, 2|3)
 
         Returns
         -------
             ndarray
-                Array of weights based on matrix entropy
+                Array of weights based on matrix entropy, of shape (k, n) for the batch of matrices
     """
-    
-    weights = np.zeros(matrix.shape[1])
-    for i in range(matrix.shape[1]):
-        pi = 1 - matrix[:, i, 0] - matrix[:, i, 1]
-        weights[i] = np.sum((np.min(matrix[:, i]) + pi) / (np.max(matrix[:, i]) + pi)) / matrix[:, i].shape[0]
-    
-    return weights
+
+    matrix = as_float(matrix)
+    pi = 1 - matrix[..., 0] - matrix[..., 1]
+    # extreme values of all degrees in the column
+    cmin = np.min(matrix, axis=(-3, -1))[..., np.newaxis, :]
+    cmax = np.max(matrix, axis=(-3, -1))[..., np.newaxis, :]
+
+    return np.mean((cmin + pi) / (cmax + pi), axis=-2)
 
 def thakur_entropy_weights(matrix):
     """
@@ -133,21 +155,18 @@ def thakur_entropy_weights(matrix):
         ----------
             matrix: ndarray
                 Decision matrix / alternatives data
-                Alternatives are in rows and Criteria are in columns
+                Alternatives are in rows and Criteria are in columns.
+                Batch of matrices can be given with the leading axis (k, m, n, 2|3)
 
         Returns
         -------
             ndarray
-                Array of weights based on matrix entropy
+                Array of weights based on matrix entropy, of shape (k, n) for the batch of matrices
     """
 
-    weights = np.zeros(matrix.shape[1])
-    for i in range(matrix.shape[1]):
-        weights[i] = np.sum((1 / np.cos(np.abs(np.abs(3 - 2 * matrix[:, i, 0] - 7 / 3) - 7 / 3) * np.pi / 7) + 1 / np.cos(
-        np.abs(np.abs(3 - 2 * matrix[:, i, 1] - 7 / 3) - 7 / 3) * np.pi / 7) - 334 / 135) / (206 / 135)) / matrix[:, i].shape[0]
-
-    return (1 - weights) / np.sum(1 - weights)
+    matrix = as_float(matrix)
 
+    return _complement_weights(np.mean(_thakur_terms(matrix), axis=-2))
 
 def ye_entropy_weights(matrix):
     """
@@ -157,18 +176,140 @@ def ye_entropy_weights(matrix):
         ----------
             matrix: ndarray
                 Decision matrix / alternatives data
-                Alternatives are in rows and Criteria are in columns
+                Alternatives are in rows and Criteria are in columns.
+                Batch of matrices can be given with the leading axis (k, m, n, 2|3)
 
         Returns
         -------
             ndarray
-                Array of weights based on matrix entropy
+                Array of weights based on matrix entropy, of shape (k, n) for the batch of matrices
     """
 
-    weights = np.zeros(matrix.shape[1])
-    for i in range(matrix.shape[1]):
-        weights[i] = np.sum((np.sin((1 + matrix[:, i, 0] - matrix[:, i, 1]) * np.pi / 4) + np.sin((1 - matrix[:, i, 0] + matrix[:, i, 1]) * np.pi / 4) - 1) * (
-            1 / (np.sqrt(2) - 1))) / matrix[:, i].shape[0]
+    matrix = as_float(matrix)
+
+    return np.mean(_ye_terms(matrix), axis=-2)
+
+
+class _EntropyAccumulator():
+    # subclasses provide _terms, the function calculating the entropy terms of each IFS,
+    # and _weights if the weights are not equal to the entropy
+    def __init__(self):
+        """
+            Base object accumulating the column sums of the entropy measure for the chunks of alternatives.
+            Sums are kept in float64, so the weights of very large datasets can be calculated in a single streaming pass
+            or in parallel, by merging accumulators of the shards.
+            Szmidt entropy depends on the extreme values of the whole column and has no accumulator.
+        """
+        self.count = 0
+        self.sums = None
+
+    @staticmethod
+    def _weights(entropy):
+        return entropy
+
+    def update(self, chunk):
+        """
+            Adds the alternatives of the chunk to the accumulated sums
+
+            Parameters
+            ----------
+                chunk : ndarray
+                    Chunk of the decision matrix, alternatives are in rows and Criteria are in columns.
+                    Chunks of the batch of matrices can be given with the leading axis (k, m, n, 2|3)
+
+            Returns
+            -------
+                self
+                    Updated accumulator
+        """
+        chunk = as_float(chunk)
+        if chunk.ndim < 3 or chunk.shape[-1] not in [2, 3]:
+            raise ValueError('Chunk should be given as the array of shape (m, n, 2|3) or (k, m, n, 2|3)')
+
+        sums = np.sum(self._terms(chunk), axis=-2, dtype=np.float64)
+        if self.sums is None:
+            self.sums = sums
+        elif self.sums.shape != sums.shape:
+            raise ValueError(f'Chunk of {sums.shape[-1]} criteria cannot be added to the accumulator of {self.sums.shape[-1]} criteria')
+        else:
+            self.sums += sums
+        self.count += chunk.shape[-3]
+        return self
+
+    def merge(self, other):
+        """
+            Adds the sums accumulated by other accumulator of the same entropy measure, e.g. calculated for another shard
+
+            Parameters
+            ----------
+                other : accumulator
+                    Accumulator of the same type
+
+            Returns
+            -------
+                self
+                    Merged accumulator
+        """
+        if type(other) is not type(self):
+            raise ValueError(f'{type(other).__name__} cannot be merged with {type(self).__name__}')
+        if other.sums is None:
+            return self
+        if self.sums is None:
+            self.sums = other.sums.copy()
+        elif self.sums.shape != other.sums.shape:
+            raise ValueError('Accumulators of different number of criteria cannot be merged')
+        else:
+            self.sums += other.sums
+        self.count += other.count
+        return self
+
+    def weights(self):
+        """
+            Calculates the objective weights from the accumulated alternatives
+
+            Returns
+            -------
+                ndarray
+                    Array of weights based on matrix entropy, of shape (k, n) for the batch of matrices
+        """
+        if self.count == 0:
+            raise ValueError('Weights cannot be calculated before any alternatives are added')
+        return self._weights(self.sums / self.count).astype(get_dtype())
+
+
+class BurilloEntropyAccumulator(_EntropyAccumulator):
+    """
+        Accumulator of the weights equal to burillo_entropy_weights of all added alternatives
+    """
+    _terms = staticmethod(_burillo_terms)
+    _weights = staticmethod(_complement_weights)
 
-    return weights
 
+class EntropyAccumulator(_EntropyAccumulator):
+    """
+        Accumulator of the weights equal to entropy_weights of all added alternatives
+    """
+    _terms = staticmethod(_burillo_terms)
+    _weights = staticmethod(_inverse_weights)
+
+
+class LiuEntropyAccumulator(_EntropyAccumulator):
+    """
+        Accumulator of the weights equal to liu_entropy_weights of all added alternatives
+    """
+    _terms = staticmethod(_liu_terms)
+
+
+class ThakurEntropyAccumulator(_EntropyAccumulator):
+    """
+        Accumulator of the weights equal to thakur_entropy_weights of all added alternatives
+    """
+    _terms = staticmethod(_thakur_terms)
+    _weights = staticmethod(_complement_weights)
+
+
+class YeEntropyAccumulator(_EntropyAccumulator):
+    """
+        Accumulator of the weights equal to ye_entropy_weights of all added alternatives
+    """
+    _terms = staticmethod(_ye_terms)
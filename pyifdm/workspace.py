@@ -0,0 +1,77 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+from . import metrics
+from .precision import get_dtype
+
+__all__ = [
+    'Workspace'
+]
+
+
+class Workspace():
+    def __init__(self):
+        """
+            Buffers for the intermediate arrays of the method, reused when the method evaluates matrices of the same shape.
+            Each buffer is identified by name and allocated again only if the requested shape or type changes.
+        """
+        self._buffers = {}
+
+    def get(self, name, shape, dtype=None):
+        """
+            Returns buffer with given name, its content is undefined
+
+            Parameters
+            ----------
+                name : str
+                    Name of the buffer
+
+                shape : tuple
+                    Shape of the buffer
+
+                dtype : dtype, default=None
+                    Type of the buffer, type of calculations is used if not given
+
+            Returns
+            -------
+                ndarray
+                    Buffer with given shape and type
+        """
+        dtype = get_dtype() if dtype is None else np.dtype(dtype)
+        shape = tuple(shape)
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buffer
+            if metrics.is_enabled():
+                metrics.WORKSPACE_MISSES.inc()
+        elif metrics.is_enabled():
+            metrics.WORKSPACE_HITS.inc()
+        return buffer
+
+    def names(self):
+        """
+            Returns names of the allocated buffers
+
+            Returns
+            -------
+                list
+                    Names of the buffers
+        """
+        return list(self._buffers)
+
+    def __contains__(self, name):
+        return name in self._buffers
+
+    def __getitem__(self, name):
+        return self._buffers[name]
+
+    def clear(self):
+        """
+            Releases all buffers
+        """
+        self._buffers = {}
+
+    @property
+    def nbytes(self):
+        return sum(buffer.nbytes for buffer in self._buffers.values())
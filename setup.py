@@ -12,7 +12,7 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/jwieckowski/pyifdm",
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=['benchmarks', 'benchmarks.*']),
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -22,5 +22,8 @@ setuptools.setup(
     install_requires=[
         'numpy',
         'scipy'
-    ]
+    ],
+    extras_require={
+        'jit': ['numba']
+    }
 )
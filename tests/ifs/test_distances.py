@@ -2,6 +2,7 @@
 
 import numpy as np
 from pyifdm.methods.ifs.distance import *
+from pyifdm.methods.ifs.distance import elementwise_distance, pairwise_distance
 
 
 def test_euclidean_distance():
@@ -133,3 +134,43 @@ def test_yang_chiclana_distance():
     reference_value = 0.100
 
     assert np.round(calculated_value, 3) == reference_value
+
+def test_elementwise_distance():
+    """
+        Test veryfing that distances between the arrays of IFS equal to the distances calculated for each pair of IFS
+    """
+    np.random.seed(0)
+    u = np.random.rand(6, 4)
+    v = np.random.rand(6, 4) * (1 - u)
+    x = np.dstack((u, v, 1 - u - v))
+    y = np.array([0.5, 0.3, 0.2])
+
+    def custom_distance(a, b):
+        return np.abs(a[0] - b[0])
+
+    for distance in [euclidean_distance, hamming_distance, luo_distance, yang_chiclana_distance, custom_distance]:
+        reference_value = np.array([[distance(xx, y) for xx in row] for row in x])
+        out = np.zeros(x.shape[:2])
+        calculated_value = elementwise_distance(distance, x, y, out=out)
+
+        assert calculated_value is out
+        assert np.allclose(calculated_value, reference_value)
+        reference_value = np.array([[distance(y, xx) for xx in row] for row in x])
+        assert np.allclose(elementwise_distance(distance, y, x), reference_value)
+
+
+def test_pairwise_distance():
+    """
+        Test veryfing that pairwise distances equal to the sums of distances of IFS for each pair of profiles
+    """
+    np.random.seed(1)
+    u = np.random.rand(9, 4)
+    v = np.random.rand(9, 4) * (1 - u)
+    profiles = np.dstack((u, v, 1 - u - v))
+    A, B = profiles[:5], profiles[5:]
+
+    for distance in [hamming_distance, luo_distance, normalized_euclidean_distance]:
+        reference_value = np.array([[np.sum(distance(a, b)) for b in B] for a in A])
+
+        assert pairwise_distance(A, B, distance).shape == (5, 4)
+        assert np.allclose(pairwise_distance(A, B, distance, block_size=10), reference_value)
@@ -1,6 +1,7 @@
 # Copyright (c) 2023 Jakub Więckowski
 
 import numpy as np
+import pytest
 from pyifdm.IFS import IFS
 
 def test_init():
@@ -88,7 +89,8 @@ def test_dominance():
 def test_owa_aggregation():
     ifs = IFS(0.6, 0.2, 0.2)
     weights = [0.3, 0.4, 0.3]
-    result = ifs.owa_aggregation(weights)
+    with pytest.warns(DeprecationWarning):
+        result = ifs.owa_aggregation(weights)
     assert np.isclose(result, 0.32)
 
 def test_similarity_jaccard():
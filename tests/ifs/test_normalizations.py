@@ -2,6 +2,7 @@
 
 import numpy as np
 from pyifdm.methods.ifs.normalization import *
+from pyifdm.methods.ifs.normalization import OUT_NORMALIZATIONS, apply_normalization
 
 def test_ecer_normalization():
     """
@@ -137,3 +138,23 @@ def test_normalization_swap():
     calculated_matrix = swap_normalization(matrix, types)
 
     assert np.alltrue(calculated_matrix == reference_matrix)
+
+def test_normalization_out():
+    """
+        Test veryfing that normalizations store the normalized matrix in the given array without modifying the input
+    """
+    np.random.seed(0)
+    u = np.random.rand(5, 4)
+    v = np.random.rand(5, 4) * (1 - u)
+    matrix = np.dstack((u, v, 1 - u - v))
+    copy = matrix.copy()
+    types = np.array([1, -1, 1, -1])
+
+    for normalization in OUT_NORMALIZATIONS:
+        reference_matrix = normalization(matrix, types)
+        out = np.zeros(matrix.shape)
+        calculated_matrix = apply_normalization(normalization, matrix, types, out=out)
+
+        assert calculated_matrix is out
+        assert np.allclose(calculated_matrix, reference_matrix, equal_nan=True)
+        assert np.array_equal(matrix, copy)
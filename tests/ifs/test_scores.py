@@ -1,7 +1,9 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+import pytest
 from pyifdm.methods.ifs.score import *
+from pyifdm.methods.ifs.score import score_all
 
 def test_liu_wang_score():
     """
@@ -160,3 +162,65 @@ def test_zhang_xu_score_2():
     reference_value = 0.570
 
     assert np.round(calculated_value, 3) == reference_value
+
+
+def test_batched_scores():
+    """
+        Test veryfing that scores of the arrays of IFS of any shape equal to the scores of each IFS and are written to the given array
+    """
+    np.random.seed(0)
+    u = np.random.rand(3, 4, 5, 2)
+    v = np.random.rand(3, 4, 5, 2) * (1 - u)
+    a = np.stack((u, v, 1 - u - v), axis=-1)
+
+    for score in [chen_score_1, chen_score_2, kharal_score_1, kharal_score_2, liu_wang_score, supriya_score, thakur_score,
+                  wan_dong_score_1, wan_dong_score_2, wei_score, zhang_xu_score_1, zhang_xu_score_2]:
+        reference_value = np.array([score(x) for x in a.reshape(-1, 3)]).reshape(a.shape[:-1])
+
+        out = np.zeros(a.shape[:-1])
+        assert score(a, out=out) is out
+        assert np.allclose(out, reference_value)
+        for i in range(a.ndim - 1):
+            # the same formula for 1-D, 2-D and 3-D arrays of IFS
+            b = a[(0, ) * (a.ndim - 2 - i)]
+            assert np.allclose(score(b), reference_value[(0, ) * (a.ndim - 2 - i)])
+
+    assert zhang_xu_score_2(np.array([0.0, 0.0, 1.0])) == 0
+    assert np.all(zhang_xu_score_2(np.array([[0.0, 0.0, 1.0], [0.5, 0.5, 0.0]])) == [0, 0.5])
+
+
+def test_score_all():
+    """
+        Test veryfing that scores calculated in one pass equal to the scores calculated separately
+    """
+    np.random.seed(1)
+    u = np.random.rand(7, 5, 3)
+    v = np.random.rand(7, 5, 3) * (1 - u)
+    a = np.stack((u, v, 1 - u - v), axis=-1)
+    a[0, 0, 0] = [0, 0, 1]
+    scores = [chen_score_1, chen_score_2, kharal_score_1, kharal_score_2, liu_wang_score, supriya_score, thakur_score,
+              wan_dong_score_1, wan_dong_score_2, wei_score, zhang_xu_score_1, zhang_xu_score_2]
+
+    calculated_value = score_all(a, chunk_size=16)
+    assert calculated_value.shape == (12, 7, 5, 3)
+    assert np.allclose(calculated_value, [score(a) for score in scores])
+
+    out = np.zeros((2, 7, 5, 3))
+    assert score_all(a, names=['wei_score', thakur_score], out=out) is out
+    assert np.allclose(out, [wei_score(a), thakur_score(a)])
+
+    calculated_value = score_all(a[0, 0, 1], names=['supriya_score', 'zhang_xu_score_2'], as_dict=True)
+    assert list(calculated_value) == ['supriya_score', 'zhang_xu_score_2']
+    assert np.isclose(calculated_value['supriya_score'], supriya_score(a[0, 0, 1]))
+
+    with pytest.raises(ValueError):
+        score_all(a, names=['unknown_score'])
+
+    calculated_value = score_all(a, names=[chen_score_1, chen_score_2], params={chen_score_2: {'y': 0.3}})
+    assert np.allclose(calculated_value[1], chen_score_2(a, y=0.3))
+
+    with pytest.raises(ValueError):
+        score_all(a, names=['wei_score'], params={'wei_score': {'y': 0.3}})
+
+    with pytest.raises(ValueError):
+        score_all(a, names=['wei_score'], params={'chen_score_2': {'y': 0.3}})
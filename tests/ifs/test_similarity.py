@@ -2,7 +2,9 @@
 
 import unittest
 import numpy as np
+import pytest
 from pyifdm.methods.ifs.similarity import *
+from pyifdm.methods.ifs.similarity import pairwise_similarity
 
 
 def test_chen_similarity():
@@ -63,4 +65,29 @@ def test_ye_similarity():
     """
     a = np.array([0.8, 0.15])
     b = np.array([0.7, 0.28])
-    assert np.round(ye_similarity(a, b), 3) == 0.981
\ No newline at end of file
+    assert np.round(ye_similarity(a, b), 3) == 0.981
+
+def test_pairwise_similarity():
+    """
+        Test veryfing that pairwise similarities equal to the similarity of each pair of profiles
+    """
+    np.random.seed(5)
+    u = np.random.rand(12, 4)
+    v = np.random.rand(12, 4) * (1 - u)
+    profiles = np.dstack((u, v, 1 - u - v))
+    A, B = profiles[:7], profiles[7:]
+
+    for measure in [chen_similarity, fan_zhang_similarity, hong_kim_similarity, li_similarity, li_xu_similarity, ye_similarity]:
+        reference = np.array([[measure(a, b) for b in B] for a in A])
+
+        assert pairwise_similarity(A, B, measure).shape == (7, 5)
+        assert np.allclose(pairwise_similarity(A, B, measure), reference)
+        assert np.allclose(pairwise_similarity(A, B, measure, block_size=10, n_jobs=3), reference)
+
+    # functions outside the module are calculated for each pair of profiles
+    measure = lambda a, b: np.mean(np.abs(a - b))
+    reference = np.array([[measure(a, b) for b in B] for a in A])
+    assert np.allclose(pairwise_similarity(A, B, measure, block_size=10, n_jobs=2), reference)
+
+    with pytest.raises(ValueError):
+        pairwise_similarity(A, B[:, :3], chen_similarity)
@@ -0,0 +1,84 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyifdm.aggregation import *
+from pyifdm.methods.ifs.score import chen_score_1
+
+
+def _matrix(shape, seed):
+    np.random.seed(seed)
+    u = np.random.rand(*shape)
+    v = np.random.rand(*shape) * (1 - u)
+    return np.stack((u, v, 1 - u - v), axis=-1)
+
+
+def test_ifwa_ifwg():
+    """
+        Test veryfing that the aggregation and weighting of IFS equal to the calculations for each row with the formulas of the operators
+    """
+    matrix = _matrix((6, 4), 0)
+    weights = np.array([0.4, 0.3, 0.2, 0.1])
+
+    for row, a, g in zip(matrix, ifwa(matrix, weights, axis=1), ifwg(matrix, weights, axis=1)):
+        u = 1 - np.prod([(1 - x[0]) ** w for x, w in zip(row, weights)])
+        v = np.prod([x[1] ** w for x, w in zip(row, weights)])
+        assert np.allclose(a, [u, v, 1 - u - v])
+
+        u = np.prod([x[0] ** w for x, w in zip(row, weights)])
+        v = 1 - np.prod([(1 - x[1]) ** w for x, w in zip(row, weights)])
+        assert np.allclose(g, [u, v, 1 - u - v])
+
+    for row, p in zip(matrix, product(matrix, weights, axis=1)):
+        assert np.allclose(p[:, 0], row[:, 0] * weights)
+        assert np.allclose(p[:, 1], row[:, 1] + weights - row[:, 1] * weights)
+        assert np.allclose(p[:, 2], 1 - p[:, 0] - p[:, 1])
+
+    # equal weights by default, aggregation of the alternatives
+    assert np.allclose(ifwg(matrix, axis=0), ifwg(matrix, np.full(6, 1/6), axis=0))
+    assert ifwa(matrix, axis=0).shape == (4, 3)
+
+
+def test_batched_aggregation():
+    """
+        Test veryfing that the batch of matrices is aggregated as each matrix separately, for crisp and IFS weights
+    """
+    batch = _matrix((5, 6, 4), 1)
+    weights = [np.array([0.4, 0.3, 0.2, 0.1]), np.array([[0.4, 0.3], [0.3, 0.3], [0.2, 0.2], [0.1, 0.1]])]
+
+    for w in weights:
+        for operator in [ifwa, ifwg, multiply, power, product, ifowa, ifha]:
+            result = operator(batch, w)
+            assert np.allclose(result, [operator(matrix, w) for matrix in batch])
+
+    out = np.empty((5, 6, 2))
+    assert ifwa(batch, weights[0], out=out) is out
+    assert np.allclose(out, ifwa(batch, weights[0])[..., :2])
+
+
+def test_ordered_aggregation():
+    """
+        Test veryfing that the IFOWA operator assigns weights to IFS sorted by the score, and the IFHA operator with equal weights equals to IFOWA
+    """
+    matrix = _matrix((6, 4), 2)
+    weights = np.array([0.4, 0.3, 0.2, 0.1])
+
+    order = np.argsort(-chen_score_1(matrix), axis=1, kind='stable')
+    ordered = np.take_along_axis(matrix, order[..., np.newaxis], axis=1)
+    assert np.allclose(ifowa(matrix, weights, axis=1), ifwa(ordered, weights, axis=1))
+    assert np.allclose(ifowa(matrix[:, ::-1], weights, axis=1), ifowa(matrix, weights, axis=1))
+
+    assert np.allclose(ifha(matrix, None, weights, axis=1), ifowa(matrix, weights, axis=1))
+
+
+def test_aggregation_errors():
+    """
+        Test veryfing that the aggregation over the axis of degrees and the weights not matching the axis raise ValueError
+    """
+    matrix = _matrix((6, 4), 3)
+
+    with pytest.raises(ValueError):
+        ifwa(matrix, axis=-1)
+
+    with pytest.raises(ValueError):
+        ifwg(matrix, np.array([0.5, 0.5]), axis=1)
@@ -0,0 +1,105 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import tracemalloc
+import numpy as np
+from pyifdm.methods import *
+from pyifdm.methods.ifs.normalization import swap_normalization
+from pyifdm.methods.ifs.score import chen_score_1, liu_wang_score
+from pyifdm.precision import as_float
+from pyifdm.workspace import Workspace
+
+
+def _random_matrix(m, n):
+    """
+        Generates random matrix with Intuitionistic Fuzzy Sets
+    """
+    np.random.seed(0)
+    u = np.random.rand(m, n)
+    v = np.random.rand(m, n) * (1 - u)
+    return np.dstack((u, v, 1 - u - v))
+
+
+def _peak_allocation(func, *args):
+    """
+        Returns peak size of memory allocated during the function call
+    """
+    # a new tracing session starts with zero peak, tracemalloc.reset_peak is not available before Python 3.9
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+matrix = _random_matrix(2000, 5)
+weights = np.ones(5) / 5
+types = np.array([1, -1, 1, -1, 1])
+
+
+def test_no_input_copies():
+    """
+        Test veryfing that data given in the calculation type is not copied
+    """
+    assert as_float(matrix) is matrix
+    # scores allocate only the crisp values and temporary arrays, smaller than a copy of the matrix
+    assert _peak_allocation(chen_score_1, matrix) < matrix.nbytes
+    assert _peak_allocation(liu_wang_score, matrix) < matrix.nbytes
+    # normalization allocates only the normalized matrix
+    assert _peak_allocation(swap_normalization, matrix, types) < 1.5 * matrix.nbytes
+
+
+def test_methods_allocations():
+    """
+        Test veryfing that methods do not copy the matrix besides the intermediate arrays, which are reused in the repeated calls
+    """
+    for method in [ifCOPRAS(), ifMOORA(), ifTOPSIS(), ifWASPAS(), ifWPM(), ifWSM()]:
+        # warm-up call on a separate instance, so the compilation of the numba kernels is not measured
+        type(method)()(matrix[:10], weights, types)
+        assert _peak_allocation(method, matrix, weights, types) < 3 * matrix.nbytes
+        assert _peak_allocation(method, matrix, weights, types) < 1.5 * matrix.nbytes
+
+    for method in [ifARAS(), ifEDAS(), ifMABAC(), ifMAIRCA(), ifTOPSIS(), ifVIKOR()]:
+        first = _peak_allocation(method, matrix, weights, types)
+        assert _peak_allocation(method, matrix, weights, types) < first
+
+
+def test_workspace():
+    """
+        Test veryfing that workspace buffers are reused for the same shape and type
+    """
+    workspace = Workspace()
+    buffer = workspace.get('a', (10, 5))
+    assert buffer.dtype == np.float64
+    assert workspace.get('a', (10, 5)) is buffer
+    assert workspace.get('a', (20, 5)) is not buffer
+    assert workspace.get('a', (20, 5), dtype=np.float32).dtype == np.float32
+    assert workspace.get('b', (10, ), dtype=bool).dtype == bool
+    assert workspace.nbytes == 20 * 5 * 4 + 10
+    workspace.clear()
+    assert workspace.nbytes == 0
+
+    method = ifTOPSIS()
+    preferences = method(matrix, weights, types).copy()
+    wmatrix = method.workspace.get('wmatrix', matrix.shape)
+    assert np.array_equal(method(matrix, weights, types), preferences)
+    assert method.workspace.get('wmatrix', matrix.shape) is wmatrix
+    # results of the previous calls are not overwritten by the buffers
+    first = method(matrix[:10], weights, types)
+    method(matrix[10:20], weights, types)
+    assert np.allclose(first, ifTOPSIS()(matrix[:10], weights, types))
+
+
+def test_read_only_input():
+    """
+        Test veryfing that methods do not modify the input data
+    """
+    data = _random_matrix(10, 5)
+    data.setflags(write=False)
+
+    methods = [ifARAS(), ifCODAS(), ifCOPRAS(), ifEDAS(), ifMABAC(), ifMAIRCA(), ifMARCOS(), ifMOORA(),
+               ifOCRA(), ifTOPSIS(), ifVIKOR(), ifWASPAS(), ifWPM(), ifWSM()]
+    for method in methods:
+        method(data, weights, types)
@@ -0,0 +1,43 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+from pyifdm.backend import get_backend
+from pyifdm.correlations import _merge_inversions
+from pyifdm.methods.codas.ifs import _assessment_score
+from pyifdm.methods.moora.ifs import _fold
+
+
+def test_backend():
+    """
+        Test veryfing that the active backend is reported
+    """
+    assert get_backend() in ['numba', 'numpy']
+
+
+def test_kernels():
+    """
+        Test veryfing that loop kernels give the same results as the NumPy calculations
+    """
+    np.random.seed(0)
+    D1, D2 = np.random.rand(50), np.random.rand(50)
+    tau = 0.05
+    RA = np.subtract.outer(D1, D1)
+    RA += (np.abs(RA) >= tau) * np.subtract.outer(D2, D2)
+
+    assert np.allclose(_assessment_score(D1, D2, tau), np.sum(RA, axis=1))
+
+    u = np.random.rand(20, 6)
+    v = np.random.rand(20, 6) * (1 - u)
+    wmatrix = np.dstack((u, v, 1 - u - v))
+    indexes = np.array([0, 2, 3])
+    reference = np.zeros((20, 3))
+    reference[:, 0] = 1 - np.prod(1 - wmatrix[:, indexes, 0], axis=1)
+    reference[:, 1] = np.prod(wmatrix[:, indexes, 1], axis=1)
+    reference[:, 2] = 1 - reference[:, 0] - reference[:, 1]
+
+    assert np.allclose(_fold(wmatrix, indexes, np.zeros((20, 3))), reference)
+
+    R = np.random.randint(0, 10, (4, 37))
+    reference = [sum(r[i] > r[j] for i in range(37) for j in range(i + 1, 37)) for r in R]
+
+    assert np.allclose(_merge_inversions(R, np.zeros(4)), reference)
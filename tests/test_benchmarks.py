@@ -0,0 +1,34 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import json
+from benchmarks import cases, run
+from benchmarks.__main__ import main
+
+
+def test_benchmarks():
+    """
+        Test veryfing that benchmarks cover the methods and functions and give serializable results
+    """
+    groups = {group for group, _, _, _ in cases(5, 3)}
+    assert groups == {'methods', 'score', 'distance', 'normalization', 'similarity'}
+    assert len([c for c in cases(5, 3) if c[0] == 'methods']) == 14
+
+    results = run(sizes=(5, ), criteria=(3, ), repeat=1)
+    assert len(results) == len(cases(5, 3))
+    assert all(r['time'] >= 0 and r['peak_memory'] >= 0 for r in results)
+
+    assert len(run(sizes=(5, ), criteria=(3, ), repeat=1, select='topsis')) == 0
+    assert len(run(sizes=(5, ), criteria=(3, ), repeat=1, select='TOPSIS')) == 1
+
+
+def test_benchmarks_output(tmp_path):
+    """
+        Test veryfing that benchmark results are saved as JSON
+    """
+    path = tmp_path / 'results.json'
+    main(['-m', '5', '-n', '3', '-r', '1', '-k', 'score', '-q', '-o', str(path)])
+
+    with open(path) as f:
+        report = json.load(f)
+    assert report['seed'] == 0
+    assert all(r['group'] == 'score' for r in report['results'])
@@ -0,0 +1,54 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyifdm.clustering import *
+from pyifdm.methods.ifs.distance import hamming_distance, euclidean_distance
+
+
+def _clusters(m, n, k, seed):
+    np.random.seed(seed)
+    u = np.random.rand(k, n)
+    v = np.random.rand(k, n) * (1 - u)
+    labels = np.random.randint(0, k, m)
+    u = np.clip(u[labels] + np.random.normal(0, 0.01, (m, n)), 0, 1)
+    v = np.clip(v[labels] + np.random.normal(0, 0.01, (m, n)), 0, 1 - u)
+    return np.dstack((u, v, 1 - u - v)), labels
+
+
+def test_kmedoids():
+    """
+        Test veryfing that groups of near-identical profiles are found and medoids have the smallest sum of distances in the clusters
+    """
+    profiles, reference = _clusters(600, 4, 3, 0)
+    clustering = KMedoids(3, hamming_distance, chunk_size=100, block_size=1000).fit(profiles)
+
+    # each cluster contains exactly one group of profiles
+    assert len(set(zip(reference, clustering.labels))) == 3
+    assert np.allclose(clustering.centers, profiles[clustering.medoids])
+    assert np.all(clustering.predict(profiles) == clustering.labels)
+
+    distances = np.sum(hamming_distance(profiles[:, np.newaxis], profiles[np.newaxis]), axis=-1)
+    assert np.isclose(clustering.inertia, np.sum(distances[np.arange(600), clustering.medoids[clustering.labels]]))
+    for cluster, medoid in enumerate(clustering.medoids):
+        members = np.flatnonzero(clustering.labels == cluster)
+        costs = np.sum(distances[np.ix_(members, members)], axis=1)
+        assert np.isclose(costs[members == medoid][0], np.min(costs))
+
+
+def test_kmedoids_processes():
+    """
+        Test veryfing that clustering with the assignment in processes equals to the clustering in the current process
+    """
+    profiles, _ = _clusters(400, 3, 4, 1)
+    clustering = KMedoids(4, euclidean_distance, chunk_size=50).fit(profiles)
+    parallel = KMedoids(4, euclidean_distance, chunk_size=50, n_jobs=2).fit(profiles)
+
+    assert np.all(clustering.medoids == parallel.medoids)
+    assert np.all(clustering.labels == parallel.labels)
+
+    with pytest.raises(ValueError):
+        KMedoids(401).fit(profiles)
+
+    with pytest.raises(ValueError):
+        KMedoids(3, max_iter=0).fit(profiles)
@@ -56,3 +56,66 @@ def test_ws_rank_similarity_coef():
     x = np.array([7, 11, 2, 1, 4, 9, 6, 3, 5, 10, 8, 12])
     y = np.array([7, 11, 3, 2, 4, 9, 6, 1, 5, 10, 8, 12])
     assert np.round(ws_rank_similarity_coef(x, y), 2) == 0.9
+
+
+def test_correlation_matrices():
+    """
+        Test veryfing that correlation matrices equal to the coefficients calculated for each pair of vectors
+    """
+    np.random.seed(3)
+    k, m = 6, 25
+    values = np.random.rand(k, m)
+    values[1, :5] = values[1, 0]
+    rankings = np.argsort(np.argsort(np.random.rand(k, m), axis=1), axis=1) + 1.0
+
+    for method, coef, data in [(pearson_matrix, pearson_coef, values), (spearman_matrix, spearman_coef, rankings),
+                               (weighted_spearman_matrix, weighted_spearman_coef, rankings),
+                               (ws_rank_similarity_matrix, ws_rank_similarity_coef, rankings)]:
+        reference = np.array([[coef(x, y) for y in data] for x in data])
+        assert method(data).shape == (k, k)
+        assert np.allclose(method(data), reference)
+
+    assert np.allclose(ws_rank_similarity_matrix(rankings, block_size=m), ws_rank_similarity_matrix(rankings))
+
+    # values are ranked, tied values get the average rank
+    ranks = np.array([np.array([np.sum(x < v) + (np.sum(x == v) + 1) / 2 for v in x]) for x in values])
+    assert np.allclose(spearman_matrix(values), pearson_matrix(ranks))
+    assert np.allclose(np.diag(spearman_matrix(values)), 1)
+
+
+def test_kendall_tau_coef():
+    """
+        Test veryfing that Kendall tau-b correlation equals to the coefficient calculated from all pairs of values, including tied values
+    """
+    np.random.seed(4)
+    x = np.random.randint(0, 6, (5, 40)).astype(float)
+    y = np.random.randint(0, 6, (5, 40)).astype(float)
+
+    def reference(a, b):
+        sign = np.sign(np.subtract.outer(a, a)) * np.sign(np.subtract.outer(b, b))
+        n0 = a.shape[0] * (a.shape[0] - 1) / 2
+        t1 = np.sum(np.subtract.outer(a, a) == 0) / 2 - a.shape[0] / 2
+        t2 = np.sum(np.subtract.outer(b, b) == 0) / 2 - b.shape[0] / 2
+        return np.sum(sign) / 2 / np.sqrt((n0 - t1) * (n0 - t2))
+
+    assert np.allclose(kendall_tau_coef(x, y), [reference(a, b) for a, b in zip(x, y)])
+    assert np.isclose(kendall_tau_coef(x[0], y[0]), reference(x[0], y[0]))
+    assert np.isclose(kendall_tau_coef(x[0], x[0]), 1)
+    assert np.isclose(kendall_tau_coef(np.arange(10), np.arange(10)[::-1]), -1)
+    assert kendall_tau_coef(x.reshape(1, 5, 40), y.reshape(1, 5, 40)).shape == (1, 5)
+
+
+def test_footrule_distances():
+    """
+        Test veryfing correctness of Spearman footrule and top k footrule distances
+    """
+    x = np.array([1, 2, 3, 4, 5])
+    y = np.array([2, 1, 5, 3, 4])
+
+    assert spearman_footrule_distance(x, y) == 6
+    assert spearman_footrule_distance(x, x[::-1], normalize=True) == 1
+    # positions below the top 2 are not distinguished
+    assert top_k_footrule_distance(x, y, 2) == 2
+    assert top_k_footrule_distance(x, np.array([3, 4, 5, 1, 2]), 2, normalize=True) == 1
+    assert np.allclose(spearman_footrule_distance(np.stack((x, y)), x), [0, 6])
+    assert np.allclose(top_k_footrule_distance(np.stack((x, y)), x, 2), [0, 2])
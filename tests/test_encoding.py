@@ -0,0 +1,144 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+from pyifdm.encoding import *
+from pyifdm.methods import *
+from pyifdm.methods.ifs.distance import hamming_distance
+from pyifdm.methods.ifs.score import liu_wang_score
+
+
+def _linguistic_matrix(m, n):
+    """
+        Generates matrix with the elements from the 5-point linguistic scale
+    """
+    scale = np.array([[0.1, 0.8], [0.3, 0.6], [0.5, 0.4], [0.7, 0.2], [0.9, 0.05]])
+    np.random.seed(0)
+    return scale[np.random.randint(0, scale.shape[0], (m, n))]
+
+
+def test_codebook_matrix():
+    """
+        Test veryfing correctness of the matrix encoding with the codebook of terms
+    """
+    matrix = _linguistic_matrix(100, 6)
+    encoded = CodebookMatrix.from_matrix(matrix)
+
+    assert encoded.terms.shape == (5, 2)
+    assert encoded.codes.dtype == np.uint8
+    assert encoded.shape == matrix.shape
+    assert (encoded.decode() == matrix).all()
+    assert (np.asarray(encoded) == matrix).all()
+    assert encoded.codes.nbytes * 16 == matrix.nbytes
+
+    # indexes of more than 65536 terms do not fit 16 bits
+    matrix = _random_matrix(300, 300)
+    encoded = CodebookMatrix.from_matrix(matrix)
+    assert encoded.codes.dtype == np.uint32
+    assert (encoded.decode() == matrix).all()
+
+
+def test_codebook_lookups():
+    """
+        Test veryfing that scores and distances evaluated per term equal the element-wise calculations
+    """
+    matrix = _linguistic_matrix(20, 4)
+    encoded = CodebookMatrix.from_matrix(matrix)
+    b = np.array([1, 0, 0])
+
+    assert np.allclose(apply_score(liu_wang_score, encoded), liu_wang_score(matrix))
+    assert np.allclose(apply_distance(hamming_distance, encoded, b), apply_distance(hamming_distance, matrix, b))
+
+    table = encoded.distance_table(hamming_distance)
+    assert np.allclose(table, table.T)
+    assert np.allclose(np.diag(table), 0)
+
+
+def test_codebook_methods():
+    """
+        Test veryfing that methods give the same preferences for the encoded and decoded matrix
+    """
+    matrix = _linguistic_matrix(12, 4)
+    encoded = CodebookMatrix.from_matrix(matrix)
+    weights = np.array([0.3, 0.2, 0.25, 0.25])
+    types = np.array([1, -1, 1, -1])
+
+    methods = [ifARAS(), ifCODAS(), ifCOPRAS(), ifEDAS(), ifMABAC(), ifMAIRCA(), ifMARCOS(), ifMOORA(),
+               ifOCRA(), ifTOPSIS(), ifVIKOR(), ifWASPAS(), ifWPM(), ifWSM()]
+    for method in methods:
+        assert np.allclose(method(encoded, weights, types), method(matrix, weights, types), equal_nan=True)
+
+
+def _random_matrix(m, n):
+    """
+        Generates random matrix with Intuitionistic Fuzzy Sets
+    """
+    np.random.seed(1)
+    u = np.random.rand(m, n)
+    v = np.random.rand(m, n) * (1 - u)
+    return np.dstack((u, v, 1 - u - v))
+
+
+def test_quantized_matrix():
+    """
+        Test veryfing correctness of the quantization of the membership and non-membership degrees
+    """
+    matrix = _random_matrix(1000, 5)
+    quantized = QuantizedMatrix.from_matrix(matrix, chunk_size=64)
+    decoded = quantized.decode()
+
+    assert quantized.data.dtype == np.uint16
+    assert quantized.shape == matrix.shape
+    assert quantized.nbytes * 6 == matrix.nbytes
+    assert np.max(np.abs(decoded - matrix)[:, :, :2]) <= 1 / QuantizedMatrix.LEVELS
+    assert np.max(np.abs(decoded - matrix)[:, :, 2]) <= 2 / QuantizedMatrix.LEVELS
+    assert np.all(decoded[:, :, 2] >= 0)
+
+    streamed = QuantizedMatrix.from_chunks(matrix[i:i + 300] for i in range(0, 1000, 300))
+    assert (streamed.data == quantized.data).all()
+    assert (np.concatenate(list(quantized.iter_chunks(300))) == decoded).all()
+
+
+def test_quantized_methods():
+    """
+        Test veryfing that methods give close preferences for the quantized matrix
+    """
+    matrix = _random_matrix(15, 4)
+    quantized = QuantizedMatrix.from_matrix(matrix)
+    weights = np.array([0.3, 0.2, 0.25, 0.25])
+    types = np.array([1, -1, 1, -1])
+
+    # MABAC raises memberships close to 0 to the power of the weights, it is checked only for the bounded degrees
+    methods = [ifARAS(), ifCODAS(), ifCOPRAS(), ifEDAS(), ifMAIRCA(), ifMARCOS(), ifMOORA(),
+               ifOCRA(), ifTOPSIS(), ifVIKOR(), ifWASPAS(), ifWPM(), ifWSM()]
+    for method in methods:
+        assert np.allclose(method(quantized, weights, types), method(matrix, weights, types), atol=1e-3)
+
+    # degrees bounded away from 0 and 1
+    np.random.seed(1)
+    u = 0.1 + 0.7 * np.random.rand(15, 4)
+    v = (0.1 + 0.8 * np.random.rand(15, 4)) * (1 - u)
+    matrix = np.dstack((u, v, 1 - u - v))
+    quantized = QuantizedMatrix.from_matrix(matrix)
+    for method in methods + [ifMABAC()]:
+        assert np.allclose(method(quantized, weights, types), method(matrix, weights, types), atol=1e-3)
+
+
+def test_iter_preferences():
+    """
+        Test veryfing that preferences calculated in chunks equal preferences of the whole matrix
+    """
+    matrix = _random_matrix(500, 4)
+    quantized = QuantizedMatrix.from_matrix(matrix)
+    weights = np.array([0.3, 0.2, 0.25, 0.25])
+    types = np.array([1, -1, 1, -1])
+
+    for method in [ifMOORA(), ifWASPAS(), ifWPM(), ifWSM()]:
+        preferences = method(quantized, weights, types)
+        chunked = np.concatenate(list(iter_preferences(method, quantized, weights, types, chunk_size=64)))
+        assert np.allclose(chunked, preferences)
+
+    try:
+        next(iter_preferences(ifTOPSIS(), quantized, weights, types))
+        assert False
+    except ValueError:
+        pass
@@ -27,3 +27,31 @@ def test_generate_ifs_matrix():
     assert matrix.shape[2] == 2
     assert np.min(matrix) >= 0
     assert np.max(matrix) <= 1
+
+
+def test_top_k():
+    """
+        Test veryfing correctness of the top k selection with ties resolved by the index
+    """
+    preferences = np.array([0.2, 0.9, 0.5, 0.9, 0.1, 0.5])
+
+    assert (top_k(preferences, 3) == np.array([1, 3, 2])).all()
+    assert (top_k(preferences, 3, descending=False) == np.array([4, 0, 2])).all()
+    assert (top_k(preferences, 10) == np.argsort(-preferences, kind='stable')).all()
+    assert top_k(preferences, 0).shape[0] == 0
+
+
+def test_top_k_stream():
+    """
+        Test veryfing correctness of the top k selection from chunked values
+    """
+    np.random.seed(0)
+    preferences = np.round(np.random.random(1000), 2)
+    chunks = np.array_split(preferences, 7)
+
+    for descending in [True, False]:
+        indices, values = top_k_stream(chunks, 25, descending)
+        reference = top_k(preferences, 25, descending)
+
+        assert (indices == reference).all()
+        assert (values == preferences[reference]).all()
@@ -0,0 +1,149 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+from pyifdm.methods import ifARAS, ifCOPRAS, ifMARCOS, ifMOORA, ifTOPSIS, ifWASPAS, ifWPM, ifWSM
+from pyifdm.methods.incremental import *
+from pyifdm.methods.ifs.normalization import ecer_normalization, max_normalization, minmax_normalization, supriya_normalization
+from pyifdm.helpers import generate_ifs_matrix, rank
+
+
+def _verify(evaluator, method, weights, types):
+    """
+        Adds and removes alternatives and compares the preferences with the full evaluation
+    """
+    np.random.seed(2)
+    rng = np.random.default_rng(2)
+    reference = evaluator.matrix.copy()
+
+    for _ in range(40):
+        if rng.random() < 0.5 or evaluator.ids.shape[0] < 3:
+            if rng.random() < 0.5:
+                evaluator.add(reference[rng.integers(reference.shape[0])])
+            else:
+                evaluator.add(generate_ifs_matrix(1, reference.shape[1])[0])
+        else:
+            evaluator.remove(int(rng.choice(evaluator.ids)))
+
+        preferences = method(evaluator.matrix, weights, types)
+        assert np.allclose(evaluator.preferences, preferences)
+        assert all(rank(np.round(evaluator.preferences, 10)) == rank(np.round(preferences, 10)))
+
+
+def test_incremental_topsis():
+    """
+        Test veryfing that incremental TOPSIS follows the full evaluation after adding and removing alternatives
+    """
+    np.random.seed(0)
+    matrix = generate_ifs_matrix(10, 4)
+    weights = np.array([0.3, 0.2, 0.25, 0.25])
+    types = np.array([1, -1, 1, -1])
+
+    _verify(IncrementalTOPSIS(matrix, weights, types), ifTOPSIS(), weights, types)
+    _verify(IncrementalTOPSIS(matrix, weights, types, normalization=ecer_normalization),
+            ifTOPSIS(normalization=ecer_normalization), weights, types)
+
+
+def test_incremental_aras():
+    """
+        Test veryfing that incremental ARAS follows the full evaluation after adding and removing alternatives
+    """
+    np.random.seed(0)
+    matrix = generate_ifs_matrix(10, 4)
+    weights = np.array([[0.3, 0.6], [0.2, 0.7], [0.25, 0.6], [0.25, 0.7]])
+    types = np.array([1, -1, 1, 1])
+
+    _verify(IncrementalARAS(matrix, weights, types), ifARAS(), weights, types)
+
+
+def test_incremental_marcos():
+    """
+        Test veryfing that incremental MARCOS follows the full evaluation after adding and removing alternatives
+    """
+    np.random.seed(0)
+    matrix = generate_ifs_matrix(10, 4)
+    weights = np.array([0.3, 0.2, 0.25, 0.25])
+    types = np.array([1, -1, 1, -1])
+
+    _verify(IncrementalMARCOS(matrix, weights, types), ifMARCOS(), weights, types)
+
+
+def test_incremental_ids():
+    """
+        Test veryfing the identifiers of added and removed alternatives
+    """
+    np.random.seed(0)
+    matrix = generate_ifs_matrix(4, 3)
+    weights = np.array([0.4, 0.3, 0.3])
+    types = np.array([1, -1, 1])
+
+    evaluator = IncrementalTOPSIS(matrix, weights, types)
+    new_id = evaluator.add(matrix[0])
+    evaluator.remove(1)
+
+    assert new_id == 4
+    assert all(evaluator.ids == [0, 2, 3, 4])
+    assert evaluator.preferences[0] == evaluator.preferences[-1]
+    assert evaluator.top_k(2)[0] in evaluator.ids
+
+
+def test_update_cell():
+    """
+        Test veryfing that single value updates follow the full evaluation of the changed matrix
+    """
+    np.random.seed(0)
+    matrix = generate_ifs_matrix(10, 4)
+    weights = np.array([0.3, 0.2, 0.25, 0.25])
+    types = np.array([1, -1, 1, -1])
+
+    evaluators = [
+        (IncrementalWSM(matrix, weights, types), ifWSM()),
+        (IncrementalWPM(matrix, weights, types), ifWPM()),
+        (IncrementalWASPAS(matrix, weights, types), ifWASPAS()),
+        (IncrementalCOPRAS(matrix, weights, types), ifCOPRAS()),
+        (IncrementalMOORA(matrix, weights, types), ifMOORA()),
+        (IncrementalWSM(matrix, weights, types, normalization=ecer_normalization), ifWSM(normalization=ecer_normalization)),
+        (IncrementalTOPSIS(matrix, weights, types), ifTOPSIS()),
+    ]
+
+    for evaluator, method in evaluators:
+        rng = np.random.default_rng(3)
+        for _ in range(20):
+            i, j = int(rng.integers(matrix.shape[0])), int(rng.integers(matrix.shape[1]))
+            preferences, ranking = evaluator.update_cell(i, j, generate_ifs_matrix(1, 1)[0, 0])
+
+            assert np.allclose(preferences, method(evaluator.matrix, weights, types))
+            assert all(ranking == rank(preferences))
+
+        _verify(evaluator, method, weights, types)
+
+
+def test_extrema_normalizations():
+    """
+        Test veryfing that single value updates with the normalizations based on the criteria extrema follow the full evaluation,
+        when the changes move the extrema and when they do not
+    """
+    np.random.seed(1)
+    matrix = generate_ifs_matrix(10, 4)
+    weights = np.array([0.3, 0.2, 0.25, 0.25])
+    types = np.array([1, -1, 1, -1])
+
+    for normalization in [ecer_normalization, max_normalization, minmax_normalization, supriya_normalization]:
+        evaluators = [(IncrementalMOORA(matrix, weights, types, normalization=normalization), ifMOORA(normalization=normalization))]
+        # max normalization gives degrees greater than 1, which cannot be raised to the power of the weights
+        if normalization is not max_normalization:
+            evaluators += [
+                (IncrementalWSM(matrix, weights, types, normalization=normalization), ifWSM(normalization=normalization)),
+                (IncrementalWASPAS(matrix, weights, types, normalization=normalization), ifWASPAS(normalization=normalization)),
+            ]
+        for evaluator, method in evaluators:
+            rng = np.random.default_rng(4)
+            for _ in range(100):
+                i, j = int(rng.integers(matrix.shape[0])), int(rng.integers(matrix.shape[1]))
+                # small changes rarely move the extrema
+                value = evaluator.matrix[i, j] if rng.random() < 0.7 else generate_ifs_matrix(1, 1)[0, 0]
+                value = np.clip(value + rng.normal(0, 0.01, value.shape), 0.01, 0.98)
+                value[1] = min(value[1], 0.99 - value[0])
+                preferences, _ = evaluator.update_cell(i, j, value)
+                assert np.allclose(preferences, method(evaluator.matrix, weights, types))
+
+            _verify(evaluator, method, weights, types)
@@ -1,8 +1,10 @@
 # Copyright (c) 2022-2023 Jakub Więckowski, Bartłomiej Kizielewicz
 
 import numpy as np
+import pytest
 from pyifdm.methods import *
 from pyifdm.helpers import rank
+from concurrent.futures import ThreadPoolExecutor
 
 
 def test_ifARAS():
@@ -419,3 +421,95 @@ def test_ifWASPAS():
     reference_Q = np.array([0.5507, 0.4720, 0.2984, 0.3946, 0.3407])
 
     assert all(rank(results, False) == rank(reference_Q, False))
+
+
+def test_top_k():
+    """
+        Test veryfing that the selected top k alternatives follow the ranking direction of the methods
+    """
+
+    matrix = np.array([
+        [[0.4, 0.5], [0.6, 0.3], [0.3, 0.6]],
+        [[0.6, 0.3], [0.5, 0.4], [0.7, 0.2]],
+        [[0.7, 0.2], [0.2, 0.7], [0.5, 0.4]],
+        [[0.3, 0.6], [0.7, 0.2], [0.4, 0.5]]
+    ])
+    weights = np.array([0.4, 0.35, 0.25])
+    types = np.array([1, -1, 1])
+
+    if_topsis = ifTOPSIS()
+    if_topsis(matrix, weights, types)
+    assert all(if_topsis.top_k(2) == np.argsort(if_topsis.rank())[:2])
+
+    if_vikor = ifVIKOR()
+    if_vikor(matrix, weights, types)
+    for ranking, selected in zip(if_vikor.rank(), if_vikor.top_k(2)):
+        assert all(ranking[selected] <= np.sort(ranking)[1])
+
+
+def test_evaluate():
+    """
+        Test veryfing that evaluate gives the same results as the method call without modifying the method object
+    """
+    np.random.seed(0)
+    u = np.random.rand(30, 4)
+    v = np.random.rand(30, 4) * (1 - u)
+    matrix = np.dstack((u, v, 1 - u - v))
+    weights = np.array([0.3, 0.2, 0.25, 0.25])
+    types = np.array([1, -1, 1, -1])
+
+    methods = [ifARAS(), ifCODAS(), ifCOPRAS(), ifEDAS(), ifMABAC(), ifMAIRCA(), ifMARCOS(), ifMOORA(),
+               ifOCRA(), ifTOPSIS(), ifVIKOR(), ifWASPAS(), ifWPM(), ifWSM()]
+    for method in methods:
+        result = method.evaluate(matrix, weights, types)
+        assert not hasattr(method, 'preferences')
+
+        method(matrix, weights, types)
+        assert np.allclose(result.preferences, method.preferences)
+        assert np.array_equal(result.ranking, method.rank())
+        assert np.array_equal(result.top_k(3), method.top_k(3))
+
+    # shared method object evaluates different matrices in the threads
+    topsis = ifTOPSIS()
+    matrices = [matrix[i:i + 10] for i in range(20)]
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda m: topsis.evaluate(m, weights, types), matrices))
+    for m, result in zip(matrices, results):
+        assert np.allclose(result.preferences, ifTOPSIS()(m, weights, types))
+
+
+def test_explain():
+    """
+        Test veryfing that intermediate arrays are included in the result only if requested
+    """
+    np.random.seed(0)
+    u = np.random.rand(30, 4)
+    v = np.random.rand(30, 4) * (1 - u)
+    matrix = np.dstack((u, v, 1 - u - v))
+    weights = np.array([0.3, 0.2, 0.25, 0.25])
+    types = np.array([1, -1, 1, -1])
+
+    assert len(ifTOPSIS().evaluate(matrix, weights, types).intermediates) == 0
+
+    result = ifTOPSIS().evaluate(matrix, weights, types, explain=True)
+    assert {'wmatrix', 'aplus', 'aminus', 'dplus', 'dminus'} <= set(result.intermediates)
+    assert np.allclose(result.intermediates['aplus'][0], result.intermediates['wmatrix'][np.argmax(matrix[:, 0, 0]), 0])
+
+    result = ifMABAC().evaluate(matrix, weights, types, explain=['DM'])
+    assert list(result.intermediates) == ['DM']
+    assert np.allclose(np.sum(result.intermediates['DM'], axis=1), result.preferences)
+
+    # relative assessment matrix is calculated only if given by name
+    assert 'RA' not in ifCODAS().evaluate(matrix, weights, types, explain=True).intermediates
+    result = ifCODAS().evaluate(matrix, weights, types, explain=['RA', 'D1'])
+    assert result.intermediates['RA'].shape == (30, 30)
+    assert np.allclose(np.sum(result.intermediates['RA'], axis=1), result.preferences)
+
+    # buffers kept by the method object do not grow with the square of the number of alternatives
+    codas = ifCODAS()
+    codas(matrix, weights, types)
+    assert 'RA' not in codas.workspace
+    assert all(codas.workspace[name].size <= 3 * matrix.shape[0] * matrix.shape[1] for name in codas.workspace.names())
+
+    with pytest.raises(ValueError):
+        ifTOPSIS().evaluate(matrix, weights, types, explain=['RA'])
@@ -0,0 +1,69 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyifdm import metrics
+from pyifdm.methods import ifTOPSIS, ifWSM
+
+matrix = np.array([
+    [[0.4, 0.5], [0.6, 0.3], [0.2, 0.7]],
+    [[0.7, 0.2], [0.3, 0.6], [0.5, 0.4]],
+    [[0.5, 0.3], [0.8, 0.1], [0.6, 0.3]],
+    [[0.3, 0.6], [0.4, 0.4], [0.7, 0.2]]
+])
+weights = np.array([0.3, 0.3, 0.4])
+types = np.array([1, -1, 1])
+
+
+@pytest.fixture
+def enabled_metrics():
+    metrics.REGISTRY.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.REGISTRY.reset()
+
+
+def test_metrics(enabled_metrics):
+    """
+        Test veryfing that methods report evaluations, sizes, latencies, workspace reuse and validation failures
+    """
+    topsis = ifTOPSIS()
+    topsis(matrix, weights, types)
+    topsis(matrix, weights, types)
+    ifWSM()(matrix, weights, types)
+    with pytest.raises(ValueError):
+        topsis(matrix, weights[:2], types)
+
+    snapshot = metrics.snapshot()
+    assert snapshot['pyifdm_evaluations_total'] == {('TOPSIS', ): 2, ('WSM', ): 1}
+    assert snapshot['pyifdm_validation_failures_total'] == {('TOPSIS', ): 1}
+    assert snapshot['pyifdm_evaluation_seconds'][('TOPSIS', )]['count'] == 2
+    assert snapshot['pyifdm_matrix_alternatives'][('TOPSIS', )]['buckets'][10] == 2
+    assert snapshot['pyifdm_matrix_criteria'][('WSM', )]['sum'] == 3
+    assert snapshot['pyifdm_workspace_hits_total'][()] > 0
+    assert snapshot['pyifdm_workspace_misses_total'][()] > 0
+
+
+def test_prometheus(enabled_metrics):
+    """
+        Test veryfing that metrics are exported in the Prometheus text format
+    """
+    ifTOPSIS()(matrix, weights, types)
+    text = metrics.to_prometheus()
+
+    assert '# TYPE pyifdm_evaluations_total counter' in text
+    assert 'pyifdm_evaluations_total{method="TOPSIS"} 1' in text
+    assert '# TYPE pyifdm_evaluation_seconds histogram' in text
+    assert 'pyifdm_matrix_alternatives_bucket{method="TOPSIS",le="10.0"} 1' in text
+    assert 'pyifdm_matrix_alternatives_bucket{method="TOPSIS",le="+Inf"} 1' in text
+    assert 'pyifdm_matrix_alternatives_count{method="TOPSIS"} 1' in text
+
+
+def test_disabled_metrics():
+    """
+        Test veryfing that methods do not report metrics if disabled
+    """
+    metrics.REGISTRY.reset()
+    ifTOPSIS()(matrix, weights, types)
+    assert metrics.snapshot()['pyifdm_evaluations_total'] == {}
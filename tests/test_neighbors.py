@@ -0,0 +1,80 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+import pytest
+from pyifdm.neighbors import *
+from pyifdm.methods.ifs.distance import hamming_distance, luo_distance, normalized_euclidean_distance
+
+
+def _profiles(m, n, seed):
+    np.random.seed(seed)
+    u = np.random.rand(m, n)
+    v = np.random.rand(m, n) * (1 - u)
+    return np.dstack((u, v, 1 - u - v))
+
+
+def test_query():
+    """
+        Test veryfing that the nearest profiles found with the tree equal to the profiles found by comparing the query with all profiles
+    """
+    profiles, queries = _profiles(2000, 4, 0), _profiles(15, 4, 1)
+
+    for distance in METRIC_DISTANCES:
+        index = NeighborsIndex(profiles, distance, leaf_size=16)
+        brute = NeighborsIndex(profiles, distance, method='brute', block_size=500)
+        reference = np.array([[np.sum(distance(query, profile)) for profile in profiles] for query in queries])
+
+        d, i = index.query(queries, k=5)
+        assert d.shape == (15, 5)
+        assert np.allclose(d, np.sort(reference, axis=1)[:, :5])
+        assert np.all(i == np.argsort(reference, axis=1, kind='stable')[:, :5])
+        assert np.allclose(brute.query(queries, k=5)[0], d)
+        assert np.all(brute.query(queries, k=5)[1] == i)
+
+        d, i = index.query(queries[0], k=3)
+        assert d.shape == (3, ) and np.all(i == np.argsort(reference[0], kind='stable')[:3])
+
+
+def test_query_radius():
+    """
+        Test veryfing that the profiles found within the radius equal to the profiles of smaller distance
+    """
+    profiles, queries = _profiles(1500, 3, 2), _profiles(10, 3, 3)
+    index = NeighborsIndex(profiles, hamming_distance, leaf_size=8)
+    brute = NeighborsIndex(profiles, hamming_distance, method='brute', block_size=100)
+    reference = np.array([[np.sum(hamming_distance(query, profile)) for profile in profiles] for query in queries])
+
+    for result in [index.query_radius(queries, 0.5), brute.query_radius(queries, 0.5)]:
+        for d, i, ref in zip(*result, reference):
+            assert np.all(np.sort(i) == np.flatnonzero(ref <= 0.5))
+            assert np.allclose(d, ref[i]) and np.all(np.diff(d) >= 0)
+
+
+def test_unsupported_distances():
+    """
+        Test veryfing that distances which are not metrics are supported only by the brute-force search
+    """
+    profiles = _profiles(100, 3, 4)
+    for distance in [luo_distance, normalized_euclidean_distance]:
+        with pytest.raises(ValueError):
+            NeighborsIndex(profiles, distance)
+        reference = np.array([[np.sum(distance(query, profile)) for profile in profiles] for query in profiles[:5]])
+        d, i = NeighborsIndex(profiles, distance, method='brute').query(profiles[:5], k=2)
+        assert np.allclose(d, np.sort(reference, axis=1)[:, :2])
+
+
+def test_save_load(tmp_path):
+    """
+        Test veryfing that the loaded index gives the same results as the saved one
+    """
+    profiles, queries = _profiles(500, 3, 5), _profiles(5, 3, 6)
+    for method in ['vptree', 'brute']:
+        index = NeighborsIndex(profiles, hamming_distance, method=method, leaf_size=8)
+        index.save(tmp_path / f'{method}.npz')
+        loaded = NeighborsIndex.load(tmp_path / f'{method}.npz')
+
+        assert loaded.method == method and loaded.distance is hamming_distance
+        assert np.all(loaded.query(queries, k=4)[1] == index.query(queries, k=4)[1])
+
+    with pytest.raises(ValueError):
+        NeighborsIndex(profiles, lambda a, b: np.abs(a - b)[..., 0], method='brute').save(tmp_path / 'custom.npz')
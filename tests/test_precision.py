@@ -0,0 +1,78 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+from pyifdm.methods import *
+from pyifdm.methods.ifs.distance import *
+from pyifdm.methods.ifs.normalization import *
+from pyifdm.methods.ifs.score import *
+from pyifdm.methods.ifs.similarity import *
+from pyifdm.precision import *
+
+
+# reference problem from the Intuitionistic Fuzzy TOPSIS test
+matrix = np.array([
+    [[0.84, 0.13, 0.03], [0.64, 0.23, 0.13], [0.79, 0.1, 0.11], [0.23, 0.68, 0.09], [0.31, 0.58, 0.11]],
+    [[0.57, 0.32, 0.11], [0.21, 0.67, 0.12], [0.63, 0.29, 0.08], [0.58, 0.29, 0.13], [0.18, 0.77, 0.05]],
+    [[0.21, 0.73, 0.06], [0.38, 0.57, 0.05], [0.71, 0.18, 0.11], [0.81, 0.1, 0.09], [0.46, 0.49, 0.05]],
+    [[0.42, 0.49, 0.09], [0.54, 0.37, 0.09], [0.61, 0.36, 0.03], [0.43, 0.41, 0.16], [0.25, 0.58, 0.17]]
+])
+ifs_weights = np.array([[0.5, 0.45], [0.85, 0.1], [0.75, 0.1], [0.5, 0.45], [0.75, 0.1]])
+crisp_weights = np.array([0.15, 0.25, 0.2, 0.15, 0.25])
+types = np.array([-1, -1, 1, 1, -1])
+
+methods = [ifARAS(), ifCODAS(), ifCOPRAS(), ifEDAS(), ifMABAC(), ifMAIRCA(), ifMARCOS(), ifMOORA(),
+           ifOCRA(), ifTOPSIS(), ifVIKOR(), ifWASPAS(), ifWPM(), ifWSM()]
+
+
+def test_precision():
+    """
+        Test veryfing that the calculation type is set in the context and restored after it
+    """
+    assert get_dtype() == np.float64
+    with precision(np.float32):
+        assert get_dtype() == np.float32
+        assert as_float(matrix).dtype == np.float32
+    assert get_dtype() == np.float64
+
+    try:
+        set_dtype(np.float16)
+        assert False
+    except ValueError:
+        pass
+
+
+def test_float32_methods():
+    """
+        Test veryfing that methods calculated in float32 keep the type and give the rankings of float64 calculations
+    """
+    for weights in [crisp_weights, ifs_weights]:
+        for method in methods:
+            reference = method(matrix, weights, types)
+            reference_rank = method.rank()
+
+            with precision(np.float32):
+                preferences = method(matrix, weights, types)
+
+            for pref, ref in zip(np.atleast_2d(preferences), np.atleast_2d(reference)):
+                assert pref.dtype == np.float32
+                assert np.allclose(pref, ref, atol=1e-4)
+            assert (method.rank() == reference_rank).all()
+
+
+def test_float32_functions():
+    """
+        Test veryfing that scores, distances, similarities and normalizations keep the float32 type
+    """
+    a = matrix.astype(np.float32)
+
+    with precision(np.float32):
+        for score in [chen_score_1, liu_wang_score, supriya_score, zhang_xu_score_2, thakur_score]:
+            assert score(a).dtype == np.float32
+        for normalization in [ecer_normalization, minmax_normalization, supriya_normalization, swap_normalization]:
+            assert normalization(a, types).dtype == np.float32
+        for distance in [euclidean_distance, hamming_distance, luo_distance, normalized_euclidean_distance]:
+            assert distance(a[0, 0], a[1, 1]).dtype == np.float32
+        for similarity in [chen_similarity, fan_zhang_similarity, hong_kim_similarity, li_similarity, li_xu_similarity, ye_similarity]:
+            assert similarity(a[0, 0], a[1, 1]).dtype == np.float32
+            assert similarity(a[0], a[1]).dtype == np.float32
+            assert similarity(a, a).dtype == np.float32
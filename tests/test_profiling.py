@@ -0,0 +1,92 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import json
+import tracemalloc
+import numpy as np
+import pyifdm
+from pyifdm.methods import ifMOORA, ifTOPSIS
+from pyifdm.profiling import stage
+
+matrix = np.array([
+    [[0.4, 0.5], [0.6, 0.3], [0.2, 0.7]],
+    [[0.7, 0.2], [0.3, 0.6], [0.5, 0.4]],
+    [[0.5, 0.3], [0.8, 0.1], [0.6, 0.3]],
+    [[0.3, 0.6], [0.4, 0.4], [0.7, 0.2]]
+])
+weights = np.array([0.3, 0.3, 0.4])
+types = np.array([1, -1, 1])
+
+
+def test_profile():
+    """
+        Test veryfing that stages of the methods are recorded within the profiling context
+    """
+    with pyifdm.profile() as prof:
+        ifTOPSIS()(matrix, weights, types)
+        ifTOPSIS()(matrix, weights, types)
+        ifMOORA()(matrix, weights, types)
+
+    summary = prof.to_dict()
+    assert set(summary) == {'TOPSIS', 'MOORA'}
+    assert set(summary['TOPSIS']) == {'normalization', 'weighting', 'ideal', 'distance', 'aggregation'}
+    assert all(s['calls'] == 2 and s['time'] >= 0 and s['bytes'] >= 0 for s in summary['TOPSIS'].values())
+    assert summary['MOORA']['score']['calls'] == 1
+
+    # stages are not recorded outside of the context
+    ifTOPSIS()(matrix, weights, types)
+    assert sum(s['calls'] for s in prof.to_dict()['TOPSIS'].values()) == 10
+
+
+def test_stage_memory():
+    """
+        Test veryfing that the stages record their peak memory and do not reset the peak of already started tracing
+    """
+    with pyifdm.profile() as prof:
+        with stage('TEST', 'allocation'):
+            np.ones(10**6)
+    assert prof.events[0]['bytes'] >= 8 * 10**6
+
+    tracemalloc.start()
+    try:
+        np.ones(8 * 10**6)
+        with pyifdm.profile() as prof:
+            with stage('TEST', 'allocation'):
+                np.ones(10**6)
+            with stage('TEST', 'allocation'):
+                np.ones(16 * 10**6)
+        assert tracemalloc.get_traced_memory()[1] >= 128 * 10**6
+        assert prof.events[1]['bytes'] >= 128 * 10**6
+
+        tracemalloc.clear_traces()
+        np.ones(8 * 10**6)
+        with pyifdm.profile() as prof:
+            with stage('TEST', 'allocation'):
+                np.ones(10**6)
+        assert tracemalloc.get_traced_memory()[1] >= 64 * 10**6
+    finally:
+        tracemalloc.stop()
+
+
+def test_chrome_trace(tmp_path):
+    """
+        Test veryfing that recorded stages are exported in the Chrome trace format
+    """
+    with pyifdm.profile(memory=False) as prof:
+        ifTOPSIS()(matrix, weights, types)
+
+    path = tmp_path / 'trace.json'
+    prof.save_chrome_trace(str(path))
+    with open(path) as f:
+        trace = json.load(f)
+
+    events = trace['traceEvents']
+    assert [e['name'] for e in events] == ['normalization', 'weighting', 'ideal', 'distance', 'aggregation']
+    assert all(e['ph'] == 'X' and e['cat'] == 'TOPSIS' and e['args']['bytes'] == 0 for e in events)
+    assert all(a['ts'] + a['dur'] <= b['ts'] for a, b in zip(events, events[1:]))
+
+
+def test_disabled_profile():
+    """
+        Test veryfing that the shared empty context is used when profiling is disabled
+    """
+    assert stage('TOPSIS', 'distance') is stage('MOORA', 'score')
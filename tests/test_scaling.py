@@ -0,0 +1,41 @@
+# Copyright (c) 2023 Jakub Więckowski
+
+import numpy as np
+from pyifdm.bench.scaling import check_budget, fit_exponent, scaling_report
+
+
+def test_fit_exponent():
+    """
+        Test veryfing that growth exponent is recovered from times following the power law
+    """
+    sizes = np.array([100, 200, 400, 800])
+
+    assert np.isclose(fit_exponent(sizes, 3e-6 * sizes), 1)
+    assert np.isclose(fit_exponent(sizes, 2e-9 * sizes ** 2), 2)
+
+
+def test_check_budget():
+    """
+        Test veryfing that methods with growth exponents greater than budget are selected
+    """
+    report = {
+        'ifCODAS': {'m_exponent': 2.0, 'n_exponent': 1.0},
+        'ifTOPSIS': {'m_exponent': 1.1, 'n_exponent': 0.9}
+    }
+
+    assert check_budget(report, 1.5) == [('ifCODAS', 'm', 2.0, 1.5)]
+    assert check_budget(report, 1.5, {'ifCODAS': 2.2}) == []
+    assert check_budget(report, 1.5, {'ifCODAS': {'m': 2.2}}) == []
+    assert check_budget(report, 1.0, {'ifCODAS': {'m': 2.2}}) == [('ifTOPSIS', 'm', 1.1, 1.0)]
+
+
+def test_scaling_report():
+    """
+        Test veryfing that report contains exponents and times of both sweeps
+    """
+    report = scaling_report(['ifTOPSIS', 'ifWSM'], m_sizes=(10, 20, 40), n_sizes=(2, 4), m_fixed=10, n_fixed=3, repeat=1)
+
+    assert list(report) == ['ifTOPSIS', 'ifWSM']
+    assert len(report['ifTOPSIS']['m_times']) == 3
+    assert len(report['ifTOPSIS']['n_times']) == 2
+    assert np.isfinite(report['ifWSM']['m_exponent'])
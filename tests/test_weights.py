@@ -1,6 +1,7 @@
 # Copyright (c) 2022 Jakub Więckowski
 
 import numpy as np
+import pytest
 from pyifdm.weights import *
 from pyifdm.methods import ifCOPRAS
 
@@ -117,3 +118,57 @@ def test_ye_entropy_weights():
 
     assert all(np.round(calculated_weights, 4) == reference_results)
 
+
+def test_batch_weights():
+    """
+        Test veryfing that weights calculated for the batch of matrices equal to the weights of each matrix
+    """
+    np.random.seed(0)
+    u = np.random.rand(6, 10, 4)
+    v = np.random.rand(6, 10, 4) * (1 - u)
+    batch = np.stack((u, v, 1 - u - v), axis=-1)
+
+    for method in [burillo_entropy_weights, equal_weights, entropy_weights, liu_entropy_weights,
+                   szmidt_entropy_weights, thakur_entropy_weights, ye_entropy_weights]:
+        calculated_weights = method(batch)
+        reference_weights = np.array([method(matrix) for matrix in batch])
+
+        assert calculated_weights.shape == (6, 4)
+        assert np.allclose(calculated_weights, reference_weights)
+
+
+def test_entropy_accumulators():
+    """
+        Test veryfing that weights accumulated from the chunks, updated and merged in any order, equal to the weights of the whole matrix
+    """
+    np.random.seed(1)
+    u = np.random.rand(3, 103, 5)
+    v = np.random.rand(3, 103, 5) * (1 - u)
+    batch = np.stack((u, v, 1 - u - v), axis=-1)
+    matrix = batch[0]
+
+    for accumulator, method in [(BurilloEntropyAccumulator, burillo_entropy_weights), (EntropyAccumulator, entropy_weights),
+                                (LiuEntropyAccumulator, liu_entropy_weights), (ThakurEntropyAccumulator, thakur_entropy_weights),
+                                (YeEntropyAccumulator, ye_entropy_weights)]:
+        streamed = accumulator()
+        for start in range(0, 103, 10):
+            streamed.update(matrix[start:start + 10])
+        assert np.allclose(streamed.weights(), method(matrix))
+
+        # tree reduction of the shards
+        shards = [accumulator().update(chunk) for chunk in np.array_split(matrix, 7)]
+        while len(shards) > 1:
+            shards = [shards[i].merge(shards[i + 1]) if i + 1 < len(shards) else shards[i] for i in range(0, len(shards), 2)]
+        assert shards[0].count == 103
+        assert np.allclose(shards[0].weights(), method(matrix))
+
+        batched = accumulator().update(batch[:, :50]).merge(accumulator().update(batch[:, 50:]))
+        assert np.allclose(batched.weights(), method(batch))
+
+        with pytest.raises(ValueError):
+            accumulator().weights()
+        with pytest.raises(ValueError):
+            accumulator().update(matrix).update(matrix[:, :3])
+
+    with pytest.raises(ValueError):
+        BurilloEntropyAccumulator().merge(YeEntropyAccumulator())